@@ -10,7 +10,7 @@ logger = get_logger(__name__)
 
 import sqlite3
 import os
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime
 from src.ports.feature_flag_repository import FeatureFlagRepositoryPort
 from src.domain.entities.feature_flag import FeatureFlag
@@ -116,6 +116,33 @@ class FeatureFlagRepositorySQLite(FeatureFlagRepositoryPort):
             logger.error(f"Erreur lors de la vérification du feature flag {flag_name}: {e}")
             return False
 
+    def is_enabled_many(self, flag_names: Iterable[str]) -> Dict[str, bool]:
+        """Vérifie l'état de plusieurs feature flags en un seul aller-retour SQL."""
+        names = list(dict.fromkeys(flag_names))
+        if not names:
+            return {}
+
+        # Les flags absents de la base sont considérés comme désactivés
+        states = dict.fromkeys(names, False)
+        try:
+            placeholders = ", ".join("?" * len(names))
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute(f"""
+                    SELECT flag_name, is_enabled
+                    FROM feature_flags
+                    WHERE flag_name IN ({placeholders})
+                """, names)
+
+                for flag_name, is_enabled in cursor.fetchall():
+                    states[flag_name] = bool(is_enabled)
+
+            logger.debug("Vérification groupée de %d feature flags", len(names))
+            return states
+
+        except Exception as e:
+            logger.error(f"Erreur lors de la vérification groupée des feature flags {names}: {e}")
+            return dict.fromkeys(names, False)
+
     def create(self, feature_flag: FeatureFlag) -> FeatureFlag:
         """Crée un nouveau feature flag."""
         try:
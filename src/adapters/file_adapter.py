@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import logging
+from collections import Counter
 
 from src.domain.entities.condo import Condo, CondoStatus, CondoType
 from src.ports.condo_repository import (
@@ -331,15 +332,15 @@ class FileAdapter(CondoRepositoryPort, FileHandlerPort):
         """Supprime un condo."""
         condos = await self._load_condos_from_file()
 
-        initial_count = len(condos)
-        condos = [condo for condo in condos if condo.unit_number != unit_number]
-
-        if len(condos) < initial_count:
-            await self._save_condos_to_file(condos)
-            self.logger.info(f"Condo {unit_number} supprimé")
-            return True
+        # Retrait en place du premier condo correspondant (numéro d'unité unique)
+        index = next((i for i, condo in enumerate(condos) if condo.unit_number == unit_number), None)
+        if index is None:
+            return False
 
-        return False
+        del condos[index]
+        await self._save_condos_to_file(condos)
+        self.logger.info(f"Condo {unit_number} supprimé")
+        return True
 
     async def get_condos_with_filters(self, filters: Dict[str, Any]) -> List[Condo]:
         """Récupère des condos selon des critères de filtrage."""
@@ -370,26 +371,18 @@ class FileAdapter(CondoRepositoryPort, FileHandlerPort):
         """Récupère des statistiques sur les condos."""
         condos = await self._load_condos_from_file()
 
-        stats = {
+        # Un seul parcours par critère, quel que soit le nombre de types et de statuts
+        type_counts = Counter(condo.condo_type for condo in condos)
+        status_counts = Counter(condo.status for condo in condos)
+
+        return {
             'total_condos': len(condos),
-            'by_type': {},
-            'by_status': {},
+            'by_type': {condo_type.value: type_counts[condo_type] for condo_type in CondoType},
+            'by_status': {status.value: status_counts[status] for status in CondoStatus},
             'total_square_feet': sum(condo.square_feet for condo in condos),
             'total_monthly_fees': sum(condo.calculate_monthly_fees() for condo in condos),
         }
 
-        # Statistiques par type
-        for condo_type in CondoType:
-            count = sum(1 for condo in condos if condo.condo_type == condo_type)
-            stats['by_type'][condo_type.value] = count
-
-        # Statistiques par statut
-        for status in CondoStatus:
-            count = sum(1 for condo in condos if condo.status == status)
-            stats['by_status'][status.value] = count
-
-        return stats
-
 # Exemple d'utilisation de l'adapter
 if __name__ == "__main__":
     async def demo_file_adapter():
@@ -16,12 +16,111 @@ import sqlite3
 import json
 import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, FrozenSet, NamedTuple, Optional, Tuple, Union
 from datetime import datetime
+from types import MappingProxyType
 import uuid
 
-from src.domain.entities.project import Project
+from src.domain.entities.project import Project, ProjectStatus
 from src.domain.entities.unit import Unit, UnitStatus, UnitType
+from src.adapters.sqlite_connection_pool import SQLiteConnectionPool
+
+# Étiquette de cache de la liste complète des projets
+ALL_PROJECTS_TAG = 'all_projects'
+
+
+class SaveResult(NamedTuple):
+    """Résultat d'une écriture : projet touché et étiquettes de cache à invalider."""
+    project_id: str
+    invalidation_tags: FrozenSet[str]
+    rowcount: int = 0
+
+    @classmethod
+    def for_project(cls, project_id: str, rowcount: int = 0) -> 'SaveResult':
+        """Construit le résultat d'une écriture limitée à un seul projet."""
+        return cls(project_id, frozenset((ALL_PROJECTS_TAG, project_id)), rowcount)
+
+
+# Requêtes à texte constant : le cache d'instructions préparées de chaque
+# connexion du pool les retrouve sans ré-analyse SQL
+_UPSERT_PROJECT_SQL = """
+    INSERT OR REPLACE INTO projects
+    (project_id, name, address, building_area, land_area, construction_year,
+     unit_count, constructor, creation_date, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SELECT_PROJECTS_SQL = """
+    SELECT project_id, name, address, building_area, land_area, construction_year,
+           unit_count, constructor, creation_date, status
+    FROM projects
+"""
+
+_DELETE_PROJECT_UNITS_SQL = "DELETE FROM units WHERE project_id = ?"
+
+_DELETE_PROJECT_SQL = "DELETE FROM projects WHERE project_id = ?"
+
+_SELECT_PROJECT_DELETE_INFO_SQL = """
+    SELECT name, (SELECT COUNT(*) FROM units WHERE project_id = ?)
+    FROM projects
+    WHERE project_id = ?
+"""
+
+_INSERT_UNIT_SQL = """
+    INSERT INTO units
+    (unit_number, project_id, area, condo_type, status,
+     owner_name, calculated_monthly_fees)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SELECT_PROJECT_UNITS_SQL = """
+    SELECT id, unit_number, area, condo_type, status,
+           owner_name, calculated_monthly_fees
+    FROM units
+    WHERE project_id = ?
+    ORDER BY
+        CASE
+            WHEN unit_number IS NULL OR unit_number = '' THEN 1
+            ELSE 0
+        END,
+        unit_number NULLS LAST
+"""
+
+# Une unité est occupée lorsqu'elle a un propriétaire autre que "Disponible"
+_COUNT_UNITS_BY_STATUS_SQL = """
+    SELECT status, condo_type,
+           owner_name IS NOT NULL AND owner_name NOT IN ('', 'Disponible') AS occupied,
+           COUNT(*), COALESCE(SUM(estimated_price), 0)
+    FROM units
+    WHERE project_id = ?
+    GROUP BY status, condo_type, occupied
+"""
+
+# Totaux de toutes les unités par statut et type (frais stockés sous forme de texte)
+_SUM_UNITS_BY_TYPE_SQL = """
+    SELECT status, condo_type, COUNT(*),
+           COALESCE(SUM(CAST(calculated_monthly_fees AS REAL)), 0)
+    FROM units
+    GROUP BY status, condo_type
+"""
+
+_TRANSFER_UNIT_SQL = """
+    UPDATE units
+    SET owner_name = ?, status = ?
+    WHERE project_id = ? AND unit_number = ?
+"""
+
+# Correspondance (immuable) entre les champs reçus par update_unit et les colonnes de la table units
+_UNIT_FIELD_COLUMNS = MappingProxyType({
+    'unit_number': 'unit_number',
+    'owner_name': 'owner_name',
+    'square_feet': 'area',
+    'area': 'area',
+    'monthly_fees': 'calculated_monthly_fees',
+    'condo_type': 'condo_type',
+    'unit_type': 'condo_type',
+    'status': 'status'
+})
 
 class ProjectRepositorySQLite:
     """
@@ -47,9 +146,10 @@ class ProjectRepositorySQLite:
         """
         self.db_path = db_path or self._get_database_path()
         self._ensure_database_exists()
+        self._pool = SQLiteConnectionPool.shared(self.db_path)
+        self._open_connections()
 
         logger.info(f"ProjectRepositorySQLite initialisé avec DB: {self.db_path}")
-        logger.info(f"Chargé {len(self.get_all_projects())} projets depuis la base de données")
 
     def _get_database_path(self) -> str:
         """Récupère le chemin de la base de données depuis la configuration."""
@@ -72,7 +172,20 @@ class ProjectRepositorySQLite:
         if db_dir and not os.path.exists(db_dir):
             os.makedirs(db_dir, exist_ok=True)
 
-    def save_project(self, project: Project) -> str:
+    def _open_connections(self):
+        """
+        Ouvre la connexion d'écriture du pool partagé.
+
+        Active le mode WAL dès la construction, avant la première lecture
+        en lecture seule.
+        """
+        try:
+            with self._pool.writer():
+                pass
+        except sqlite3.Error as e:
+            logger.warning("Impossible d'ouvrir la base %s en écriture: %s", self.db_path, e)
+
+    def save_project(self, project: Project) -> SaveResult:
         """
         Sauvegarde un projet et ses unités dans la base de données.
 
@@ -80,21 +193,18 @@ class ProjectRepositorySQLite:
             project: Instance du projet à sauvegarder
 
         Returns:
-            str: ID du projet sauvegardé
+            SaveResult: ID du projet sauvegardé et étiquettes de cache touchées.
+            L'instance passée est complétée en place (project_id attribué au
+            besoin) : l'appelant n'a pas à la recharger.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.writer() as conn:
                 # Générer un project_id s'il n'existe pas
                 if not hasattr(project, 'project_id') or not project.project_id:
                     project.project_id = str(uuid.uuid4())
 
                 # Insérer ou mettre à jour le projet
-                conn.execute("""
-                    INSERT OR REPLACE INTO projects
-                    (project_id, name, address, building_area, land_area, construction_year,
-                     unit_count, constructor, creation_date, status)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+                conn.execute(_UPSERT_PROJECT_SQL, (
                     project.project_id,
                     project.name,
                     project.address,
@@ -108,23 +218,25 @@ class ProjectRepositorySQLite:
                 ))
 
                 # Supprimer les anciennes unités
-                conn.execute("DELETE FROM units WHERE project_id = ?", (project.project_id,))
+                conn.execute(_DELETE_PROJECT_UNITS_SQL, (project.project_id,))
 
-                # Insérer les nouvelles unités
+                # Insérer les nouvelles unités avec une seule instruction préparée
                 if project.units:
-                    for unit in project.units:
-                        self._save_unit(conn, unit, project.project_id)
+                    conn.executemany(
+                        _INSERT_UNIT_SQL,
+                        [self._unit_row(unit, project.project_id) for unit in project.units]
+                    )
 
                 conn.commit()
                 logger.info(f"Projet sauvegardé: {project.name} avec {len(project.units)} unités")
-                return project.project_id
+                return SaveResult.for_project(project.project_id, len(project.units))
 
         except Exception as e:
             logger.error(f"Erreur lors de la sauvegarde du projet {project.name}: {e}")
             raise
 
-    def _save_unit(self, conn: sqlite3.Connection, unit, project_id: str):
-        """Sauvegarde une unité dans la base de données."""
+    def _unit_row(self, unit, project_id: str) -> tuple:
+        """Construit les paramètres d'insertion d'une unité (voir _INSERT_UNIT_SQL)."""
         # Gérer les différents formats d'unités (dict, objet Unit, ou objet Condo)
         if isinstance(unit, dict):
             unit_number = unit.get('unit_number', '')
@@ -161,12 +273,7 @@ class ProjectRepositorySQLite:
             owner_name = getattr(unit, 'owner_name', 'Disponible')
             monthly_fees = getattr(unit, 'calculated_monthly_fees', None)
 
-        conn.execute("""
-            INSERT INTO units
-            (unit_number, project_id, area, condo_type, status,
-             owner_name, calculated_monthly_fees)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
+        return (
             unit_number,
             project_id,
             area,
@@ -174,7 +281,7 @@ class ProjectRepositorySQLite:
             status,
             owner_name,
             str(monthly_fees) if monthly_fees else None
-        ))
+        )
 
     def get_all_projects(self) -> List[Project]:
         """
@@ -184,108 +291,12 @@ class ProjectRepositorySQLite:
             List[Project]: Liste de tous les projets
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.reader() as conn:
                 conn.row_factory = sqlite3.Row
 
                 # Récupérer tous les projets
-                cursor = conn.execute("""
-                    SELECT project_id, name, address, building_area, land_area, construction_year,
-                           unit_count, constructor, creation_date, status
-                    FROM projects
-                    ORDER BY creation_date DESC
-                """)
-
-                projects = []
-                for row in cursor.fetchall():
-                    # Créer l'objet projet
-                    project = Project(
-                        name=row['name'],
-                        address=row['address'],
-                        building_area=row['building_area'],
-                        construction_year=row['construction_year'],
-                        unit_count=row['unit_count'],
-                        constructor=row['constructor'],
-                        creation_date=datetime.fromisoformat(row['creation_date'])
-                    )
-
-                    # Ajouter le project_id
-                    project.project_id = row['project_id']
-
-                    # Restaurer le statut depuis la base de données
-                    from src.domain.entities.project import ProjectStatus
-                    if row['status']:
-                        try:
-                            project.status = ProjectStatus(row['status'])
-                        except ValueError:
-                            # Si le statut en DB n'est pas valide, utiliser PLANNING par défaut
-                            project.status = ProjectStatus.PLANNING
-
-                    # Restaurer land_area si présent
-                    if row['land_area'] is not None:
-                        project.land_area = row['land_area']
-
-                    # Récupérer les unités du projet
-                    unit_cursor = conn.execute("""
-                        SELECT id, unit_number, area, condo_type, status,
-                               owner_name, calculated_monthly_fees
-                        FROM units
-                        WHERE project_id = ?
-                        ORDER BY
-                            CASE
-                                WHEN unit_number IS NULL OR unit_number = '' THEN 1
-                                ELSE 0
-                            END,
-                            unit_number NULLS LAST
-                    """, (row['project_id'],))
-
-                    units = []
-                    for unit_row in unit_cursor.fetchall():
-                        # Créer les unités comme objets Unit appropriés
-                        from src.domain.entities.unit import Unit, UnitType, UnitStatus
-
-                        # Conversion du type et statut depuis les valeurs string de la DB
-                        try:
-                            unit_type = UnitType(unit_row['condo_type'])
-                        except (ValueError, KeyError):
-                            unit_type = UnitType.RESIDENTIAL  # Valeur par défaut
-
-                        # Mapping des anciens CondoStatus vers UnitStatus
-                        try:
-                            old_status = unit_row['status']
-                            if old_status == 'active':
-                                status = UnitStatus.AVAILABLE
-                            elif old_status == 'inactive':
-                                status = UnitStatus.INACTIVE  # CORRECTION: inactive reste inactive !
-                            elif old_status == 'available':
-                                status = UnitStatus.AVAILABLE
-                            elif old_status == 'reserved':
-                                status = UnitStatus.RESERVED
-                            elif old_status == 'sold':
-                                status = UnitStatus.AVAILABLE  # Les anciens "sold" deviennent disponibles
-                            elif old_status == 'maintenance':
-                                status = UnitStatus.MAINTENANCE
-                            else:
-                                # Essayer conversion directe si nouvelles valeurs
-                                status = UnitStatus(old_status)
-                        except (ValueError, KeyError):
-                            status = UnitStatus.AVAILABLE  # Valeur par défaut
-
-                        unit = Unit(
-                            unit_number=unit_row['unit_number'],
-                            area=float(unit_row['area'] or 0),  # Protection contre None
-                            unit_type=unit_type,
-                            status=status,
-                            owner_name=unit_row['owner_name'] or "Disponible",
-                            estimated_price=float(unit_row['price'] if 'price' in unit_row.keys() and unit_row['price'] is not None else 0),  # Protection contre None
-                            project_id=row['project_id'],          # Ajouter l'ID du projet
-                            id=unit_row['id'],  # Utiliser l'attribut id directement
-                            calculated_monthly_fees=unit_row['calculated_monthly_fees']  # AJOUT: Récupérer les frais stockés
-                        )
-                        units.append(unit)
-
-                    logger.debug(f"Récupéré {len(units)} unités pour le projet {row['name']}")
-                    project.units = units
-                    projects.append(project)
+                cursor = conn.execute(_SELECT_PROJECTS_SQL + " ORDER BY creation_date DESC")
+                projects = [self._project_from_row(conn, row) for row in cursor.fetchall()]
 
                 logger.info(f"Chargé {len(projects)} projets depuis la base de données")
                 return projects
@@ -294,6 +305,136 @@ class ProjectRepositorySQLite:
             logger.error(f"Erreur lors de la récupération des projets: {e}")
             return []
 
+    def _project_from_row(self, conn: sqlite3.Connection, row: sqlite3.Row) -> Project:
+        """Construit un Project et ses unités à partir d'une ligne de la table projects."""
+        # Créer l'objet projet
+        project = Project(
+            name=row['name'],
+            address=row['address'],
+            building_area=row['building_area'],
+            construction_year=row['construction_year'],
+            unit_count=row['unit_count'],
+            constructor=row['constructor'],
+            creation_date=datetime.fromisoformat(row['creation_date']),
+            project_id=row['project_id']  # Fourni d'emblée : aucun identifiant généré puis écrasé
+        )
+
+        # Restaurer le statut depuis la base de données
+        if row['status']:
+            try:
+                project.status = ProjectStatus(row['status'])
+            except ValueError:
+                # Si le statut en DB n'est pas valide, utiliser PLANNING par défaut
+                project.status = ProjectStatus.PLANNING
+
+        # Restaurer land_area si présent
+        if row['land_area'] is not None:
+            project.land_area = row['land_area']
+
+        # Récupérer les unités du projet
+        unit_cursor = conn.execute(_SELECT_PROJECT_UNITS_SQL, (row['project_id'],))
+
+        units = []
+        for unit_row in unit_cursor.fetchall():
+            # Conversion du type et statut depuis les valeurs string de la DB
+            unit_type = self._unit_type_from_db(unit_row['condo_type'])
+            status = self._unit_status_from_db(unit_row['status'])
+
+            # Lignes validées à l'écriture : pas de revalidation par unité
+            unit = Unit._from_trusted_row(
+                unit_number=unit_row['unit_number'],
+                area=float(unit_row['area'] or 0),  # Protection contre None
+                unit_type=unit_type,
+                status=status,
+                owner_name=unit_row['owner_name'] or "Disponible",
+                estimated_price=float(unit_row['price'] if 'price' in unit_row.keys() and unit_row['price'] is not None else 0),  # Protection contre None
+                project_id=row['project_id'],          # Ajouter l'ID du projet
+                id=unit_row['id'],  # Utiliser l'attribut id directement
+                calculated_monthly_fees=unit_row['calculated_monthly_fees']  # AJOUT: Récupérer les frais stockés
+            )
+            units.append(unit)
+
+        logger.debug("Récupéré %s unités pour le projet %s", len(units), row['name'])
+        project.units = units
+        return project
+
+    @staticmethod
+    def _unit_type_from_db(value: Optional[str]) -> UnitType:
+        """Convertit un type d'unité stocké en UnitType (résidentiel par défaut)."""
+        try:
+            return UnitType(value)
+        except ValueError:
+            return UnitType.RESIDENTIAL  # Valeur par défaut
+
+    @staticmethod
+    def _unit_status_from_db(value: Optional[str]) -> UnitStatus:
+        """Convertit un statut stocké (y compris les anciens CondoStatus) en UnitStatus."""
+        if value in ('active', 'available', 'sold'):
+            # Les anciens "sold" deviennent disponibles
+            return UnitStatus.AVAILABLE
+        try:
+            # inactive, reserved, maintenance et nouvelles valeurs : conversion directe
+            return UnitStatus(value)
+        except ValueError:
+            return UnitStatus.AVAILABLE  # Valeur par défaut
+
+    def get_status_counts(self, project_id: str) -> List[Tuple[UnitStatus, str, bool, int, float]]:
+        """
+        Agrège les unités d'un projet par statut, type et occupation en une requête GROUP BY.
+
+        Le résultat alimente Project.compute_statistics() sans matérialiser les unités.
+
+        Args:
+            project_id: ID du projet
+
+        Returns:
+            List[tuple]: (statut, type, occupé, nombre d'unités, valeur estimée totale)
+        """
+        try:
+            with self._pool.reader() as conn:
+                cursor = conn.execute(_COUNT_UNITS_BY_STATUS_SQL, (project_id,))
+                return [
+                    (
+                        self._unit_status_from_db(status),
+                        self._unit_type_from_db(condo_type).value,
+                        bool(occupied),
+                        count,
+                        float(total_value)
+                    )
+                    for status, condo_type, occupied, count, total_value in cursor
+                ]
+
+        except Exception as e:
+            logger.error(f"Erreur lors de l'agrégation des unités du projet {project_id}: {e}")
+            raise
+
+    def get_unit_totals(self) -> List[Tuple[UnitStatus, str, int, float]]:
+        """
+        Agrège toutes les unités par statut et type en une requête GROUP BY.
+
+        Les rapports sur l'ensemble des unités lisent ces colonnes agrégées
+        au lieu de construire une entité par unité.
+
+        Returns:
+            List[tuple]: (statut, type, nombre d'unités, frais mensuels totaux)
+        """
+        try:
+            with self._pool.reader() as conn:
+                cursor = conn.execute(_SUM_UNITS_BY_TYPE_SQL)
+                return [
+                    (
+                        self._unit_status_from_db(status),
+                        self._unit_type_from_db(condo_type).value,
+                        count,
+                        float(total_fees)
+                    )
+                    for status, condo_type, count, total_fees in cursor
+                ]
+
+        except Exception as e:
+            logger.error(f"Erreur lors de l'agrégation des unités: {e}")
+            raise
+
     def get_project_by_id(self, project_id: str) -> Optional[Project]:
         """
         Récupère un projet par son ID.
@@ -305,11 +446,10 @@ class ProjectRepositorySQLite:
             Optional[Project]: Le projet trouvé ou None
         """
         try:
-            projects = self.get_all_projects()
-            for project in projects:
-                if hasattr(project, 'project_id') and project.project_id == project_id:
-                    return project
-            return None
+            with self._pool.reader() as conn:
+                conn.row_factory = sqlite3.Row
+                row = conn.execute(_SELECT_PROJECTS_SQL + " WHERE project_id = ?", (project_id,)).fetchone()
+                return self._project_from_row(conn, row) if row else None
         except Exception as e:
             logger.error(f"Erreur lors de la récupération du projet {project_id}: {e}")
             return None
@@ -325,7 +465,7 @@ class ProjectRepositorySQLite:
             Optional[tuple]: (unit, project) si trouvée, None sinon
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.reader() as conn:
                 conn.row_factory = sqlite3.Row
 
                 # Récupérer l'unité et le projet associé
@@ -413,39 +553,115 @@ class ProjectRepositorySQLite:
             bool: True si supprimé avec succès
         """
         try:
-            logger.info(f"Tentative de suppression du projet ID: {project_id}")
+            return self.delete_project_cascade(project_id)['deleted']
+        except Exception as e:
+            logger.error(f"Erreur lors de la suppression du projet {project_id}: {e}")
+            return False
 
-            with sqlite3.connect(self.db_path) as conn:
-                # Vérifier d'abord si le projet existe
-                cursor = conn.execute("SELECT project_id, name FROM projects WHERE project_id = ?", (project_id,))
-                existing_project = cursor.fetchone()
+    def delete_project_cascade(self, project_id: str) -> Dict[str, Any]:
+        """
+        Supprime un projet et ses unités en une seule transaction.
 
-                if not existing_project:
-                    logger.warning(f"Projet non trouvé en base de données: {project_id}")
-                    return False
+        Le nom et le nombre d'unités sont lus dans la même transaction que la
+        suppression : l'appelant n'a pas à charger le projet au préalable.
+
+        Args:
+            project_id: ID du projet à supprimer
+
+        Returns:
+            Dict: {'deleted': bool, 'project_name': str ou None si introuvable, 'total_units': int}
+        """
+        logger.info(f"Tentative de suppression du projet ID: {project_id}")
+
+        with self._pool.writer() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            existing_project = conn.execute(_SELECT_PROJECT_DELETE_INFO_SQL, (project_id, project_id)).fetchone()
+
+            if not existing_project:
+                logger.warning(f"Projet non trouvé en base de données: {project_id}")
+                return {'deleted': False, 'project_name': None, 'total_units': 0}
+
+            project_name, total_units = existing_project
 
-                logger.info(f"Projet trouvé en base: {existing_project[1]} (ID: {existing_project[0]})")
+            # Supprimer les unités d'abord (FK cascade)
+            conn.execute(_DELETE_PROJECT_UNITS_SQL, (project_id,))
+            deleted = conn.execute(_DELETE_PROJECT_SQL, (project_id,)).rowcount > 0
 
-                # Supprimer les unités d'abord (FK cascade)
-                units_cursor = conn.execute("DELETE FROM units WHERE project_id = ?", (project_id,))
-                units_deleted = units_cursor.rowcount
-                logger.info(f"Unités supprimées: {units_deleted}")
+        if deleted:
+            logger.info(f"Projet supprimé avec succès: {project_name} (ID: {project_id}, {total_units} unités)")
+        else:
+            logger.error(f"Échec de la suppression du projet: {project_id}")
+        return {'deleted': deleted, 'project_name': project_name, 'total_units': total_units}
+
+    def transfer_units_bulk(self, project_id: str, transfers: List[tuple]) -> SaveResult:
+        """
+        Applique un lot de transferts de propriété en une seule transaction.
 
-                # Supprimer le projet
-                project_cursor = conn.execute("DELETE FROM projects WHERE project_id = ?", (project_id,))
+        Args:
+            project_id: ID du projet contenant les unités
+            transfers: Liste de tuples (unit_number, new_owner, status)
+
+        Returns:
+            SaveResult: Nombre d'unités mises à jour (rowcount) et étiquettes de cache touchées
+        """
+        if not transfers:
+            return SaveResult(project_id, frozenset())
 
+        # updated_at est maintenu par le trigger update_units_timestamp
+        rows = [
+            (new_owner, status, project_id, unit_number)
+            for unit_number, new_owner, status in transfers
+        ]
+
+        try:
+            with self._pool.writer() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                cursor = conn.executemany(_TRANSFER_UNIT_SQL, rows)
                 conn.commit()
 
-                if project_cursor.rowcount > 0:
-                    logger.info(f"Projet supprimé avec succès: {project_id} ({units_deleted} unités)")
-                    return True
-                else:
-                    logger.error(f"Échec de la suppression du projet: {project_id}")
-                    return False
+                logger.info(f"Transferts groupés: {cursor.rowcount} unités mises à jour pour le projet {project_id}")
+                return SaveResult.for_project(project_id, cursor.rowcount)
 
         except Exception as e:
-            logger.error(f"Erreur lors de la suppression du projet {project_id}: {e}")
-            return False
+            logger.error(f"Erreur lors des transferts groupés pour le projet {project_id}: {e}")
+            raise
+
+    def get_projects_summary(self) -> List[Dict[str, Any]]:
+        """
+        Agrège le nombre d'unités par projet en une seule requête GROUP BY.
+
+        Une unité est occupée lorsqu'elle a un propriétaire autre que "Disponible",
+        comme dans Project.get_project_statistics().
+
+        Returns:
+            List[Dict]: project_id, name, total_units, occupied_units, available_units
+        """
+        try:
+            with self._pool.reader() as conn:
+                cursor = conn.execute("""
+                    SELECT p.project_id, p.name,
+                           COUNT(u.id) AS total_units,
+                           COALESCE(SUM(u.owner_name IS NOT NULL AND u.owner_name NOT IN ('', 'Disponible')), 0) AS occupied_units,
+                           COALESCE(SUM((u.owner_name IS NULL OR u.owner_name IN ('', 'Disponible')) AND u.status = 'available'), 0) AS available_units
+                    FROM projects p
+                    LEFT JOIN units u ON u.project_id = p.project_id
+                    GROUP BY p.project_id
+                    ORDER BY p.creation_date DESC
+                """)
+                return [
+                    {
+                        'project_id': row[0],
+                        'name': row[1],
+                        'total_units': row[2],
+                        'occupied_units': row[3],
+                        'available_units': row[4]
+                    }
+                    for row in cursor
+                ]
+
+        except Exception as e:
+            logger.error(f"Erreur lors de l'agrégation du résumé des projets: {e}")
+            raise
 
     def migrate_from_json(self, json_file_path: str) -> bool:
         """
@@ -488,7 +704,7 @@ class ProjectRepositorySQLite:
             logger.error(f"Erreur lors de la migration depuis {json_file_path}: {e}")
             return False
 
-    def update_unit(self, unit_id: int, unit_data: dict) -> bool:
+    def update_unit(self, unit_id: int, unit_data: dict) -> Union[SaveResult, bool]:
         """
         Met à jour une unité spécifique sans affecter les autres unités du projet.
 
@@ -497,27 +713,17 @@ class ProjectRepositorySQLite:
             unit_data: Dictionnaire avec les données à mettre à jour
 
         Returns:
-            bool: True si mise à jour réussie
+            SaveResult: Projet de l'unité et étiquettes de cache touchées ;
+            True si aucune donnée à modifier, False si l'unité est introuvable
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.writer() as conn:
                 # Construire la requête de mise à jour dynamiquement
                 set_clauses = []
                 values = []
 
                 # Mapper les champs de condo_data aux colonnes de la base
-                field_mapping = {
-                    'unit_number': 'unit_number',                    # AJOUT: Mapping pour le numéro d'unité
-                    'owner_name': 'owner_name',
-                    'square_feet': 'area',
-                    'area': 'area',
-                    'monthly_fees': 'calculated_monthly_fees',
-                    'condo_type': 'condo_type',
-                    'unit_type': 'condo_type',
-                    'status': 'status'
-                }
-
-                for field, db_column in field_mapping.items():
+                for field, db_column in _UNIT_FIELD_COLUMNS.items():
                     if field in unit_data:
                         set_clauses.append(f"{db_column} = ?")
                         values.append(unit_data[field])
@@ -538,9 +744,11 @@ class ProjectRepositorySQLite:
                     logger.error(f"Aucune unité trouvée avec l'ID {unit_id}")
                     return False
 
+                # Projet de l'unité, lu dans la même transaction pour cibler l'invalidation
+                project_id = conn.execute("SELECT project_id FROM units WHERE id = ?", (unit_id,)).fetchone()[0]
                 conn.commit()
                 logger.info(f"Unité {unit_id} mise à jour avec succès")
-                return True
+                return SaveResult.for_project(project_id, cursor.rowcount)
 
         except Exception as e:
             logger.error(f"Erreur lors de la mise à jour de l'unité {unit_id}: {e}")
@@ -0,0 +1,166 @@
+"""
+SQLiteConnectionPool - Pool de connexions SQLite partagé par fichier.
+
+Respecte la règle d'écrivain unique de SQLite :
+- Une seule connexion lecture/écriture, sérialisée par un verrou
+- Un nombre borné de connexions en lecture seule (mode=ro)
+
+Le pool est partagé par chemin de base de données afin que les services
+construits à chaque requête réutilisent les mêmes connexions.
+"""
+
+from src.infrastructure.logger_manager import get_logger
+logger = get_logger(__name__)
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+MEMORY_DB = ':memory:'
+
+# Taille du cache d'instructions préparées par connexion (défaut sqlite3 : 128)
+STATEMENT_CACHE_SIZE = 256
+
+
+class SQLiteConnectionPool:
+    """
+    Pool borné : un écrivain sérialisé et plusieurs lecteurs en lecture seule.
+
+    Une base en mémoire n'est visible que par sa propre connexion ; dans ce cas
+    les lectures passent par la connexion d'écriture.
+    """
+
+    _shared: Dict[str, 'SQLiteConnectionPool'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: str, readers: int = 4):
+        """
+        Initialise le pool sans ouvrir de connexion.
+
+        Args:
+            path: Chemin vers la base SQLite
+            readers: Nombre maximal de connexions en lecture seule
+        """
+        self.path = path
+        self.readers = readers if path != MEMORY_DB else 0
+        self._write_lock = threading.RLock()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._idle_readers: 'queue.Queue[sqlite3.Connection]' = queue.Queue(maxsize=max(self.readers, 1))
+        self._opened_readers = 0
+        self._readers_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, path: str, readers: int = 4) -> 'SQLiteConnectionPool':
+        """
+        Retourne le pool partagé pour un fichier de base de données.
+
+        Args:
+            path: Chemin vers la base SQLite
+            readers: Nombre de lecteurs utilisé à la création du pool
+
+        Returns:
+            SQLiteConnectionPool: Pool unique pour ce chemin
+        """
+        key = path if path == MEMORY_DB else os.path.abspath(path)
+        with cls._shared_lock:
+            pool = cls._shared.get(key)
+            if pool is None:
+                pool = cls(path, readers=readers)
+                cls._shared[key] = pool
+            return pool
+
+    def _configure(self, conn: sqlite3.Connection) -> sqlite3.Connection:
+        """Applique les PRAGMA de session à une nouvelle connexion."""
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA foreign_keys=ON")
+        # Tables temporaires (tris, GROUP BY) en mémoire et cache de pages de 64 Mo au plus
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        return conn
+
+    def _open_writer(self) -> sqlite3.Connection:
+        """Ouvre la connexion d'écriture et active le journal WAL."""
+        conn = sqlite3.connect(self.path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+        if self.path != MEMORY_DB:
+            # Le mode WAL est persistant dans le fichier : une fois suffit
+            conn.execute("PRAGMA journal_mode=WAL")
+        return self._configure(conn)
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Ouvre une connexion en lecture seule."""
+        conn = sqlite3.connect(
+            f"file:{self.path}?mode=ro", uri=True, check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row
+        return self._configure(conn)
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """
+        Emprunte la connexion d'écriture unique.
+
+        La transaction est validée en sortie normale et annulée sur exception.
+        """
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self._open_writer()
+            conn = self._writer
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Emprunte une connexion en lecture seule, en attendant si le pool est épuisé."""
+        if self.readers == 0:
+            with self.writer() as conn:
+                yield conn
+            return
+
+        conn = self._acquire_reader()
+        try:
+            yield conn
+        finally:
+            self._idle_readers.put(conn)
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        """Retourne un lecteur libre, en ouvre un nouveau ou attend qu'un lecteur se libère."""
+        try:
+            return self._idle_readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._readers_lock:
+            can_open = self._opened_readers < self.readers
+            if can_open:
+                self._opened_readers += 1
+        if can_open:
+            try:
+                return self._open_reader()
+            except Exception:
+                with self._readers_lock:
+                    self._opened_readers -= 1
+                raise
+        return self._idle_readers.get()
+
+    def close(self) -> None:
+        """Ferme toutes les connexions ouvertes par le pool."""
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        with self._readers_lock:
+            while True:
+                try:
+                    self._idle_readers.get_nowait().close()
+                except queue.Empty:
+                    break
+            self._opened_readers = 0
@@ -0,0 +1,119 @@
+"""
+StorageWorker - Thread d'écriture SQLite dédié.
+
+Les écritures sont soumises dans une file et exécutées par un seul thread,
+ce qui respecte la règle d'écrivain unique de SQLite et évite de bloquer
+les threads de requête (ou une boucle asyncio) pendant les fsync.
+
+Chaque soumission retourne un concurrent.futures.Future :
+- future.result() pour attendre la confirmation de l'écriture
+- asyncio.wrap_future(future) depuis un gestionnaire asynchrone
+- aucun appel pour une écriture sans confirmation
+"""
+
+from src.infrastructure.logger_manager import get_logger
+logger = get_logger(__name__)
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, List, Optional
+
+
+class _StorageTask:
+    """Écriture en attente dans la file du StorageWorker."""
+
+    __slots__ = ('operation', 'args', 'future', 'coalesce_key')
+
+    def __init__(self, operation: Callable[..., Any], args: tuple, coalesce_key: Optional[Hashable]):
+        self.operation = operation
+        self.args = args
+        self.future: Future = Future()
+        self.coalesce_key = coalesce_key
+
+
+class StorageWorker(threading.Thread):
+    """
+    Thread démon qui exécute les écritures dans l'ordre de soumission.
+
+    Lorsque la file contient plusieurs sauvegardes consécutives du même
+    objet, seule la dernière est exécutée : elle persiste déjà l'état final.
+    """
+
+    def __init__(self):
+        super().__init__(name='StorageWorker', daemon=True)
+        self._queue: 'queue.SimpleQueue[_StorageTask]' = queue.SimpleQueue()
+
+    def submit(self, operation: Callable[..., Any], *args, coalesce_key: Optional[Hashable] = None) -> Future:
+        """
+        Soumet une écriture au thread de stockage.
+
+        Args:
+            operation: Méthode d'écriture du repository
+            *args: Arguments de l'écriture
+            coalesce_key: Clé permettant de fusionner des écritures consécutives identiques
+
+        Returns:
+            Future: Résultat (ou exception) de l'écriture
+        """
+        task = _StorageTask(operation, args, coalesce_key)
+        if threading.current_thread() is self:
+            # Écriture imbriquée depuis le worker lui-même : exécuter directement
+            self._execute(task, [task])
+        else:
+            self._queue.put(task)
+        return task.future
+
+    def submit_save(self, repository: Any, project: Any) -> Future:
+        """Soumet la sauvegarde d'un projet, fusionnable avec une sauvegarde identique qui suit."""
+        return self.submit(repository.save_project, project, coalesce_key=('save_project', id(repository), id(project)))
+
+    def run(self) -> None:
+        """Vide la file par lots et exécute les écritures."""
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for tasks in self._coalesce(batch):
+                self._execute(tasks[-1], tasks)
+
+    @staticmethod
+    def _coalesce(batch: List[_StorageTask]) -> List[List[_StorageTask]]:
+        """Regroupe les tâches consécutives partageant la même clé de fusion."""
+        groups: List[List[_StorageTask]] = []
+        for task in batch:
+            if groups and task.coalesce_key is not None and groups[-1][-1].coalesce_key == task.coalesce_key:
+                groups[-1].append(task)
+            else:
+                groups.append([task])
+        return groups
+
+    @staticmethod
+    def _execute(task: _StorageTask, waiting: List[_StorageTask]) -> None:
+        """Exécute une tâche et publie son résultat sur toutes les futures en attente."""
+        try:
+            result = task.operation(*task.args)
+        except BaseException as e:
+            for pending in waiting:
+                pending.future.set_exception(e)
+        else:
+            for pending in waiting:
+                pending.future.set_result(result)
+
+
+_worker: Optional[StorageWorker] = None
+_worker_lock = threading.Lock()
+
+
+def get_storage_worker() -> StorageWorker:
+    """Retourne le StorageWorker du processus, démarré à la première utilisation."""
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = StorageWorker()
+            _worker.start()
+        return _worker
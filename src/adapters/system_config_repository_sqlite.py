@@ -18,6 +18,36 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+
+def parse_boolean_config(value: Any, default_value: bool = False) -> bool:
+    """
+    Convertit une valeur de configuration stockée en booléen.
+
+    Args:
+        value: Valeur brute de la base (chaîne, nombre ou None)
+        default_value: Valeur retournée si la configuration est absente
+
+    Returns:
+        Valeur booléenne de la configuration
+    """
+    if value is None:
+        return default_value
+    if isinstance(value, str):
+        return value.lower() in ('true', '1', 'yes', 'on')
+    return bool(value)
+
+
+_UPSERT_CONFIG_SQL = """
+    INSERT INTO system_config (config_key, config_value, config_type, description, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(config_key) DO UPDATE SET
+        config_value = excluded.config_value,
+        config_type = excluded.config_type,
+        description = COALESCE(excluded.description, system_config.description),
+        updated_at = excluded.updated_at
+"""
+
+
 class SystemConfigRepositorySQLiteError(Exception):
     """Exception spécialisée pour les erreurs du repository SQLite."""
     pass
@@ -175,15 +205,7 @@ class SystemConfigRepositorySQLite:
         Returns:
             Valeur booléenne de la configuration
         """
-        value = self.get_config_value(config_key)
-        if value is None:
-            return default_value
-        
-        # Convertir string vers boolean
-        if isinstance(value, str):
-            return value.lower() in ('true', '1', 'yes', 'on')
-        
-        return bool(value)
+        return parse_boolean_config(self.get_config_value(config_key), default_value)
 
     def set_boolean_config(self, config_key: str, config_value: bool, description: str = None) -> bool:
         """
@@ -199,6 +221,36 @@ class SystemConfigRepositorySQLite:
         """
         return self.set_config_value(config_key, str(config_value).lower(), 'boolean', description)
 
+    def set_boolean_configs(self, configs: Dict[str, bool], description: str = None) -> bool:
+        """
+        Définit plusieurs configurations booléennes en une seule transaction.
+
+        Args:
+            configs: Dictionnaire clé de configuration -> valeur booléenne
+            description: Description optionnelle appliquée à chaque clé
+
+        Returns:
+            True si toutes les mises à jour réussissent, False sinon (aucune n'est appliquée)
+        """
+        if not configs:
+            return True
+
+        current_time = datetime.now().isoformat()
+        rows = [
+            (config_key, str(config_value).lower(), 'boolean', description, current_time, current_time)
+            for config_key, config_value in configs.items()
+        ]
+
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(_UPSERT_CONFIG_SQL, rows)
+                logger.info(f"Configurations booléennes mises à jour: {', '.join(configs)}")
+                return True
+
+        except Exception as e:
+            logger.error(f"Erreur lors de la mise à jour groupée des configurations {list(configs)}: {e}")
+            return False
+
     def delete_config(self, config_key: str) -> bool:
         """
         Supprime une configuration.
@@ -12,6 +12,7 @@ logger = get_logger(__name__)
 
 import asyncio
 import json
+from collections import Counter
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -75,6 +76,22 @@ class UserFileAdapter(UserRepositoryPort):
             logger.error(f"Erreur lors de la recherche de l'utilisateur {username}: {e}")
             raise UserAuthenticationError(f"Erreur de recherche utilisateur: {e}")
 
+    async def get_users_by_usernames(self, usernames: List[str]) -> List[User]:
+        """
+        Récupère plusieurs utilisateurs en une seule lecture du fichier.
+
+        Utilise filter() sur un ensemble de noms.
+        """
+        try:
+            wanted = set(usernames)
+            users = await self.get_all_users()
+
+            return list(filter(lambda u: u.username in wanted, users))
+
+        except Exception as e:
+            logger.error(f"Erreur lors de la recherche groupée d'utilisateurs: {e}")
+            raise UserAuthenticationError(f"Erreur de recherche utilisateur: {e}")
+
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """
         Récupère un utilisateur par son email.
@@ -208,6 +225,22 @@ class UserFileAdapter(UserRepositoryPort):
             logger.error(f"Erreur lors de la recherche par rôle {role}: {e}")
             raise UserAuthenticationError(f"Erreur de recherche par rôle: {e}")
 
+    async def get_role_counts(self) -> Dict[str, int]:
+        """
+        Compte les utilisateurs par rôle.
+
+
+        Utilise Counter() sur les valeurs de rôle.
+        """
+        try:
+            users = await self.get_all_users()
+
+            return dict(Counter(user.role.value for user in users))
+
+        except Exception as e:
+            logger.error(f"Erreur lors du comptage par rôle: {e}")
+            raise UserAuthenticationError(f"Erreur de comptage par rôle: {e}")
+
     async def update_user_password(self, username: str, new_password_hash: str) -> bool:
         """
         Met à jour le mot de passe d'un utilisateur.
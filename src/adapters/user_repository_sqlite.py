@@ -25,6 +25,23 @@ import asyncio
 
 from src.domain.entities.user import User, UserRole, UserValidationError
 from src.ports.user_repository import UserRepositoryPort
+from src.adapters.sqlite_connection_pool import SQLiteConnectionPool
+
+# Nombre maximal de paramètres par clause IN (limite SQLite par défaut : 999)
+_MAX_IN_PARAMETERS = 900
+
+
+def _parse_iso(value: str) -> datetime:
+    """
+    Convertit une date ISO 8601 stockée en datetime.
+
+    Le suffixe 'Z' (UTC) n'est réécrit que s'il est présent : la plupart
+    des valeurs stockées sont déjà au format accepté par fromisoformat.
+    """
+    if value.endswith('Z'):
+        return datetime.fromisoformat(value[:-1] + '+00:00')
+    return datetime.fromisoformat(value)
+
 
 class UserRepositorySQLiteError(Exception):
     """Exception spécialisée pour les erreurs du repository SQLite."""
@@ -65,6 +82,9 @@ class UserRepositorySQLite(UserRepositoryPort):
         # Initialiser la base de données
         self._initialize_database()
 
+        # Connexions partagées par fichier (WAL, écrivain unique, instructions préparées en cache)
+        self._pool = SQLiteConnectionPool.shared(self.db_path)
+
     def _load_database_config(self, config_path: str) -> Dict[str, Any]:
         """
         [STANDARD: Configuration JSON obligatoire]
@@ -90,7 +110,7 @@ class UserRepositorySQLite(UserRepositoryPort):
 
             with open(resolved_config_path, 'r', encoding='utf-8') as f:
                 config = json.load(f)
-                logger.debug(f"Configuration de base de données chargée depuis {resolved_config_path}")
+                logger.debug("Configuration de base de données chargée depuis %s", resolved_config_path)
                 return config
         except FileNotFoundError:
             logger.error(f"Fichier de configuration introuvable: {config_path}")
@@ -116,12 +136,6 @@ class UserRepositorySQLite(UserRepositoryPort):
             conn.commit()
             logger.info(f"Base de données créée: {self.db_path}")
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Crée une nouvelle connexion SQLite avec configuration."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Pour accès par nom de colonne
-        return conn
-
     def _ensure_default_users(self) -> None:
         """
         S'assure que les utilisateurs par défaut existent avec mots de passe chiffrés.
@@ -139,7 +153,7 @@ class UserRepositorySQLite(UserRepositoryPort):
     async def get_all_users(self) -> List[User]:
         """Récupère tous les utilisateurs."""
         try:
-            with self._get_connection() as conn:
+            with self._pool.reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT username, email, password_hash, role, full_name,
@@ -154,7 +168,7 @@ class UserRepositorySQLite(UserRepositoryPort):
                     user = self._row_to_user(row)
                     users.append(user)
 
-                logger.debug(f"Récupération de {len(users)} utilisateurs")
+                logger.debug("Récupération de %d utilisateurs", len(users))
                 return users
 
         except Exception as e:
@@ -164,7 +178,7 @@ class UserRepositorySQLite(UserRepositoryPort):
     async def get_user_by_username(self, username: str) -> Optional[User]:
         """Récupère un utilisateur par son nom d'utilisateur."""
         try:
-            with self._get_connection() as conn:
+            with self._pool.reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT username, email, password_hash, role, full_name,
@@ -175,20 +189,55 @@ class UserRepositorySQLite(UserRepositoryPort):
                 row = cursor.fetchone()
                 if row:
                     user = self._row_to_user(row)
-                    logger.debug(f"Utilisateur trouvé: {username}")
+                    logger.debug("Utilisateur trouvé: %s", username)
                     return user
                 else:
-                    logger.debug(f"Utilisateur introuvable: {username}")
+                    logger.debug("Utilisateur introuvable: %s", username)
                     return None
 
         except Exception as e:
             logger.error(f"Erreur lors de la recherche de l'utilisateur {username}: {e}")
             raise UserRepositorySQLiteError(f"Erreur de recherche utilisateur: {e}")
 
+    async def get_users_by_usernames(self, usernames: List[str]) -> List[User]:
+        """
+        Récupère plusieurs utilisateurs en une requête SQL IN.
+
+        Args:
+            usernames: Noms d'utilisateur recherchés
+
+        Returns:
+            Utilisateurs trouvés (les noms inconnus sont ignorés)
+        """
+        unique_usernames = list(dict.fromkeys(usernames))
+        if not unique_usernames:
+            return []
+
+        try:
+            users = []
+            with self._pool.reader() as conn:
+                # Découper pour rester sous la limite de paramètres SQLite
+                for start in range(0, len(unique_usernames), _MAX_IN_PARAMETERS):
+                    batch = unique_usernames[start:start + _MAX_IN_PARAMETERS]
+                    placeholders = ', '.join('?' * len(batch))
+                    cursor = conn.execute(f"""
+                        SELECT username, email, password_hash, role, full_name,
+                               condo_unit, phone, is_active, created_at, last_login
+                        FROM users WHERE username IN ({placeholders})
+                    """, batch)
+                    users.extend(self._row_to_user(row) for row in cursor.fetchall())
+
+            logger.debug("%d utilisateurs trouvés sur %d demandés", len(users), len(unique_usernames))
+            return users
+
+        except Exception as e:
+            logger.error(f"Erreur lors de la recherche groupée d'utilisateurs: {e}")
+            raise UserRepositorySQLiteError(f"Erreur de recherche utilisateur: {e}")
+
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """Récupère un utilisateur par son email."""
         try:
-            with self._get_connection() as conn:
+            with self._pool.reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT username, email, password_hash, role, full_name,
@@ -199,10 +248,10 @@ class UserRepositorySQLite(UserRepositoryPort):
                 row = cursor.fetchone()
                 if row:
                     user = self._row_to_user(row)
-                    logger.debug(f"Utilisateur trouvé par email: {email}")
+                    logger.debug("Utilisateur trouvé par email: %s", email)
                     return user
                 else:
-                    logger.debug(f"Utilisateur introuvable par email: {email}")
+                    logger.debug("Utilisateur introuvable par email: %s", email)
                     return None
 
         except Exception as e:
@@ -212,7 +261,7 @@ class UserRepositorySQLite(UserRepositoryPort):
     async def save_user(self, user: User) -> User:
         """Sauvegarde un utilisateur (création ou mise à jour)."""
         try:
-            with self._get_connection() as conn:
+            with self._pool.writer() as conn:
                 cursor = conn.cursor()
 
                 # Vérifier si l'utilisateur existe
@@ -232,7 +281,7 @@ class UserRepositorySQLite(UserRepositoryPort):
                         user.last_login.isoformat() if user.last_login else None,
                         user.username
                     ))
-                    logger.debug(f"Utilisateur mis à jour: {user.username}")
+                    logger.debug("Utilisateur mis à jour: %s", user.username)
                 else:
                     # Création
                     cursor.execute("""
@@ -268,7 +317,7 @@ class UserRepositorySQLite(UserRepositoryPort):
     async def delete_user(self, username: str) -> bool:
         """Supprime un utilisateur."""
         try:
-            with self._get_connection() as conn:
+            with self._pool.writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM users WHERE username = ?", (username,))
 
@@ -289,7 +338,7 @@ class UserRepositorySQLite(UserRepositoryPort):
     async def user_exists(self, username: str) -> bool:
         """Vérifie si un utilisateur existe."""
         try:
-            with self._get_connection() as conn:
+            with self._pool.reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT 1 FROM users WHERE username = ? LIMIT 1", (username,))
                 return cursor.fetchone() is not None
@@ -301,7 +350,7 @@ class UserRepositorySQLite(UserRepositoryPort):
     async def get_users_by_role(self, role: UserRole) -> List[User]:
         """Récupère tous les utilisateurs d'un rôle donné."""
         try:
-            with self._get_connection() as conn:
+            with self._pool.reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT username, email, password_hash, role, full_name,
@@ -309,24 +358,33 @@ class UserRepositorySQLite(UserRepositoryPort):
                     FROM users WHERE role = ? ORDER BY username
                 """, (role.value,))
 
-                rows = cursor.fetchall()
-                users = []
-
-                for row in rows:
-                    user = self._row_to_user(row)
-                    users.append(user)
+                users = [self._row_to_user(row) for row in cursor.fetchall()]
 
-                logger.debug(f"Récupération de {len(users)} utilisateurs avec le rôle {role.value}")
+                logger.debug("Récupération de %d utilisateurs avec le rôle %s", len(users), role.value)
                 return users
 
         except Exception as e:
             logger.error(f"Erreur lors de la recherche par rôle {role.value}: {e}")
             raise UserRepositorySQLiteError(f"Erreur de recherche par rôle: {e}")
 
+    async def get_role_counts(self) -> Dict[str, int]:
+        """Compte les utilisateurs par rôle en une requête GROUP BY."""
+        try:
+            with self._pool.reader() as conn:
+                rows = conn.execute("SELECT role, COUNT(*) FROM users GROUP BY role").fetchall()
+
+            role_counts = {role: count for role, count in rows}
+            logger.debug("Utilisateurs par rôle: %s", role_counts)
+            return role_counts
+
+        except Exception as e:
+            logger.error(f"Erreur lors du comptage par rôle: {e}")
+            raise UserRepositorySQLiteError(f"Erreur de comptage par rôle: {e}")
+
     async def update_user_password(self, username: str, new_password_hash: str) -> bool:
         """Met à jour le mot de passe d'un utilisateur."""
         try:
-            with self._get_connection() as conn:
+            with self._pool.writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "UPDATE users SET password_hash = ? WHERE username = ?",
@@ -359,7 +417,7 @@ class UserRepositorySQLite(UserRepositoryPort):
             bool: True si la mise à jour a réussi, False sinon
         """
         try:
-            with self._get_connection() as conn:
+            with self._pool.writer() as conn:
                 cursor = conn.cursor()
 
                 # Construire la requête de mise à jour dynamiquement
@@ -390,7 +448,6 @@ class UserRepositorySQLite(UserRepositoryPort):
 
                 # Gérer le mot de passe séparément
                 if 'password' in user_data and user_data['password']:
-                    from src.domain.entities.user import User
                     password_hash = User.hash_password(user_data['password'])
                     update_fields.append("password_hash = ?")
                     update_values.append(password_hash)
@@ -447,7 +504,7 @@ class UserRepositorySQLite(UserRepositoryPort):
                 logger.info(f"Authentification réussie pour: {username}")
 
                 # Mettre à jour la date de dernière connexion
-                with self._get_connection() as conn:
+                with self._pool.writer() as conn:
                     cursor = conn.cursor()
                     cursor.execute(
                         "UPDATE users SET last_login = ? WHERE username = ?",
@@ -490,7 +547,7 @@ class UserRepositorySQLite(UserRepositoryPort):
                 logger.info(f"Utilisateur par défaut créé: {user.username}")
             except UserRepositorySQLiteError:
                 # L'utilisateur existe peut-être déjà
-                logger.debug(f"Utilisateur {user.username} existe déjà")
+                logger.debug("Utilisateur %s existe déjà", user.username)
 
     def _row_to_user(self, row: sqlite3.Row) -> User:
         """Convertit une ligne SQLite en objet User."""
@@ -499,13 +556,13 @@ class UserRepositorySQLite(UserRepositoryPort):
 
         try:
             if row[8]:  # created_at
-                created_at = datetime.fromisoformat(row[8])
+                created_at = _parse_iso(row[8])
         except (ValueError, TypeError):
             created_at = datetime.now()
 
         try:
             if row[9]:  # last_login
-                last_login = datetime.fromisoformat(row[9])
+                last_login = _parse_iso(row[9])
         except (ValueError, TypeError):
             last_login = None
 
@@ -8,6 +8,8 @@ Les feature flags sont contrôlés uniquement via la base de données.
 from src.infrastructure.logger_manager import get_logger
 logger = get_logger(__name__)
 
+from typing import Dict, Sequence
+
 from src.ports.feature_flag_repository import FeatureFlagRepositoryPort
 
 class FeatureFlagService:
@@ -43,7 +45,7 @@ class FeatureFlagService:
         try:
             return self.feature_flag_repository.is_enabled('finance_module')
         except Exception as e:
-            logger.error(f"Erreur lors de la vérification du module finance: {e}")
+            logger.error("Erreur lors de la vérification du module finance: %s", e)
             return False
 
     def is_feature_enabled(self, feature_name: str) -> bool:
@@ -59,5 +61,26 @@ class FeatureFlagService:
         try:
             return self.feature_flag_repository.is_enabled(feature_name)
         except Exception as e:
-            logger.error(f"Erreur lors de la vérification du feature flag {feature_name}: {e}")
+            logger.error("Erreur lors de la vérification du feature flag %s: %s", feature_name, e)
             return False
+
+    def are_enabled(self, feature_names: Sequence[str]) -> Dict[str, bool]:
+        """
+        Vérifie l'état de plusieurs fonctionnalités en un seul appel au repository.
+
+        À privilégier lorsqu'une page consulte plusieurs flags, pour éviter
+        un aller-retour en base par flag.
+
+        Args:
+            feature_names: Noms des feature flags à vérifier
+
+        Returns:
+            Dict[str, bool]: État de chaque flag (False en cas d'erreur)
+        """
+        if not feature_names:
+            return {}
+        try:
+            return self.feature_flag_repository.is_enabled_many(feature_names)
+        except Exception as e:
+            logger.error("Erreur lors de la vérification groupée des feature flags %s: %s", list(feature_names), e)
+            return dict.fromkeys(feature_names, False)
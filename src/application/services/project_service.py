@@ -2,13 +2,17 @@
 Service de gestion des projets de condominiums
 Orchestration de la logique métier pour la création et gestion des projets avec unités
 """
-import asyncio
+import copy
+import uuid
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 from src.infrastructure.logger_manager import get_logger
-from src.domain.entities.project import Project
+from src.infrastructure.cache_manager import TaggedCache
+from src.domain.entities.project import Project, ProjectStatus
 from src.domain.entities.unit import Unit, UnitType, UnitStatus
-from src.adapters.project_repository_sqlite import ProjectRepositorySQLite
+from src.adapters.project_repository_sqlite import ProjectRepositorySQLite, SaveResult, ALL_PROJECTS_TAG
+from src.adapters.storage_worker import get_storage_worker
+from src.application.services.service_result import failure_result, service_result
 from src.domain.exceptions.business_exceptions import (
     ProjectCreationError,
     ProjectNotFoundError,
@@ -19,6 +23,48 @@ from src.domain.exceptions.business_exceptions import (
 
 logger = get_logger(__name__)
 
+_uuid4 = uuid.uuid4
+
+# Clés de cache des index de projets (même étiquette que la liste complète)
+_PROJECTS_BY_ID_KEY = 'projects_by_id'
+_PROJECTS_BY_NAME_KEY = 'projects_by_name'
+_PROJECTS_BY_FOLDED_NAME_KEY = 'projects_by_folded_name'
+
+# Durée de vie des lectures en cache : un autre processus (unite_app) écrit dans la
+# même base sans invalider ce cache, et une lecture concurrente d'une écriture peut
+# remettre en cache des données déjà invalidées
+PROJECT_CACHE_TTL_SECONDS = 2
+_UNITS_OVERVIEW_KEY = 'units_overview'
+
+# Champs obligatoires d'un projet et leur libellé dans les messages d'erreur
+_REQUIRED_PROJECT_FIELDS = (
+    ('name', 'nom du projet'),
+    ('address', 'adresse'),
+    ('building_area', 'superficie du bâtiment'),
+    ('construction_year', 'année de construction'),
+    ('unit_count', 'nombre d\'unités'),
+    ('constructor', 'constructeur'),
+)
+
+# Règles par champ : (champ, conversion, validité, erreur de plage, erreur de conversion)
+_PROJECT_FIELD_RULES = (
+    ('name', str.strip, lambda v: len(v) >= 3,
+     "Le nom du projet doit contenir au moins 3 caractères", None),
+    ('address', str.strip, lambda v: len(v) >= 10,
+     "L'adresse doit être complète (minimum 10 caractères)", None),
+    ('building_area', float, lambda v: 0 < v <= 100000,
+     "La superficie du bâtiment doit être entre 1 et 100,000 pieds carrés",
+     "La superficie du bâtiment doit être un nombre valide"),
+    ('construction_year', int, lambda v: 1900 <= v <= 2030,
+     "L'année de construction doit être entre 1900 et 2030",
+     "L'année de construction doit être un nombre valide"),
+    ('unit_count', int, lambda v: 0 < v <= 500,
+     "Le nombre d'unités doit être entre 1 et 500",
+     "Le nombre d'unités doit être un nombre valide"),
+    ('constructor', str.strip, lambda v: len(v) >= 3,
+     "Le nom du constructeur doit contenir au moins 3 caractères", None),
+)
+
 class ProjectService:
     """Service pour orchestrer la gestion des projets de condominiums"""
 
@@ -33,19 +79,144 @@ class ProjectService:
         # Utiliser le repository SQLite par défaut
         self.project_repository = project_repository or ProjectRepositorySQLite()
         self.condo_repository = condo_repository
-        self._projects: List[Project] = []
 
-        # Charger les projets depuis la base de données
-        self._load_projects()
+        # Cache partagé par base SQLite, privé pour tout autre repository
+        db_path = getattr(self.project_repository, 'db_path', None)
+        self._cache = TaggedCache.shared(db_path) if isinstance(db_path, str) else TaggedCache()
 
-    def _load_projects(self) -> None:
-        """Charge les projets depuis la base de données SQLite."""
+        # Les écritures passent par le thread de stockage pour ne pas bloquer l'appelant
+        self._storage_worker = get_storage_worker()
+
+    @property
+    def _projects(self) -> List[Project]:
+        """Projets lus via le cache partagé (plus récents en premier), rechargés après chaque écriture."""
         try:
-            self._projects = self.project_repository.get_all_projects()
-            logger.info(f"Chargé {len(self._projects)} projets depuis la base de données SQLite")
+            return self._get_all_projects_cached()
         except Exception as e:
-            logger.error(f"Erreur lors du chargement des projets: {e}")
-            self._projects = []
+            logger.error("Erreur lors du chargement des projets: %s", e)
+            return []
+
+    @_projects.setter
+    def _projects(self, projects: List[Project]) -> None:
+        """Remplace les projets en cache ; les index dérivés sont reconstruits au prochain accès."""
+        self._cache.invalidate({ALL_PROJECTS_TAG})
+        self._cache.set(ALL_PROJECTS_TAG, list(projects), {ALL_PROJECTS_TAG}, ttl=PROJECT_CACHE_TTL_SECONDS)
+
+    @property
+    def _projects_by_id(self) -> Dict[str, Project]:
+        """Index des projets par ID, construit depuis la liste en cache."""
+        projects_by_id = self._cache.get(_PROJECTS_BY_ID_KEY)
+        if projects_by_id is None:
+            projects_by_id = {p.project_id: p for p in self._get_all_projects_cached()}
+            self._cache.set(_PROJECTS_BY_ID_KEY, projects_by_id, {ALL_PROJECTS_TAG}, ttl=PROJECT_CACHE_TTL_SECONDS)
+        return projects_by_id
+
+    @property
+    def _projects_by_folded_name(self) -> Dict[str, Project]:
+        """Index des projets par nom normalisé (casefold), construit depuis la liste en cache."""
+        projects_by_folded_name = self._cache.get(_PROJECTS_BY_FOLDED_NAME_KEY)
+        if projects_by_folded_name is None:
+            projects_by_folded_name = {p.name.casefold(): p for p in self._get_all_projects_cached()}
+            self._cache.set(_PROJECTS_BY_FOLDED_NAME_KEY, projects_by_folded_name, {ALL_PROJECTS_TAG}, ttl=PROJECT_CACHE_TTL_SECONDS)
+        return projects_by_folded_name
+
+    def _is_project_name_taken(self, name: str) -> bool:
+        """Vérifie l'unicité d'un nom de projet (insensible à la casse, casefold) via l'index."""
+        key = name.casefold()
+        existing = self._projects_by_folded_name.get(key)
+        # L'entrée peut être périmée si le projet a été renommé en place depuis son indexation
+        return existing is not None and existing.name.casefold() == key
+
+    def _get_all_projects_cached(self) -> List[Project]:
+        """Retourne tous les projets depuis le cache, en interrogeant la base au besoin."""
+        projects = self._cache.get(ALL_PROJECTS_TAG)
+        if projects is None:
+            projects = list(self.project_repository.get_all_projects())
+            self._cache.set(ALL_PROJECTS_TAG, projects, {ALL_PROJECTS_TAG}, ttl=PROJECT_CACHE_TTL_SECONDS)
+            self._cache.set(_PROJECTS_BY_ID_KEY, {p.project_id: p for p in projects}, {ALL_PROJECTS_TAG}, ttl=PROJECT_CACHE_TTL_SECONDS)
+        return projects
+
+    def _get_projects_by_name_cached(self) -> Dict[str, Project]:
+        """Retourne l'index des projets par nom exact, construit depuis la liste en cache."""
+        projects_by_name = self._cache.get(_PROJECTS_BY_NAME_KEY)
+        if projects_by_name is None:
+            projects_by_name = {}
+            for project in self._get_all_projects_cached():
+                # Conserver le premier projet d'un nom, comme une recherche séquentielle
+                projects_by_name.setdefault(project.name, project)
+            self._cache.set(_PROJECTS_BY_NAME_KEY, projects_by_name, {ALL_PROJECTS_TAG}, ttl=PROJECT_CACHE_TTL_SECONDS)
+        return projects_by_name
+
+    def _get_project_cached(self, project_id: str) -> Optional[Project]:
+        """Retourne une copie d'un projet en cache (étiquette = son ID), ou None s'il n'existe pas."""
+        key = f"project:{project_id}"
+        project = self._cache.get(key)
+        if project is None:
+            projects_by_id = self._cache.get(_PROJECTS_BY_ID_KEY)
+            if projects_by_id is not None:
+                project = projects_by_id.get(project_id)
+            if project is None:
+                # Lecture ciblée : seul ce projet et ses unités sont chargés
+                project = self.project_repository.get_project_by_id(project_id)
+            if project is not None:
+                self._cache.set(key, project, {project_id}, ttl=PROJECT_CACHE_TTL_SECONDS)
+        # Copie : une modification non sauvegardée ne doit pas atteindre les autres lecteurs
+        return copy.deepcopy(project)
+
+    def _get_statistics_cached(self, project_id: str) -> Dict[str, Any]:
+        """Retourne une copie des statistiques d'un projet, invalidées avec l'étiquette du projet."""
+        key = f"stats:{project_id}"
+        stats = self._cache.get(key)
+        if stats is None:
+            stats = Project.compute_statistics(self.project_repository.get_status_counts(project_id))
+            self._cache.set(key, stats, {project_id}, ttl=PROJECT_CACHE_TTL_SECONDS)
+        # Copie : l'appelant peut compléter le dictionnaire sans altérer le cache
+        return {**stats, 'units_by_type': dict(stats['units_by_type'])}
+
+    def _project_tags(self, project_id: str) -> Set[str]:
+        """Étiquettes de cache touchées par une écriture sur un projet (repli prudent)."""
+        return {ALL_PROJECTS_TAG, project_id}
+
+    def _invalidate(self, tags: Set[str]) -> None:
+        """Invalide les entrées de cache associées aux étiquettes données."""
+        self._cache.invalidate(tags)
+
+    def _save(self, project: Project) -> Any:
+        """Sauvegarde un projet via le StorageWorker, attend la confirmation et invalide le cache."""
+        return self._write_and_invalidate(
+            self._storage_worker.submit_save(self.project_repository, project),
+            project.project_id
+        )
+
+    def _write(self, operation, *args, project_id: Optional[str] = None) -> Any:
+        """
+        Exécute une écriture du repository via le StorageWorker et attend son résultat.
+
+        Args:
+            operation: Méthode d'écriture du repository
+            *args: Arguments de l'écriture
+            project_id: Projet touché ; None si l'appelant gère lui-même le cache
+        """
+        future = self._storage_worker.submit(operation, *args)
+        if project_id is None:
+            return future.result()
+        return self._write_and_invalidate(future, project_id)
+
+    def _write_and_invalidate(self, future, project_id: str) -> Any:
+        """
+        Attend une écriture puis invalide les étiquettes qu'elle signale.
+
+        Un SaveResult fournit lui-même ses étiquettes ; pour tout autre résultat,
+        ou en cas d'erreur, les étiquettes du projet sont invalidées par prudence.
+        """
+        tags = self._project_tags(project_id)
+        try:
+            result = future.result()
+            if isinstance(result, SaveResult):
+                tags = result.invalidation_tags
+            return result
+        finally:
+            self._invalidate(tags)
 
     def _save_projects(self) -> None:
         """Sauvegarde les projets dans la base de données SQLite."""
@@ -84,14 +255,12 @@ class ProjectService:
                     raise DuplicateProjectError('project_id', str(project.project_id))
 
             # Vérifier que le nom du projet est unique
-            if any(p.name.lower() == project.name.lower() for p in self._projects):
+            if self._is_project_name_taken(project.name):
                 raise DuplicateProjectError('name', project.name)
 
             # Sauvegarder le projet en base de données
-            project_id = self.project_repository.save_project(project)
-
-            # Recharger les projets depuis la base
-            self._load_projects()
+            self._save(project)
+            project_id = project.project_id
 
             logger.info(f"Projet créé avec succès: {project.name} (ID: {project_id})")
             return {
@@ -179,11 +348,13 @@ class ProjectService:
             Dict contenant la liste des projets
         """
         try:
-            logger.debug(f"Récupération de {len(self._projects)} projets")
+            # Copies : les projets en cache sont partagés par toutes les instances du service
+            projects = copy.deepcopy(self._projects)
+            logger.debug("Récupération de %s projets", len(projects))
             return {
                 'success': True,
-                'projects': self._projects,
-                'count': len(self._projects)
+                'projects': projects,
+                'count': len(projects)
             }
         except Exception as e:
             logger.error(f"Erreur lors de la récupération des projets: {e}")
@@ -193,6 +364,7 @@ class ProjectService:
                 'projects': []
             }
 
+    @service_result("la récupération du projet")
     def get_project_by_id(self, project_id: str) -> Dict[str, Any]:
         """
         Récupère un projet par son ID.
@@ -203,44 +375,20 @@ class ProjectService:
         Returns:
             Dict contenant le projet ou une erreur
         """
-        try:
-            # D'abord chercher dans le cache en mémoire
-            project = next((p for p in self._projects if p.project_id == project_id), None)
-
-            if project:
-                logger.debug(f"Projet trouvé en cache: {project.name} (ID: {project_id})")
-                return {
-                    'success': True,
-                    'project': project
-                }
-            else:
-                # Si pas trouvé en cache, recharger depuis la base de données
-                logger.debug(f"Projet {project_id} non trouvé en cache, rechargement depuis la base...")
-                self._load_projects()
-
-                # Chercher à nouveau après rechargement
-                project = next((p for p in self._projects if p.project_id == project_id), None)
-
-                if project:
-                    logger.info(f"Projet trouvé après rechargement: {project.name} (ID: {project_id})")
-                    return {
-                        'success': True,
-                        'project': project
-                    }
-                else:
-                    logger.warning(f"Projet non trouvé même après rechargement: {project_id}")
-                    return {
-                        'success': False,
-                        'error': f'Aucun projet trouvé avec l\'ID {project_id}'
-                    }
+        # Lecture ciblée si absent du cache : seul ce projet et ses unités sont chargés
+        project = self._get_project_cached(project_id)
 
-        except Exception as e:
-            logger.error(f"Erreur lors de la récupération du projet {project_id}: {e}")
+        if project:
+            logger.debug("Projet trouvé: %s (ID: %s)", project.name, project_id)
             return {
-                'success': False,
-                'error': f'Erreur système: {str(e)}'
+                'success': True,
+                'project': project
             }
+        else:
+            logger.warning(f"Projet non trouvé: {project_id}")
+            return failure_result(f'Aucun projet trouvé avec l\'ID {project_id}')
 
+    @service_result("la récupération du projet par nom")
     def get_project_by_name(self, project_name: str) -> Dict[str, Any]:
         """
         Récupère un projet par son nom.
@@ -253,30 +401,18 @@ class ProjectService:
         Returns:
             Dict contenant le projet ou une erreur
         """
-        try:
-            # Recharger les projets depuis la base pour avoir les dernières données
-            all_projects = self.project_repository.get_all_projects()
-            project = next((p for p in all_projects if p.name == project_name), None)
+        # Cache invalidé par chaque écriture et borné par sa durée de vie : pas de rechargement défensif
+        project = self._get_projects_by_name_cached().get(project_name)
 
-            if project:
-                logger.debug(f"Projet trouvé par nom: {project.name} (ID: {project.project_id})")
-                return {
-                    'success': True,
-                    'project': project
-                }
-            else:
-                logger.warning(f"Projet non trouvé avec le nom: {project_name}")
-                return {
-                    'success': False,
-                    'error': f'Aucun projet trouvé avec le nom "{project_name}"'
-                }
-
-        except Exception as e:
-            logger.error(f"Erreur lors de la récupération du projet {project_name}: {e}")
+        if project:
+            logger.debug("Projet trouvé par nom: %s (ID: %s)", project.name, project.project_id)
             return {
-                'success': False,
-                'error': f'Erreur système: {str(e)}'
+                'success': True,
+                'project': copy.deepcopy(project)
             }
+        else:
+            logger.warning(f"Projet non trouvé avec le nom: {project_name}")
+            return failure_result(f'Aucun projet trouvé avec le nom "{project_name}"')
 
     def get_project_by_name_required(self, project_name: str) -> Project:
         """
@@ -292,15 +428,14 @@ class ProjectService:
             ProjectNotFoundError: Si le projet n'est pas trouvé
         """
         try:
-            # Recharger les projets depuis la base pour avoir les dernières données
-            all_projects = self.project_repository.get_all_projects()
-            project = next((p for p in all_projects if p.name == project_name), None)
+            # Cache invalidé par chaque écriture et borné par sa durée de vie : pas de rechargement défensif
+            project = self._get_projects_by_name_cached().get(project_name)
 
             if not project:
                 raise ProjectNotFoundError(project_name)
 
-            logger.debug(f"Projet trouvé par nom: {project.name} (ID: {project.project_id})")
-            return project
+            logger.debug("Projet trouvé par nom: %s (ID: %s)", project.name, project.project_id)
+            return copy.deepcopy(project)
 
         except ProjectNotFoundError:
             raise  # Re-lancer l'exception métier
@@ -308,6 +443,7 @@ class ProjectService:
             logger.error(f"Erreur technique lors de la récupération du projet {project_name}: {e}")
             raise ProjectNotFoundError(project_name, f"Erreur technique: {e}")
 
+    @service_result("la mise à jour du projet", "Erreur système lors de la mise à jour")
     def update_project(self, project: Project) -> Dict[str, Any]:
         """
         Met à jour un projet existant.
@@ -318,35 +454,21 @@ class ProjectService:
         Returns:
             Dict contenant le résultat de l'opération
         """
-        try:
-            # Trouver l'index du projet dans la liste en mémoire
-            project_index = next((i for i, p in enumerate(self._projects) if p.project_id == project.project_id), None)
+        # Vérifier l'existence du projet par une lecture ciblée (sans charger tout le catalogue)
+        existing = self._get_project_cached(project.project_id)
 
-            if project_index is not None:
-                # Mettre à jour la liste en mémoire
-                self._projects[project_index] = project
+        if existing is not None:
+            # Sauvegarder en base de données SQLite (l'écriture invalide la liste en cache)
+            self._save(project)
 
-                # Sauvegarder en base de données SQLite
-                self.project_repository.save_project(project)
-
-                logger.info(f"Projet mis à jour: {project.name} (ID: {project.project_id})")
-                return {
-                    'success': True,
-                    'project': project,
-                    'message': f'Projet "{project.name}" mis à jour avec succès'
-                }
-            else:
-                return {
-                    'success': False,
-                    'error': f'Projet non trouvé avec l\'ID {project.project_id}'
-                }
-
-        except Exception as e:
-            logger.error(f"Erreur lors de la mise à jour du projet: {e}")
+            logger.info(f"Projet mis à jour: {project.name} (ID: {project.project_id})")
             return {
-                'success': False,
-                'error': f'Erreur système lors de la mise à jour: {str(e)}'
+                'success': True,
+                'project': project,
+                'message': f'Projet "{project.name}" mis à jour avec succès'
             }
+        else:
+            return failure_result(f'Projet non trouvé avec l\'ID {project.project_id}')
 
     def create_project_with_units(self, project_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -371,7 +493,6 @@ class ProjectService:
             self._validate_project_data_dict(project_data)
 
             # Adapter les données pour la nouvelle structure
-            import uuid
             adapted_data = self._adapt_project_data(project_data)
 
             # Création du projet avec la nouvelle structure
@@ -381,7 +502,7 @@ class ProjectService:
             # Pas besoin de validation supplémentaire ici
 
             # Vérifier l'unicité du nom
-            if any(p.name.lower() == project.name.lower() for p in self._projects):
+            if self._is_project_name_taken(project.name):
                 raise DuplicateProjectError('name', project.name)
 
             # Générer automatiquement les unités pour le projet
@@ -391,47 +512,30 @@ class ProjectService:
             project.units = units
 
             # Sauvegarder le projet en base de données
-            project_id = self.project_repository.save_project(project)
-
-            # Recharger les projets depuis la base ET récupérer le projet sauvegardé
-            self._load_projects()
+            self._save(project)
+            project_id = project.project_id
 
-            # Trouver le projet sauvegardé avec le bon ID pour retourner l'objet cohérent
-            saved_project = next((p for p in self._projects if p.project_id == project_id), project)
-
-            logger.info(f"Projet {project.name} créé avec succès (ID: {project_id}) avec {len(saved_project.units)} unités")
+            logger.info(f"Projet {project.name} créé avec succès (ID: {project_id}) avec {len(project.units)} unités")
             return {
                 'success': True,
-                'project': saved_project,  # Retourner le projet rechargé avec les unités
+                'project': project,
                 'project_id': project_id,
-                'units': saved_project.units,  # Retourner les unités du projet rechargé
-                'message': f'Projet "{project.name}" créé avec succès avec {len(saved_project.units)} unités'
+                'units': project.units,
+                'message': f'Projet "{project.name}" créé avec succès avec {len(project.units)} unités'
             }
 
         except InvalidProjectDataError as e:
-            return {
-                'success': False,
-                'error': str(e)
-            }
+            return failure_result(str(e))
         except DuplicateProjectError as e:
-            return {
-                'success': False,
-                'error': str(e)
-            }
+            return failure_result(str(e))
         except ValueError as e:
             # Erreurs de validation de l'entité Project
-            return {
-                'success': False,
-                'error': str(e)
-            }
+            return failure_result(str(e))
         except Exception as e:
             logger.error(f"Erreur inattendue lors de la création du projet: {e}")
             # Pour les erreurs de repository (save_project), retourner une réponse d'erreur
             if "base de données" in str(e).lower() or "database" in str(e).lower():
-                return {
-                    'success': False,
-                    'error': f'Erreur système: {str(e)}'
-                }
+                return failure_result(f'Erreur système: {str(e)}')
             # Pour les autres erreurs système critiques, lever l'exception métier
             raise ProjectCreationError(f"Erreur système: {str(e)}")
 
@@ -445,53 +549,33 @@ class ProjectService:
         Returns:
             Dict: Données adaptées au nouveau format
         """
-        import uuid
-
         adapted = {}
 
         # Champs obligatoires nouveaux
-        adapted['project_id'] = str(uuid.uuid4())
+        adapted['project_id'] = _uuid4().hex
         adapted['name'] = project_data.get('name', '')
         adapted['address'] = project_data.get('address', '')
         adapted['construction_year'] = int(project_data.get('construction_year', 0))
 
         # Adaptation du statut
-        from src.domain.entities.project import ProjectStatus
         status_str = project_data.get('status', 'PLANNING')
         adapted['status'] = ProjectStatus(status_str) if isinstance(status_str, str) else status_str
 
-        # Adaptation des superficies
-        if 'total_area' in project_data:
-            # Ancien format : total_area (migration vers building_area)
-            adapted['building_area'] = float(project_data['total_area'])
-        elif 'building_area' in project_data:
-            # Nouveau format : building_area
-            adapted['building_area'] = float(project_data['building_area'])
-        else:
-            # Valeur par défaut
-            adapted['building_area'] = float(project_data.get('building_area', 0))
+        # Adaptation des superficies (l'ancien format total_area reste prioritaire)
+        adapted['building_area'] = float(project_data.get('total_area', project_data.get('building_area', 0)))
 
         # Adaptation de la superficie du terrain
         adapted['land_area'] = float(project_data.get('land_area', 0))
 
-        # Adaptation du nombre d'unités
-        if 'unit_count' in project_data:
-            adapted['unit_count'] = int(project_data['unit_count'])
-        elif 'total_units' in project_data:
-            adapted['unit_count'] = int(project_data['total_units'])
-        else:
-            adapted['unit_count'] = int(project_data.get('unit_count', project_data.get('total_units', 0)))
+        # Adaptation du nombre d'unités (ancien format : total_units)
+        adapted['unit_count'] = int(project_data.get('unit_count', project_data.get('total_units', 0)))
 
-        # Adaptation du constructeur
-        if 'constructor' in project_data:
-            adapted['constructor'] = project_data['constructor']
-        elif 'builder_name' in project_data:
-            adapted['constructor'] = project_data['builder_name']
-        else:
-            adapted['constructor'] = project_data.get('constructor', project_data.get('builder_name', ''))
+        # Adaptation du constructeur (ancien format : builder_name)
+        adapted['constructor'] = project_data.get('constructor', project_data.get('builder_name', ''))
 
         return adapted
 
+    @service_result("le calcul des statistiques", "Impossible de calculer les statistiques")
     def get_project_statistics(self, project_id: str) -> Dict[str, Any]:
         """
         Calcule les statistiques d'un projet existant
@@ -502,47 +586,66 @@ class ProjectService:
         Returns:
             Dict contenant les statistiques du projet
         """
-        try:
-            logger.debug(f"Calcul des statistiques pour le projet ID: {project_id}")
+        logger.debug("Calcul des statistiques pour le projet ID: %s", project_id)
 
-            # Recharger les projets depuis la base pour avoir les dernières données
-            self._load_projects()
-            logger.debug(f"Projets disponibles: {[p.project_id for p in self._projects]}")
+        # Trouver le projet par ID (cache invalidé par chaque écriture ou expiré)
+        project = self._get_project_cached(project_id)
 
-            # Trouver le projet par ID
-            project = next((p for p in self._projects if p.project_id == project_id), None)
+        if not project:
+            return failure_result(f"Projet avec l'ID '{project_id}' non trouvé")
 
-            if not project:
-                return {
-                    'success': False,
-                    'error': f"Projet avec l'ID '{project_id}' non trouvé"
-                }
+        # Agrégation des unités par SQLite (GROUP BY), mémorisée jusqu'à la prochaine écriture ou expiration
+        stats = self._get_statistics_cached(project_id)
 
-            logger.debug(f"Projet sélectionné: {project.name} avec {len(project.units)} unités")
+        logger.info("Statistiques calculées pour %s: %s/%s unités occupées", project.name, stats['occupied_units'], stats['total_units'])
 
-            # Calcul des statistiques basé sur les unités EXISTANTES du projet
-            stats = project.get_project_statistics()
+        return {
+            'success': True,
+            'statistics': stats,
+            'project_name': project.name,
+            'project_id': project_id
+        }
 
-            logger.info(f"Statistiques calculées pour {project.name}: {stats['occupied_units']}/{stats['total_units']} unités occupées")
+    @service_result("le calcul des statistiques des unités", "Impossible de calculer les statistiques")
+    def get_units_overview(self) -> Dict[str, Any]:
+        """
+        Calcule les statistiques de toutes les unités, tous projets confondus.
 
-            # Sauvegarder le projet pour s'assurer que les modifications d'unités sont persistées
-            self.project_repository.save_project(project)
-            logger.debug(f"Projet {project.name} resauvegardé avec les modifications d'unités")
+        Les totaux proviennent d'un GROUP BY SQLite et sont mémorisés
+        jusqu'à la prochaine écriture ou leur expiration.
 
-            return {
-                'success': True,
-                'statistics': stats,
-                'project_name': project.name,
-                'project_id': project_id
+        Returns:
+            Dict contenant les statistiques (nombre d'unités par type, disponibles, frais totaux)
+        """
+        stats = self._cache.get(_UNITS_OVERVIEW_KEY)
+        if stats is None:
+            total_units = 0
+            available_units = 0
+            total_fees = 0.0
+            units_by_type = {unit_type.value: 0 for unit_type in UnitType}
+
+            for status, unit_type, count, fees in self.project_repository.get_unit_totals():
+                total_units += count
+                total_fees += fees
+                units_by_type[unit_type] += count
+                if status == UnitStatus.AVAILABLE:
+                    available_units += count
+
+            stats = {
+                'total_units': total_units,
+                'available_units': available_units,
+                'occupied_units': total_units - available_units,
+                'units_by_type': units_by_type,
+                'total_monthly_fees': total_fees
             }
+            self._cache.set(_UNITS_OVERVIEW_KEY, stats, {ALL_PROJECTS_TAG}, ttl=PROJECT_CACHE_TTL_SECONDS)
 
-        except Exception as e:
-            logger.error(f"Erreur lors du calcul des statistiques: {e}")
-            return {
-                'success': False,
-                'error': f"Impossible de calculer les statistiques: {str(e)}"
-            }
+        return {
+            'success': True,
+            'statistics': {**stats, 'units_by_type': dict(stats['units_by_type'])}
+        }
 
+    @service_result("la mise à jour des unités")
     def update_project_units(self, project_id: str, new_unit_count: int, project_instance: Project = None) -> Dict[str, Any]:
         """
         Met à jour le nombre d'unités d'un projet existant
@@ -555,46 +658,37 @@ class ProjectService:
         Returns:
             Dict contenant le résultat de l'opération
         """
-        try:
-            logger.info(f"Mise à jour du nombre d'unités pour le projet ID {project_id}: {new_unit_count}")
-
-            # Toujours recharger le projet depuis la base de données pour avoir l'état le plus récent
-            all_projects = self.project_repository.get_all_projects()
-            project = next((p for p in all_projects if p.project_id == project_id), None)
-
-            if not project:
-                from src.domain.exceptions.business_exceptions import UnitNotFoundError
-                raise UnitNotFoundError(f'Projet non trouvé avec l\'ID: {project_id}')
-
-            # Validation du nouveau nombre d'unités
-            from src.domain.exceptions.business_exceptions import InvalidUnitDataError
-            
-            if new_unit_count <= 0 or new_unit_count > 500:
-                raise InvalidUnitDataError("unit_count", "doit être entre 1 et 500")
-
-            # Mise à jour des unités
-            old_count = len(project.units)  # Utiliser le nombre d'unités actuelles
-            additional_units = project.add_units(new_unit_count - old_count)
+        logger.info(f"Mise à jour du nombre d'unités pour le projet ID {project_id}: {new_unit_count}")
 
-            # Sauvegarde réelle dans la base de données
-            self.project_repository.save_project(project)
+        # Cache invalidé par chaque écriture, expiré après PROJECT_CACHE_TTL_SECONDS (écritures d'autres processus)
+        project = self._get_project_cached(project_id)
 
-            logger.info(f"Unités mises à jour pour {project.name}: {old_count} → {new_unit_count}")
-            return {
-                'success': True,
-                'project': project,
-                'added_units': additional_units,
-                'message': f"Nombre d'unités mis à jour: {old_count} → {new_unit_count}"
-            }
+        if not project:
+            from src.domain.exceptions.business_exceptions import UnitNotFoundError
+            raise UnitNotFoundError(f'Projet non trouvé avec l\'ID: {project_id}')
 
-        except Exception as e:
-            logger.error(f"Erreur lors de la mise à jour des unités: {e}")
-            return {
-                'success': False,
-                'error': f"Erreur système: {str(e)}"
-            }
+        # Validation du nouveau nombre d'unités
+        from src.domain.exceptions.business_exceptions import InvalidUnitDataError
+        
+        if new_unit_count <= 0 or new_unit_count > 500:
+            raise InvalidUnitDataError("unit_count", "doit être entre 1 et 500")
+
+        # Mise à jour des unités
+        old_count = len(project.units)  # Utiliser le nombre d'unités actuelles
+        additional_units = project.add_units(new_unit_count - old_count)
+
+        # Sauvegarde réelle dans la base de données
+        self._save(project)
+
+        logger.info(f"Unités mises à jour pour {project.name}: {old_count} → {new_unit_count}")
+        return {
+            'success': True,
+            'project': project,
+            'added_units': additional_units,
+            'message': f"Nombre d'unités mis à jour: {old_count} → {new_unit_count}"
+        }
 
-    def _validate_project_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_creation_payload(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Valide les données d'un projet avant création
 
@@ -604,108 +698,26 @@ class ProjectService:
         Returns:
             Dict avec validation result et message d'erreur si applicable
         """
-        required_fields = ['name', 'address', 'building_area', 'construction_year', 'unit_count', 'constructor']
-
         # Vérification des champs requis
-        field_translations = {
-            'name': 'nom du projet',
-            'address': 'adresse',
-            'building_area': 'superficie du bâtiment',
-            'construction_year': 'année de construction',
-            'unit_count': 'nombre d\'unités',
-            'constructor': 'constructeur'
-        }
-
-        for field in required_fields:
-            if field not in data or not data[field]:
-                field_name = field_translations.get(field, field)
+        for field, field_name in _REQUIRED_PROJECT_FIELDS:
+            if not data.get(field):
                 return {
                     'valid': False,
                     'error': f"Le {field_name} est obligatoire"
                 }
 
-        # Validations spécifiques
-        if len(data['name'].strip()) < 3:
-            return {
-                'valid': False,
-                'error': "Le nom du projet doit contenir au moins 3 caractères"
-            }
-
-        if len(data['address'].strip()) < 10:
-            return {
-                'valid': False,
-                'error': "L'adresse doit être complète (minimum 10 caractères)"
-            }
-
-        try:
-            building_area = float(data.get('building_area', data.get('total_area', 0)))
-            if building_area <= 0 or building_area > 100000:
-                return {
-                    'valid': False,
-                    'error': "La superficie du bâtiment doit être entre 1 et 100,000 pieds carrés"
-                }
-        except ValueError:
-            return {
-                'valid': False,
-                'error': "La superficie du bâtiment doit être un nombre valide"
-            }
-
-        try:
-            construction_year = int(data['construction_year'])
-            if construction_year < 1900 or construction_year > 2030:
-                return {
-                    'valid': False,
-                    'error': "L'année de construction doit être entre 1900 et 2030"
-                }
-        except ValueError:
-            return {
-                'valid': False,
-                'error': "L'année de construction doit être un nombre valide"
-            }
-
-        try:
-            unit_count = int(data['unit_count'])
-            if unit_count <= 0 or unit_count > 500:
-                return {
-                    'valid': False,
-                    'error': "Le nombre d'unités doit être entre 1 et 500"
-                }
-        except ValueError:
-            return {
-                'valid': False,
-                'error': "Le nombre d'unités doit être un nombre valide"
-            }
-
-        if len(data['constructor'].strip()) < 3:
-            return {
-                'valid': False,
-                'error': "Le nom du constructeur doit contenir au moins 3 caractères"
-            }
+        # Validations spécifiques : conversion puis contrôle de plage
+        for field, coerce, is_valid, range_error, type_error in _PROJECT_FIELD_RULES:
+            try:
+                value = coerce(data[field])
+            except ValueError:
+                return {'valid': False, 'error': type_error}
+            if not is_valid(value):
+                return {'valid': False, 'error': range_error}
 
         return {'valid': True}
 
-    async def _simulate_async_save(self, project: Project, units: List[Unit]) -> bool:
-        """
-        Simule une opération de sauvegarde asynchrone
-
-        Args:
-            project: Projet à sauvegarder
-            units: Liste des unités à sauvegarder
-
-        Returns:
-            True si la sauvegarde réussit
-        """
-        # Simulation d'une opération asynchrone
-        await asyncio.sleep(0.1)  # Simule la latence de base de données
-
-        # Simulation de validation avant sauvegarde
-        if not project or not units:
-            return False
-
-        # Pour les tests, toujours retourner succès
-        # Dans un vrai contexte, ceci ferait appel à la base de données
-        return True
-
+    @service_result("la récupération du résumé", "Impossible de récupérer le résumé")
     def get_all_projects_summary(self) -> Dict[str, Any]:
         """
         Récupère un résumé de tous les projets du système
@@ -713,48 +725,32 @@ class ProjectService:
         Returns:
             Dict contenant la liste des projets avec statistiques de base
         """
-        try:
-            logger.debug("Récupération du résumé de tous les projets")
-
-            # Simulation de récupération de plusieurs projets
-            projects_summary = [
-                {
-                    'name': 'Résidence du Parc',
-                    'total_units': 15,
-                    'occupied_units': 8,
-                    'available_units': 7,
-                    'occupancy_rate': 53.3
-                },
-                {
-                    'name': 'Les Jardins de Ville',
-                    'total_units': 24,
-                    'occupied_units': 18,
-                    'available_units': 6,
-                    'occupancy_rate': 75.0
-                }
-            ]
-
-            total_units = sum(p['total_units'] for p in projects_summary)
-            total_occupied = sum(p['occupied_units'] for p in projects_summary)
-
-            logger.info(f"Résumé calculé: {len(projects_summary)} projets, {total_occupied}/{total_units} unités occupées")
-
-            return {
-                'success': True,
-                'projects': projects_summary,
-                'total_projects': len(projects_summary),
-                'total_units': total_units,
-                'total_occupied': total_occupied,
-                'overall_occupancy': (total_occupied / total_units * 100) if total_units > 0 else 0
-            }
-
-        except Exception as e:
-            logger.error(f"Erreur lors de la récupération du résumé: {e}")
-            return {
-                'success': False,
-                'error': f"Impossible de récupérer le résumé: {str(e)}"
-            }
+        logger.debug("Récupération du résumé de tous les projets")
+
+        # Comptages agrégés par SQLite : une ligne par projet, aucune unité matérialisée
+        projects_summary = self.project_repository.get_projects_summary()
+
+        total_units = 0
+        total_occupied = 0
+        for summary in projects_summary:
+            units = summary['total_units']
+            occupied = summary['occupied_units']
+            summary['occupancy_rate'] = round(occupied / units * 100, 1) if units > 0 else 0.0
+            total_units += units
+            total_occupied += occupied
+
+        logger.info(f"Résumé calculé: {len(projects_summary)} projets, {total_occupied}/{total_units} unités occupées")
+
+        return {
+            'success': True,
+            'projects': projects_summary,
+            'total_projects': len(projects_summary),
+            'total_units': total_units,
+            'total_occupied': total_occupied,
+            'overall_occupancy': (total_occupied / total_units * 100) if total_units > 0 else 0
+        }
 
+    @service_result("le transfert de propriété", "Erreur lors du transfert")
     def transfer_unit_ownership(self, project_id: str, unit_number: str, new_owner: str, transfer_date=None) -> Dict[str, Any]:
         """
         Transfère la propriété d'une unité et sauvegarde automatiquement le projet.
@@ -768,45 +764,32 @@ class ProjectService:
         Returns:
             Dict: Résultat de l'opération
         """
-        try:
-            # Trouver le projet
-            project = next((p for p in self._projects if p.project_id == project_id), None)
-            if not project:
-                return {
-                    'success': False,
-                    'error': f'Projet non trouvé avec l\'ID {project_id}'
-                }
+        # Cache invalidé par chaque écriture, expiré après PROJECT_CACHE_TTL_SECONDS (écritures d'autres processus)
+        project = self._get_project_cached(project_id)
+        if not project:
+            return failure_result(f'Projet non trouvé avec l\'ID {project_id}')
 
-            # Trouver l'unité
-            unit = next((u for u in project.units if u.unit_number == unit_number), None)
-            if not unit:
-                return {
-                    'success': False,
-                    'error': f'Unité {unit_number} non trouvée dans le projet {project.name}'
-                }
+        # Trouver l'unité
+        unit = next((u for u in project.units if u.unit_number == unit_number), None)
+        if not unit:
+            return failure_result(f'Unité {unit_number} non trouvée dans le projet {project.name}')
 
-            # Effectuer le transfert
-            unit.transfer_ownership(new_owner, transfer_date)
+        # Effectuer le transfert
+        unit.transfer_ownership(new_owner, transfer_date)
 
-            # Sauvegarder automatiquement le projet modifié
-            self.project_repository.save_project(project)
+        # Sauvegarder automatiquement le projet modifié
+        self._save(project)
 
-            logger.info(f"Transfert réussi: Unité {unit_number} du projet {project.name} → {new_owner}")
+        logger.info(f"Transfert réussi: Unité {unit_number} du projet {project.name} → {new_owner}")
 
-            return {
-                'success': True,
-                'project': project,
-                'unit': unit,
-                'message': f'Unité {unit_number} transférée à {new_owner} avec succès'
-            }
-
-        except Exception as e:
-            logger.error(f"Erreur lors du transfert de propriété: {e}")
-            return {
-                'success': False,
-                'error': f'Erreur lors du transfert: {str(e)}'
-            }
+        return {
+            'success': True,
+            'project': project,
+            'unit': unit,
+            'message': f'Unité {unit_number} transférée à {new_owner} avec succès'
+        }
 
+    @service_result("les transferts multiples", "Erreur lors des transferts")
     def transfer_multiple_units(self, project_id: str, transfers: List[Dict[str, str]]) -> Dict[str, Any]:
         """
         Transfère la propriété de plusieurs unités en une seule opération.
@@ -818,74 +801,69 @@ class ProjectService:
         Returns:
             Dict: Résultat de l'opération avec statistiques
         """
-        try:
-            # Recharger le projet depuis la base de données pour avoir les dernières données
-            all_projects = self.project_repository.get_all_projects()
-            project = next((p for p in all_projects if p.project_id == project_id), None)
-            if not project:
-                return {
-                    'success': False,
-                    'error': f'Projet non trouvé avec l\'ID {project_id}'
-                }
-
-            successful_transfers = []
-            failed_transfers = []
-
-            # Effectuer tous les transferts
-            for transfer in transfers:
-                unit_number = transfer.get('unit_number')
-                new_owner = transfer.get('new_owner')
-
-                if not unit_number or not new_owner:
-                    failed_transfers.append({
-                        'unit_number': unit_number,
-                        'error': 'Données de transfert incomplètes'
-                    })
-                    continue
-
-                # Trouver l'unité
-                unit = next((u for u in project.units if u.unit_number == unit_number), None)
-                if not unit:
-                    failed_transfers.append({
-                        'unit_number': unit_number,
-                        'error': f'Unité non trouvée'
-                    })
-                    continue
-
-                try:
-                    # Effectuer le transfert
-                    unit.transfer_ownership(new_owner)
-                    successful_transfers.append({
-                        'unit_number': unit_number,
-                        'new_owner': new_owner
-                    })
-                except Exception as e:
-                    failed_transfers.append({
-                        'unit_number': unit_number,
-                        'error': str(e)
-                    })
-
-            # Sauvegarder le projet avec tous les changements
-            if successful_transfers:
-                self.project_repository.save_project(project)
-
-            logger.info(f"Transferts effectués: {len(successful_transfers)} réussis, {len(failed_transfers)} échoués")
+        # Cache invalidé par chaque écriture, expiré après PROJECT_CACHE_TTL_SECONDS (écritures d'autres processus)
+        project = self._get_project_cached(project_id)
+        if not project:
+            return failure_result(f'Projet non trouvé avec l\'ID {project_id}')
+
+        successful_transfers = []
+        failed_transfers = []
+
+        # Index des unités par numéro, construit une seule fois pour tout le lot
+        units_by_number = {u.unit_number: u for u in project.units}
+        bulk_rows = []
+
+        # Effectuer tous les transferts, horodatés une seule fois pour le lot
+        now = datetime.now()
+        for transfer in transfers:
+            unit_number = transfer.get('unit_number')
+            new_owner = transfer.get('new_owner')
+
+            if not unit_number or not new_owner:
+                failed_transfers.append({
+                    'unit_number': unit_number,
+                    'error': 'Données de transfert incomplètes'
+                })
+                continue
 
-            return {
-                'success': len(successful_transfers) > 0,
-                'project': project,
-                'successful_transfers': successful_transfers,
-                'failed_transfers': failed_transfers,
-                'message': f'{len(successful_transfers)} transferts réussis sur {len(transfers)} tentatives'
-            }
+            # Trouver l'unité
+            unit = units_by_number.get(unit_number)
+            if not unit:
+                failed_transfers.append({
+                    'unit_number': unit_number,
+                    'error': f'Unité non trouvée'
+                })
+                continue
 
-        except Exception as e:
-            logger.error(f"Erreur lors des transferts multiples: {e}")
-            return {
-                'success': False,
-                'error': f'Erreur lors des transferts: {str(e)}'
-            }
+            try:
+                # Effectuer le transfert
+                unit.transfer_ownership(new_owner, now=now)
+                successful_transfers.append({
+                    'unit_number': unit_number,
+                    'new_owner': new_owner
+                })
+                bulk_rows.append((unit_number, new_owner, unit.status.value))
+            except Exception as e:
+                failed_transfers.append({
+                    'unit_number': unit_number,
+                    'error': str(e)
+                })
+
+        # Persister uniquement les unités transférées, en une seule transaction
+        if bulk_rows:
+            self._write(self.project_repository.transfer_units_bulk, project_id, bulk_rows, project_id=project_id)
+
+        logger.info(f"Transferts effectués: {len(successful_transfers)} réussis, {len(failed_transfers)} échoués")
+
+        return {
+            'success': len(successful_transfers) > 0,
+            'project': project,
+            'successful_transfers': successful_transfers,
+            'failed_transfers': failed_transfers,
+            'message': f'{len(successful_transfers)} transferts réussis sur {len(transfers)} tentatives'
+        }
 
+    @service_result("le calcul des statistiques par ID", "Erreur lors du calcul")
     def get_project_statistics_by_id(self, project_id: str) -> Dict[str, Any]:
         """
         Calcule les statistiques d'un projet par son ID.
@@ -896,39 +874,26 @@ class ProjectService:
         Returns:
             Dict: Résultat avec les statistiques
         """
-        try:
-            # Recharger les projets depuis la base pour avoir les dernières données
-            self._load_projects()
+        # Trouver le projet par ID (cache invalidé par chaque écriture ou expiré)
+        project = self._get_project_cached(project_id)
 
-            # Trouver le projet par ID
-            project = next((p for p in self._projects if p.project_id == project_id), None)
-
-            if not project:
-                return {
-                    'success': False,
-                    'error': f'Projet non trouvé avec l\'ID {project_id}'
-                }
+        if not project:
+            return failure_result(f'Projet non trouvé avec l\'ID {project_id}')
 
-            # Calculer les statistiques
-            stats = project.get_project_statistics()
+        # Calculer les statistiques par agrégation SQL, mémorisées jusqu'à la prochaine écriture ou expiration
+        stats = self._get_statistics_cached(project_id)
 
-            logger.info(f"Statistiques calculées pour {project.name}: {stats['occupied_units']}/{stats['total_units']} unités occupées")
+        logger.info("Statistiques calculées pour %s: %s/%s unités occupées", project.name, stats['occupied_units'], stats['total_units'])
 
-            return {
-                'success': True,
-                'statistics': stats,
-                'project_name': project.name,
-                'project_id': project_id,
-                'total_units': stats['total_units']
-            }
-
-        except Exception as e:
-            logger.error(f"Erreur lors du calcul des statistiques par ID: {e}")
-            return {
-                'success': False,
-                'error': f'Erreur lors du calcul: {str(e)}'
-            }
+        return {
+            'success': True,
+            'statistics': stats,
+            'project_name': project.name,
+            'project_id': project_id,
+            'total_units': stats['total_units']
+        }
 
+    @service_result("la suppression du projet", "Erreur inattendue lors de la suppression")
     def delete_project(self, project_name: str) -> Dict[str, Any]:
         """
         Supprime un projet et toutes ses unités associées par nom.
@@ -940,25 +905,18 @@ class ProjectService:
         Returns:
             Dict: Résultat de l'opération de suppression
         """
-        try:
-            # Utiliser la méthode standardisée pour récupérer le projet par nom
-            result = self.get_project_by_name(project_name)
-
-            if not result['success']:
-                return result
+        # Utiliser la méthode standardisée pour récupérer le projet par nom
+        result = self.get_project_by_name(project_name)
 
-            project = result['project']
+        if not result['success']:
+            return result
 
-            # Déléguer à delete_project_by_id qui est la méthode standardisée
-            return self.delete_project_by_id(project.project_id)
+        project = result['project']
 
-        except Exception as e:
-            logger.error(f"Erreur lors de la suppression du projet {project_name}: {e}")
-            return {
-                'success': False,
-                'error': f'Erreur inattendue lors de la suppression: {str(e)}'
-            }
+        # Déléguer à delete_project_by_id qui est la méthode standardisée
+        return self.delete_project_by_id(project.project_id)
 
+    @service_result("la suppression du projet par ID", "Erreur inattendue lors de la suppression")
     def delete_project_by_id(self, project_id: str) -> Dict[str, Any]:
         """
         Supprime un projet par son ID et toutes ses unités associées.
@@ -969,59 +927,31 @@ class ProjectService:
         Returns:
             Dict: Résultat de l'opération de suppression
         """
-        try:
-            logger.info(f"Début suppression projet par ID: {project_id}")
-
-            # Recharger les projets depuis la base pour avoir les dernières données
-            self._load_projects()
-            logger.debug(f"Projets chargés: {len(self._projects)} projets disponibles")
-            logger.debug(f"IDs des projets disponibles: {[p.project_id for p in self._projects]}")
-
-            # Trouver le projet par ID
-            project = next((p for p in self._projects if p.project_id == project_id), None)
-
-            if not project:
-                logger.error(f"Projet avec l'ID '{project_id}' non trouvé dans la liste des {len(self._projects)} projets")
-                logger.debug(f"IDs disponibles: {[p.project_id for p in self._projects]}")
-                return {
-                    'success': False,
-                    'error': f'Projet avec l\'ID "{project_id}" non trouvé'
-                }
+        logger.info(f"Début suppression projet par ID: {project_id}")
 
-            # Sauvegarder les informations avant suppression pour les logs
-            project_name = project.name
-            total_units = len(project.units) if project.units else 0
-            logger.info(f"Projet trouvé pour suppression: {project_name} avec {total_units} unités")
+        # Lecture des informations et suppression en une seule transaction
+        deletion = self._write(self.project_repository.delete_project_cascade, project_id, project_id=project_id)
+        project_name = deletion['project_name']
+        total_units = deletion['total_units']
 
-            # Supprimer le projet de la base de données
-            success = self.project_repository.delete_project(project_id)
-            logger.info(f"Résultat suppression base de données: {success}")
+        if project_name is None:
+            logger.error(f"Projet avec l'ID '{project_id}' non trouvé")
+            return failure_result(f'Projet avec l\'ID "{project_id}" non trouvé')
 
-            if success:
-                # Retirer le projet de la liste en mémoire
-                self._projects = [p for p in self._projects if p.project_id != project_id]
-
-                logger.info(f"Projet supprimé avec succès par ID: {project_name} (ID: {project_id}, {total_units} unités)")
+        logger.info(f"Résultat suppression base de données: {deletion['deleted']}")
 
-                return {
-                    'success': True,
-                    'message': f'Projet "{project_name}" supprimé avec succès',
-                    'project_name': project_name,
-                    'total_units_deleted': total_units
-                }
-            else:
-                logger.error(f"Échec de la suppression en base de données pour le projet {project_id}")
-                return {
-                    'success': False,
-                    'error': f'Erreur lors de la suppression du projet en base de données'
-                }
+        if deletion['deleted']:
+            logger.info(f"Projet supprimé avec succès par ID: {project_name} (ID: {project_id}, {total_units} unités)")
 
-        except Exception as e:
-            logger.error(f"Erreur lors de la suppression du projet par ID {project_id}: {e}")
             return {
-                'success': False,
-                'error': f'Erreur inattendue lors de la suppression: {str(e)}'
+                'success': True,
+                'message': f'Projet "{project_name}" supprimé avec succès',
+                'project_name': project_name,
+                'total_units_deleted': total_units
             }
+        else:
+            logger.error(f"Échec de la suppression en base de données pour le projet {project_id}")
+            return failure_result(f'Erreur lors de la suppression du projet en base de données')
 
     def get_unit_by_db_id(self, unit_db_id: int) -> Dict[str, Any]:
         """
@@ -1043,7 +973,7 @@ class ProjectService:
 
             if result:
                 unit, project = result
-                logger.debug(f"Unité trouvée: {unit.unit_number} dans le projet {project.name}")
+                logger.debug("Unité trouvée: %s dans le projet %s", unit.unit_number, project.name)
                 return {
                     'success': True,
                     'unit': unit,
@@ -1051,23 +981,14 @@ class ProjectService:
                 }
             else:
                 logger.warning(f"Aucune unité trouvée avec l'ID de base de données: {unit_db_id}")
-                return {
-                    'success': False,
-                    'error': f'Aucune unité trouvée avec l\'ID {unit_db_id}'
-                }
+                return failure_result(f'Aucune unité trouvée avec l\'ID {unit_db_id}')
 
         except ValueError as e:
             logger.error(f"ID invalide pour recherche d'unité: {unit_db_id}")
-            return {
-                'success': False,
-                'error': f'ID invalide: {unit_db_id}'
-            }
+            return failure_result(f'ID invalide: {unit_db_id}')
         except Exception as e:
             logger.error(f"Erreur lors de la récupération de l'unité ID {unit_db_id}: {e}")
-            return {
-                'success': False,
-                'error': f'Erreur système: {str(e)}'
-            }
+            return failure_result(f'Erreur système: {str(e)}')
 
     def update_unit_by_id(self, unit_id: int, unit_data: dict) -> Dict[str, Any]:
         """
@@ -1104,11 +1025,12 @@ class ProjectService:
                     raise InvalidUnitDataError("area", "doit être un nombre valide")
             
             # Mettre à jour directement dans la base de données
-            success = self.project_repository.update_unit(unit_id, unit_data)
+            success = self._write(self.project_repository.update_unit, unit_id, unit_data)
 
             if success:
-                # Recharger les projets pour synchroniser la mémoire
-                self._load_projects()
+                # Seules la liste des projets et les entrées du projet de l'unité sont touchées
+                tags = success.invalidation_tags if isinstance(success, SaveResult) else {ALL_PROJECTS_TAG}
+                self._invalidate(tags)
 
                 logger.info(f"Unité {unit_id} mise à jour avec succès")
                 return {
@@ -1122,7 +1044,4 @@ class ProjectService:
             raise
         except Exception as e:
             logger.error(f"Erreur lors de la mise à jour de l'unité {unit_id}: {e}")
-            return {
-                'success': False,
-                'error': f'Erreur système: {str(e)}'
-            }
+            return failure_result(f'Erreur système: {str(e)}')
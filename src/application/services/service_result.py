@@ -0,0 +1,61 @@
+"""
+Résultats de service : fabrique d'échec et décorateur.
+
+Centralise les motifs répétés dans les services applicatifs :
+le dictionnaire d'échec {'success': False, 'error': ...} et la séquence
+try / except Exception / log d'erreur / retour d'un résultat d'échec.
+"""
+
+import functools
+from typing import Any, Callable, Dict, TypeVar
+
+from src.infrastructure.logger_manager import get_logger
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+# Valeur sentinelle : retourner le dictionnaire d'échec standard
+_FAILURE_DICT = object()
+
+
+def failure_result(error: str) -> Dict[str, Any]:
+    """
+    Construit le résultat d'échec standard d'une méthode de service.
+
+    Args:
+        error: Message d'erreur destiné à l'appelant
+
+    Returns:
+        Dict: {'success': False, 'error': error}
+    """
+    return {'success': False, 'error': error}
+
+
+def service_result(action: str, error_message: str = 'Erreur système', default: Any = _FAILURE_DICT) -> Callable[[F], F]:
+    """
+    Convertit toute exception non gérée d'une méthode de service en résultat d'échec.
+
+    Args:
+        action: Libellé de l'opération pour le journal (ex: "la suppression du projet")
+        error_message: Préfixe du message d'erreur retourné à l'appelant
+        default: Valeur retournée en cas d'erreur à la place de
+                 {'success': False, 'error': f'{error_message}: {e}'}
+
+    Returns:
+        Décorateur à appliquer à la méthode
+    """
+    def decorate(method: F) -> F:
+        logger = get_logger(method.__module__)
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            except Exception as e:
+                logger.error("Erreur lors de %s: %s", action, e)
+                if default is not _FAILURE_DICT:
+                    return default
+                return failure_result(f'{error_message}: {e}')
+
+        return wrapper
+
+    return decorate
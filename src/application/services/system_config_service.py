@@ -9,7 +9,10 @@ from src.infrastructure.logger_manager import get_logger
 logger = get_logger(__name__)
 
 from typing import Dict, Any, Optional
-from src.adapters.system_config_repository_sqlite import SystemConfigRepositorySQLite
+from src.adapters.system_config_repository_sqlite import SystemConfigRepositorySQLite, parse_boolean_config
+from src.application.services.service_result import service_result
+
+ADMIN_PASSWORD_CHANGED_KEY = 'admin_password_changed'
 
 class SystemConfigService:
     """
@@ -29,21 +32,25 @@ class SystemConfigService:
             system_config_repository: Repository pour l'accès aux configurations système
         """
         self.system_config_repository = system_config_repository or SystemConfigRepositorySQLite()
+        # Statut du mot de passe admin mémorisé : lu à chaque requête, modifié rarement
+        self._admin_password_changed: Optional[bool] = None
         logger.debug("SystemConfigService initialisé")
 
+    @service_result("la vérification du statut admin password", default=False)
     def is_admin_password_changed(self) -> bool:
         """
         Vérifie si l'administrateur a changé son mot de passe par défaut.
+        La valeur est mémorisée jusqu'à la prochaine écriture de cette configuration.
 
         Returns:
             True si le mot de passe admin a été changé, False sinon
         """
-        try:
-            return self.system_config_repository.get_boolean_config('admin_password_changed', False)
-        except Exception as e:
-            logger.error(f"Erreur lors de la vérification du statut admin password: {e}")
-            return False
+        if self._admin_password_changed is not None:
+            return self._admin_password_changed
+        self._admin_password_changed = self.system_config_repository.get_boolean_config(ADMIN_PASSWORD_CHANGED_KEY, False)
+        return self._admin_password_changed
 
+    @service_result("la mise à jour du statut admin password", default=False)
     def mark_admin_password_changed(self) -> bool:
         """
         Marque que l'administrateur a changé son mot de passe.
@@ -51,19 +58,17 @@ class SystemConfigService:
         Returns:
             True si la mise à jour réussit, False sinon
         """
-        try:
-            success = self.system_config_repository.set_boolean_config(
-                'admin_password_changed', 
-                True, 
-                'Indique si l\'administrateur a changé son mot de passe par défaut'
-            )
-            if success:
-                logger.info("Statut admin password marqué comme changé")
-            return success
-        except Exception as e:
-            logger.error(f"Erreur lors de la mise à jour du statut admin password: {e}")
-            return False
-
+        success = self.system_config_repository.set_boolean_config(
+            ADMIN_PASSWORD_CHANGED_KEY, 
+            True, 
+            'Indique si l\'administrateur a changé son mot de passe par défaut'
+        )
+        if success:
+            self._admin_password_changed = True
+            logger.info("Statut admin password marqué comme changé")
+        return success
+
+    @service_result("la remise à zéro du statut admin password", default=False)
     def reset_admin_password_status(self) -> bool:
         """
         Remet à zéro le statut de changement de mot de passe admin.
@@ -72,18 +77,15 @@ class SystemConfigService:
         Returns:
             True si la remise à zéro réussit, False sinon
         """
-        try:
-            success = self.system_config_repository.set_boolean_config(
-                'admin_password_changed', 
-                False, 
-                'Indique si l\'administrateur a changé son mot de passe par défaut'
-            )
-            if success:
-                logger.info("Statut admin password remis à zéro")
-            return success
-        except Exception as e:
-            logger.error(f"Erreur lors de la remise à zéro du statut admin password: {e}")
-            return False
+        success = self.system_config_repository.set_boolean_config(
+            ADMIN_PASSWORD_CHANGED_KEY, 
+            False, 
+            'Indique si l\'administrateur a changé son mot de passe par défaut'
+        )
+        if success:
+            self._admin_password_changed = False
+            logger.info("Statut admin password remis à zéro")
+        return success
 
     def is_system_setup_completed(self) -> bool:
         """
@@ -107,6 +109,7 @@ class SystemConfigService:
             'setup_completed': self.is_system_setup_completed()
         }
 
+    @service_result("la récupération d'une configuration", default=None)
     def get_config_value(self, config_key: str) -> Optional[str]:
         """
         Récupère une valeur de configuration.
@@ -117,12 +120,9 @@ class SystemConfigService:
         Returns:
             Valeur de configuration ou None
         """
-        try:
-            return self.system_config_repository.get_config_value(config_key)
-        except Exception as e:
-            logger.error(f"Erreur lors de la récupération de la configuration {config_key}: {e}")
-            return None
+        return self.system_config_repository.get_config_value(config_key)
 
+    @service_result("la mise à jour d'une configuration", default=False)
     def set_config_value(self, config_key: str, config_value: str, config_type: str = 'string', description: str = None) -> bool:
         """
         Définit une valeur de configuration.
@@ -136,11 +136,8 @@ class SystemConfigService:
         Returns:
             True si la mise à jour réussit
         """
-        try:
-            return self.system_config_repository.set_config_value(config_key, config_value, config_type, description)
-        except Exception as e:
-            logger.error(f"Erreur lors de la mise à jour de la configuration {config_key}: {e}")
-            return False
+        self._forget_cached_config(config_key)
+        return self.system_config_repository.set_config_value(config_key, config_value, config_type, description)
 
     def get_boolean_config(self, config_key: str, default_value: bool = False) -> bool:
         """
@@ -159,6 +156,7 @@ class SystemConfigService:
             logger.error(f"Erreur lors de la récupération de la configuration booléenne {config_key}: {e}")
             return default_value
 
+    @service_result("la mise à jour d'une configuration booléenne", default=False)
     def set_boolean_config(self, config_key: str, config_value: bool, description: str = None) -> bool:
         """
         Définit une configuration booléenne.
@@ -171,12 +169,29 @@ class SystemConfigService:
         Returns:
             True si la mise à jour réussit
         """
-        try:
-            return self.system_config_repository.set_boolean_config(config_key, config_value, description)
-        except Exception as e:
-            logger.error(f"Erreur lors de la mise à jour de la configuration booléenne {config_key}: {e}")
-            return False
+        success = self.system_config_repository.set_boolean_config(config_key, config_value, description)
+        if success and config_key == ADMIN_PASSWORD_CHANGED_KEY:
+            self._admin_password_changed = config_value
+        return success
+
+    @service_result("la mise à jour groupée de configurations booléennes", default=False)
+    def set_boolean_configs(self, configs: Dict[str, bool], description: str = None) -> bool:
+        """
+        Définit plusieurs configurations booléennes en une seule transaction.
 
+        Args:
+            configs: Dictionnaire clé de configuration -> valeur booléenne
+            description: Description optionnelle
+
+        Returns:
+            True si toutes les mises à jour réussissent
+        """
+        success = self.system_config_repository.set_boolean_configs(configs, description)
+        if success and ADMIN_PASSWORD_CHANGED_KEY in configs:
+            self._admin_password_changed = configs[ADMIN_PASSWORD_CHANGED_KEY]
+        return success
+
+    @service_result("la suppression d'une configuration", default=False)
     def delete_config(self, config_key: str) -> bool:
         """
         Supprime une configuration.
@@ -187,11 +202,13 @@ class SystemConfigService:
         Returns:
             True si la suppression réussit
         """
-        try:
-            return self.system_config_repository.delete_config(config_key)
-        except Exception as e:
-            logger.error(f"Erreur lors de la suppression de la configuration {config_key}: {e}")
-            return False
+        self._forget_cached_config(config_key)
+        return self.system_config_repository.delete_config(config_key)
+
+    def _forget_cached_config(self, config_key: str) -> None:
+        """Oublie la valeur mémorisée d'une configuration sur le point d'être modifiée."""
+        if config_key == ADMIN_PASSWORD_CHANGED_KEY:
+            self._admin_password_changed = None
 
     def get_all_system_configs(self) -> Dict[str, Any]:
         """
@@ -200,12 +217,31 @@ class SystemConfigService:
         Returns:
             Dictionnaire avec toutes les configurations
         """
+        try:
+            configs = {config['config_key']: config for config in self.system_config_repository.get_all_configs()}
+            # Lecture complète : en profiter pour mémoriser le statut admin
+            admin_config = configs.get(ADMIN_PASSWORD_CHANGED_KEY)
+            self._admin_password_changed = parse_boolean_config(admin_config['config_value'] if admin_config else None)
+            return configs
+        except Exception as e:
+            logger.error(f"Erreur lors de la récupération des configurations système: {e}")
+            return {}
+
+    def get_status_bulk(self) -> Dict[str, bool]:
+        """
+        Récupère toutes les configurations sous forme booléenne en une seule requête.
+
+        Returns:
+            Dictionnaire clé de configuration -> valeur booléenne
+        """
         try:
             configs = self.system_config_repository.get_all_configs()
-            return {config['config_key']: config for config in configs}
         except Exception as e:
             logger.error(f"Erreur lors de la récupération des configurations système: {e}")
             return {}
+        flags = {config['config_key']: parse_boolean_config(config['config_value']) for config in configs}
+        self._admin_password_changed = flags.get(ADMIN_PASSWORD_CHANGED_KEY, False)
+        return flags
 
     def validate_system_security(self) -> Dict[str, Any]:
         """
@@ -214,15 +250,15 @@ class SystemConfigService:
         Returns:
             Rapport de validation de sécurité
         """
-        validation_report = {
-            'admin_password_changed': self.is_admin_password_changed(),
-            'security_level': 'HIGH' if self.is_admin_password_changed() else 'LOW',
-            'recommendations': []
-        }
-
-        if not self.is_admin_password_changed():
-            validation_report['recommendations'].append(
-                'Changer le mot de passe administrateur par défaut immédiatement'
-            )
+        if self.is_admin_password_changed():
+            return {
+                'admin_password_changed': True,
+                'security_level': 'HIGH',
+                'recommendations': []
+            }
 
-        return validation_report
+        return {
+            'admin_password_changed': False,
+            'security_level': 'LOW',
+            'recommendations': ['Changer le mot de passe administrateur par défaut immédiatement']
+        }
@@ -12,10 +12,31 @@ Service créé pour satisfaire les tests existants (phase GREEN).
 from src.infrastructure.logger_manager import get_logger
 logger = get_logger(__name__)
 
+import asyncio
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional
 from src.domain.entities.user import User, UserRole
 from src.adapters.user_repository_sqlite import UserRepositorySQLite
 from src.domain.exceptions.business_exceptions import UserNotFoundError
+from src.infrastructure.background_loop import get_background_loop
+from src.infrastructure.cache_manager import TaggedCache
+
+# Étiquette de cache commune à toutes les lectures d'utilisateurs
+USERS_TAG = 'users'
+
+# Durée de vie des lectures en cache : d'autres chemins (authentification,
+# création de comptes) écrivent dans la table users sans passer par ce service
+USER_CACHE_TTL_SECONDS = 5
+
+# Nombre de lignes de la liste dont les détails sont préchargés dans le cache
+PREFETCH_DETAILS_COUNT = 20
+
+# Noms d'affichage (immuables) des rôles utilisateur
+_ROLE_DISPLAY_NAMES = MappingProxyType({
+    UserRole.ADMIN: "Administrateur",
+    UserRole.RESIDENT: "Résident",
+    UserRole.GUEST: "Invité"
+})
 
 class UserService:
     """
@@ -25,6 +46,8 @@ class UserService:
 
     """
 
+    __slots__ = ('user_repository', '_background_loop', '_cache')
+
     def __init__(self, user_repository: Optional[UserRepositorySQLite] = None):
         """
         Initialise le service utilisateur avec son repository.
@@ -33,12 +56,20 @@ class UserService:
             user_repository: Repository pour accéder aux données utilisateur
         """
         self.user_repository = user_repository or UserRepositorySQLite()
+        self._background_loop = get_background_loop()
+
+        # Cache partagé par base de données ; privé si le repository n'a pas de chemin (mocks)
+        db_path = getattr(self.user_repository, 'db_path', None)
+        self._cache = TaggedCache.shared(f'users:{db_path}') if isinstance(db_path, str) else TaggedCache()
         logger.debug("Service utilisateur initialisé")
 
     def _run_async_operation(self, async_func, *args, **kwargs):
         """
         Utilitaire pour exécuter des opérations asynchrones de manière synchrone.
 
+        La coroutine est transmise à la boucle d'arrière-plan partagée plutôt
+        que d'obtenir ou de créer une boucle d'événements à chaque appel.
+
         Args:
             async_func: Fonction asynchrone à exécuter
             *args: Arguments positionnels
@@ -47,15 +78,54 @@ class UserService:
         Returns:
             Résultat de la fonction asynchrone
         """
-        import asyncio
+        return self._background_loop.run(async_func(*args, **kwargs))
 
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+    def _run_cached(self, key: str, async_func, *args):
+        """
+        Exécute une lecture asynchrone en réutilisant un résultat récent.
+
+        Les résultats vides (utilisateur absent) ne sont pas mis en cache.
+
+        Args:
+            key: Clé de cache de la lecture
+            async_func: Lecture asynchrone du repository
+            *args: Arguments de la lecture
+
+        Returns:
+            Résultat de la lecture, éventuellement issu du cache
+        """
+        result = self._cache.get(key)
+        if result is None:
+            result = self._run_async_operation(async_func, *args)
+            if result is not None:
+                self._cache.set(key, result, {USERS_TAG}, ttl=USER_CACHE_TTL_SECONDS)
+        return result
+
+    def clear_cache(self) -> None:
+        """Oublie toutes les lectures d'utilisateurs en cache."""
+        self._cache.invalidate({USERS_TAG})
+
+    def _get_user_cached(self, username: str) -> Optional[User]:
+        """Récupère un utilisateur par son nom, via le cache de lecture."""
+        return self._run_cached(f'user:{username}', self.user_repository.get_user_by_username, username)
+
+    def _remember_users(self, users: List[User]) -> None:
+        """Place des utilisateurs déjà lus dans le cache des lectures par nom."""
+        for user in users:
+            self._cache.set(f'user:{user.username}', user, {USERS_TAG}, ttl=USER_CACHE_TTL_SECONDS)
+
+    def prefetch_details(self, usernames: List[str]) -> None:
+        """
+        Précharge dans le cache les utilisateurs dont les détails seront probablement consultés.
 
-        return loop.run_until_complete(async_func(*args, **kwargs))
+        Les noms absents du cache sont lus en une seule requête groupée.
+
+        Args:
+            usernames: Noms d'utilisateur à précharger
+        """
+        missing = [username for username in usernames if self._cache.get(f'user:{username}') is None]
+        if missing:
+            self._remember_users(list(self.get_users_by_usernames(missing).values()))
 
     def get_all_users(self) -> List[User]:
         """
@@ -65,7 +135,7 @@ class UserService:
             Liste des utilisateurs
         """
         try:
-            users = self._run_async_operation(self.user_repository.get_all_users)
+            users = self._run_cached('users:all', self.user_repository.get_all_users)
             logger.info(f"Récupération de {len(users)} utilisateurs depuis la base")
             return users
         except Exception as e:
@@ -76,86 +146,55 @@ class UserService:
         """
         Calcule les statistiques des utilisateurs par rôle.
 
+        Les compteurs proviennent d'une requête GROUP BY : aucun utilisateur
+        n'est chargé en mémoire.
+
         Returns:
             Dictionnaire avec les compteurs par rôle
         """
         try:
-            users = self.get_all_users()
+            role_counts = self._run_cached('users:role_counts', self.user_repository.get_role_counts)
 
             stats = {
-                'admin_count': 0,
-                'resident_count': 0,
-                'total_count': len(users)
+                'admin_count': role_counts.get(UserRole.ADMIN.value, 0),
+                'resident_count': role_counts.get(UserRole.RESIDENT.value, 0),
+                'total_count': sum(role_counts.values())
             }
 
-            for user in users:
-                if user.role == UserRole.ADMIN:
-                    stats['admin_count'] += 1
-                elif user.role == UserRole.RESIDENT:
-                    stats['resident_count'] += 1
-
-            logger.debug(f"Statistiques calculées: {stats}")
+            logger.debug("Statistiques calculées: %s", stats)
             return stats
 
         except Exception as e:
             logger.error(f"Erreur lors du calcul des statistiques: {e}")
             return {'admin_count': 0, 'resident_count': 0, 'total_count': 0}
 
-    def get_users_for_web_display(self) -> List[Dict[str, Any]]:
+    def get_users_for_web_display(self) -> List[User]:
         """
-        Formate les utilisateurs pour l'affichage web (template compatibility).
+        Retourne les utilisateurs pour l'affichage web.
+
+        Les entités sont passées telles quelles aux templates Jinja2 : les dates
+        sont déjà converties par le repository et le rôle expose .value.
 
         Returns:
-            Liste des utilisateurs formatés pour les templates Jinja2
+            Liste des utilisateurs pour les templates Jinja2
         """
-        try:
-            from datetime import datetime
-            users = self.get_all_users()
-            formatted_users = []
-
-            for user in users:
-                # Convertir les chaînes de dates en objets datetime si nécessaire
-                created_at = user.created_at
-                if isinstance(created_at, str):
-                    try:
-                        created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    except:
-                        created_at = datetime.now()
-
-                last_login = user.last_login
-                if isinstance(last_login, str):
-                    try:
-                        last_login = datetime.fromisoformat(last_login.replace('Z', '+00:00'))
-                    except:
-                        last_login = None
-                elif last_login is None:
-                    last_login = None
-
-                formatted_user = {
-                    'username': user.username,
-                    'full_name': user.full_name,
-                    'email': user.email,
-                    'role': {'value': user.role.value},  # Format compatible template
-                    'condo_unit': user.condo_unit,
-                    'phone': getattr(user, 'phone', None),
-                    'is_active': getattr(user, 'is_active', True),
-                    'created_at': created_at,
-                    'last_login': last_login,
-                    'status': 'Actif'  # Par défaut, peut être étendu plus tard
-                }
-                formatted_users.append(formatted_user)
+        users = self.get_all_users()
+        # Les pages de détails suivent souvent la liste : réutiliser les entités déjà lues
+        self._remember_users(users[:PREFETCH_DETAILS_COUNT])
+        logger.debug("%d utilisateurs transmis pour affichage web", len(users))
+        return users
 
-            logger.debug(f"Formatage de {len(formatted_users)} utilisateurs pour affichage web")
-            return formatted_users
-
-        except Exception as e:
-            logger.error(f"Erreur lors du formatage des utilisateurs: {e}")
-            return []
+    def _status_for(self, user: User) -> str:
+        """Retourne le statut d'affichage d'un utilisateur."""
+        return 'Actif' if user.is_active else 'Inactif'
 
     def get_users_by_role(self, role: UserRole) -> List[User]:
         """
         Filtre les utilisateurs par rôle.
 
+        Le filtrage est délégué au repository, qui doit l'effectuer en SQL
+        (WHERE role = ?, index idx_users_role) plutôt que de lire toute la table.
+
         Args:
             role: Rôle à filtrer
 
@@ -163,11 +202,11 @@ class UserService:
             Liste des utilisateurs ayant le rôle spécifié
         """
         try:
-            filtered_users = self._run_async_operation(
-                self.user_repository.get_users_by_role, role
+            filtered_users = self._run_cached(
+                f'users:role:{role.value}', self.user_repository.get_users_by_role, role
             )
 
-            logger.debug(f"Filtrage: {len(filtered_users)} utilisateurs avec rôle {role.value}")
+            logger.debug("Filtrage: %d utilisateurs avec rôle %s", len(filtered_users), role.value)
             return filtered_users
 
         except Exception as e:
@@ -185,13 +224,11 @@ class UserService:
             Utilisateur trouvé ou None
         """
         try:
-            user = self._run_async_operation(
-                self.user_repository.get_user_by_username, username
-            )
+            user = self._get_user_cached(username)
             if user:
-                logger.debug(f"Utilisateur '{username}' trouvé")
+                logger.debug("Utilisateur '%s' trouvé", username)
             else:
-                logger.debug(f"Utilisateur '{username}' non trouvé")
+                logger.debug("Utilisateur '%s' non trouvé", username)
             return user
 
         except Exception as e:
@@ -212,13 +249,11 @@ class UserService:
             UserNotFoundError: Si l'utilisateur n'est pas trouvé
         """
         try:
-            user = self._run_async_operation(
-                self.user_repository.get_user_by_username, username
-            )
+            user = self._get_user_cached(username)
             if not user:
                 raise UserNotFoundError(username)
             
-            logger.debug(f"Utilisateur '{username}' trouvé")
+            logger.debug("Utilisateur '%s' trouvé", username)
             return user
 
         except UserNotFoundError:
@@ -238,30 +273,14 @@ class UserService:
             Dictionnaire avec les détails formatés ou None si non trouvé
         """
         try:
-            user = self._run_async_operation(
-                self.user_repository.get_user_by_username, username
-            )
+            user = self._get_user_cached(username)
 
             if not user:
-                logger.debug(f"Utilisateur '{username}' non trouvé pour détails")
+                logger.debug("Utilisateur '%s' non trouvé pour détails", username)
                 return None
 
-            # Formatage des détails pour l'affichage
-            details = {
-                'username': user.username,
-                'full_name': user.full_name,
-                'email': user.email,
-                'role': user.role.value,
-                'role_display': self._get_role_display_name(user.role),
-                'condo_unit': user.condo_unit or 'Non assigné',
-                'last_login': getattr(user, 'last_login', None) or 'Jamais connecté',
-                'created_at': getattr(user, 'created_at', None) or 'Non disponible',
-                'status': 'Actif',  # Par défaut
-                'has_condo_unit': bool(user.condo_unit)
-            }
-
-            logger.debug(f"Détails récupérés pour l'utilisateur '{username}'")
-            return details
+            logger.debug("Détails récupérés pour l'utilisateur '%s'", username)
+            return self._format_user_details(user)
 
         except Exception as e:
             logger.error(f"Erreur lors de la récupération des détails pour '{username}': {e}")
@@ -278,37 +297,14 @@ class UserService:
             Dictionnaire formaté pour JSON ou dictionnaire d'erreur
         """
         try:
-            user = self._run_async_operation(
-                self.user_repository.get_user_by_username, username
-            )
+            user = self._get_user_cached(username)
 
             if not user:
-                logger.debug(f"Utilisateur '{username}' non trouvé pour API")
-                return {
-                    'error': 'Utilisateur non trouvé',
-                    'username': username,
-                    'found': False
-                }
+                logger.debug("Utilisateur '%s' non trouvé pour API", username)
+                return self._api_user_not_found(username)
 
-            # Formatage pour JSON API
-            api_data = {
-                'username': user.username,
-                'full_name': user.full_name,
-                'email': user.email,
-                'role': user.role.value,
-                'condo_unit': user.condo_unit,
-                'last_login': getattr(user, 'last_login', None),
-                'created_at': getattr(user, 'created_at', None),
-                'found': True,
-                'details': {
-                    'role_display': self._get_role_display_name(user.role),
-                    'has_condo_unit': bool(user.condo_unit),
-                    'status': 'Actif'
-                }
-            }
-
-            logger.debug(f"Données API préparées pour l'utilisateur '{username}'")
-            return api_data
+            logger.debug("Données API préparées pour l'utilisateur '%s'", username)
+            return self._format_user_for_api(user)
 
         except Exception as e:
             logger.error(f"Erreur API pour l'utilisateur '{username}': {e}")
@@ -318,6 +314,95 @@ class UserService:
                 'found': False
             }
 
+    def get_users_by_usernames(self, usernames: List[str]) -> Dict[str, User]:
+        """
+        Récupère plusieurs utilisateurs en une seule requête SQL IN.
+
+        À préférer à des appels répétés de get_user_by_username dans une boucle.
+
+        Args:
+            usernames: Noms d'utilisateur à rechercher
+
+        Returns:
+            Dict[str, User]: Utilisateurs trouvés, indexés par nom (les noms inconnus sont absents)
+        """
+        users = self._run_async_operation(self.user_repository.get_users_by_usernames, usernames)
+        return {user.username: user for user in users}
+
+    def get_user_details_for_api_bulk(self, usernames: List[str]) -> List[Dict[str, Any]]:
+        """
+        Récupère les détails API de plusieurs utilisateurs en une seule requête.
+
+        Args:
+            usernames: Noms d'utilisateur à rechercher
+
+        Returns:
+            Un dictionnaire par nom demandé, dans le même ordre et au même
+            format que get_user_details_for_api
+        """
+        try:
+            users_by_username = self.get_users_by_usernames(usernames)
+
+            logger.debug("Données API préparées pour %d/%d utilisateurs", len(users_by_username), len(usernames))
+            return [
+                self._format_user_for_api(users_by_username[username])
+                if username in users_by_username else self._api_user_not_found(username)
+                for username in usernames
+            ]
+
+        except Exception as e:
+            logger.error(f"Erreur API lors de la récupération groupée d'utilisateurs: {e}")
+            return [
+                {
+                    'error': 'Erreur système lors de la récupération des données',
+                    'username': username,
+                    'found': False
+                }
+                for username in usernames
+            ]
+
+    def _format_user_details(self, user: User) -> Dict[str, Any]:
+        """Formate un utilisateur pour la page de détails."""
+        return {
+            'username': user.username,
+            'full_name': user.full_name,
+            'email': user.email,
+            'role': user.role.value,
+            'role_display': self._get_role_display_name(user.role),
+            'condo_unit': user.condo_unit or 'Non assigné',
+            'last_login': user.last_login or 'Jamais connecté',
+            'created_at': user.created_at or 'Non disponible',
+            'status': self._status_for(user),
+            'has_condo_unit': bool(user.condo_unit)
+        }
+
+    def _format_user_for_api(self, user: User) -> Dict[str, Any]:
+        """Formate un utilisateur pour l'API JSON."""
+        return {
+            'username': user.username,
+            'full_name': user.full_name,
+            'email': user.email,
+            'role': user.role.value,
+            'condo_unit': user.condo_unit,
+            'last_login': user.last_login,
+            'created_at': user.created_at,
+            'found': True,
+            'details': {
+                'role_display': self._get_role_display_name(user.role),
+                'has_condo_unit': bool(user.condo_unit),
+                'status': self._status_for(user)
+            }
+        }
+
+    @staticmethod
+    def _api_user_not_found(username: str) -> Dict[str, Any]:
+        """Retourne la réponse API d'un utilisateur introuvable."""
+        return {
+            'error': 'Utilisateur non trouvé',
+            'username': username,
+            'found': False
+        }
+
     def _get_role_display_name(self, role: UserRole) -> str:
         """
         Retourne le nom d'affichage du rôle avec icône.
@@ -328,12 +413,7 @@ class UserService:
         Returns:
             Chaîne formatée pour l'affichage
         """
-        role_names = {
-            UserRole.ADMIN: "Administrateur",
-            UserRole.RESIDENT: "Résident",
-            UserRole.GUEST: "Invité"
-        }
-        return role_names.get(role, "Inconnu")
+        return _ROLE_DISPLAY_NAMES.get(role, "Inconnu")
 
     def delete_user_by_username(self, username: str) -> bool:
         """
@@ -353,22 +433,19 @@ class UserService:
     async def _delete_user_by_username_async(self, username: str) -> bool:
         """
         Implémentation asynchrone de la suppression d'utilisateur.
-        """
-        logger.debug(f"Tentative de suppression de l'utilisateur: {username}")
 
-        # Vérifier que l'utilisateur existe
-        user = await self.user_repository.get_user_by_username(username)
-        if user is None:
-            logger.warning(f"Utilisateur non trouvé pour suppression: {username}")
-            return False
+        Le DELETE indique lui-même si l'utilisateur existait (lignes affectées) :
+        aucune lecture préalable n'est nécessaire.
+        """
+        logger.debug("Tentative de suppression de l'utilisateur: %s", username)
 
-        # Supprimer l'utilisateur
         try:
-            result = await self.user_repository.delete_user(username)
+            result = bool(await self.user_repository.delete_user(username))
             if result:
+                self.clear_cache()
                 logger.info(f"Utilisateur supprimé avec succès: {username}")
             else:
-                logger.warning(f"Échec de la suppression de l'utilisateur: {username}")
+                logger.warning(f"Utilisateur non trouvé pour suppression: {username}")
             return result
         except Exception as e:
             logger.error(f"Erreur lors de la suppression de {username}: {str(e)}")
@@ -406,67 +483,7 @@ class UserService:
             Dictionnaire avec le résultat de l'opération
         """
         try:
-            # Récupérer l'utilisateur existant
-            existing_user = self._run_async_operation(
-                self.user_repository.get_user_by_username, username
-            )
-
-            if not existing_user:
-                logger.warning(f"Utilisateur à mettre à jour non trouvé: {username}")
-                return {
-                    'success': False,
-                    'error': 'Utilisateur non trouvé'
-                }
-
-            # Vérifier si le nouveau nom d'utilisateur existe déjà (si changé)
-            new_username = update_data.get('username', username)
-            if new_username != username:
-                existing_new_user = self._run_async_operation(
-                    self.user_repository.get_user_by_username, new_username
-                )
-                if existing_new_user:
-                    logger.warning(f"Le nom d'utilisateur '{new_username}' existe déjà")
-                    return {
-                        'success': False,
-                        'error': f"Le nom d'utilisateur '{new_username}' existe déjà"
-                    }
-
-            # Préparer les données de mise à jour
-            from src.domain.entities.user import UserRole
-            updated_user_data = {
-                'username': new_username,
-                'email': update_data.get('email', existing_user.email),
-                'full_name': update_data.get('full_name', existing_user.full_name),
-                'role': UserRole(update_data.get('role', existing_user.role.value)),
-                'condo_unit': update_data.get('condo_unit', existing_user.condo_unit)
-            }
-
-            # Gérer le mot de passe (optionnel)
-            if 'password' in update_data and update_data['password']:
-                updated_user_data['password'] = update_data['password']
-            else:
-                # Conserver le mot de passe existant
-                updated_user_data['password'] = getattr(existing_user, 'password', None)
-
-            # Effectuer la mise à jour
-            result = self._run_async_operation(
-                self.user_repository.update_user_by_username,
-                username,
-                updated_user_data
-            )
-
-            if result:
-                logger.info(f"Utilisateur '{username}' mis à jour vers '{new_username}' avec succès")
-                return {
-                    'success': True,
-                    'message': f"Utilisateur mis à jour avec succès"
-                }
-            else:
-                logger.error(f"Échec de la mise à jour de l'utilisateur: {username}")
-                return {
-                    'success': False,
-                    'error': 'Échec de la mise à jour'
-                }
+            return self._run_async_operation(self._update_user_by_username_async, username, update_data)
 
         except ValueError as e:
             logger.error(f"Erreur de validation lors de la mise à jour de {username}: {str(e)}")
@@ -480,3 +497,66 @@ class UserService:
                 'success': False,
                 'error': 'Erreur système lors de la mise à jour'
             }
+
+    async def _update_user_by_username_async(self, username: str, update_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Implémentation asynchrone de la mise à jour d'utilisateur.
+
+        Les lectures de l'utilisateur existant et du nouveau nom sont lancées
+        ensemble, puis la mise à jour est effectuée dans la même coroutine.
+        """
+        new_username = update_data.get('username', username)
+        if new_username != username:
+            existing_user, existing_new_user = await asyncio.gather(
+                self.user_repository.get_user_by_username(username),
+                self.user_repository.get_user_by_username(new_username)
+            )
+        else:
+            existing_user = await self.user_repository.get_user_by_username(username)
+            existing_new_user = None
+
+        if not existing_user:
+            logger.warning(f"Utilisateur à mettre à jour non trouvé: {username}")
+            return {
+                'success': False,
+                'error': 'Utilisateur non trouvé'
+            }
+
+        # Vérifier si le nouveau nom d'utilisateur existe déjà (si changé)
+        if existing_new_user:
+            logger.warning(f"Le nom d'utilisateur '{new_username}' existe déjà")
+            return {
+                'success': False,
+                'error': f"Le nom d'utilisateur '{new_username}' existe déjà"
+            }
+
+        # Préparer les données de mise à jour
+        updated_user_data = {
+            'username': new_username,
+            'email': update_data.get('email', existing_user.email),
+            'full_name': update_data.get('full_name', existing_user.full_name),
+            'role': UserRole(update_data.get('role', existing_user.role.value)),
+            'condo_unit': update_data.get('condo_unit', existing_user.condo_unit)
+        }
+
+        # Gérer le mot de passe (optionnel) : sans nouveau mot de passe,
+        # le repository conserve le hash existant
+        if update_data.get('password'):
+            updated_user_data['password'] = update_data['password']
+
+        # Effectuer la mise à jour
+        result = await self.user_repository.update_user_by_username(username, updated_user_data)
+
+        if result:
+            self.clear_cache()
+            logger.info(f"Utilisateur '{username}' mis à jour vers '{new_username}' avec succès")
+            return {
+                'success': True,
+                'message': f"Utilisateur mis à jour avec succès"
+            }
+        else:
+            logger.error(f"Échec de la mise à jour de l'utilisateur: {username}")
+            return {
+                'success': False,
+                'error': 'Échec de la mise à jour'
+            }
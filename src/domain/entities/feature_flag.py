@@ -12,6 +12,9 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+from .slots import with_slots
+
+@with_slots()
 @dataclass
 class FeatureFlag:
     """
@@ -34,28 +37,38 @@ class FeatureFlag:
 
     def __post_init__(self):
         """Initialisation après création de l'objet."""
-        if self.created_at is None:
-            self.created_at = datetime.now()
-        if self.updated_at is None:
-            self.updated_at = datetime.now()
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.now()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
+
+    def _update_state(self, enabled: bool, now: Optional[datetime] = None) -> None:
+        """
+        Applique un nouvel état et horodate la modification.
+
+        Args:
+            enabled: Nouvel état d'activation
+            now: Horodatage calculé une fois par l'appelant pour un lot de flags
+        """
+        self.is_enabled = enabled
+        self.updated_at = now or datetime.now()
 
-    def enable(self) -> None:
+    def enable(self, now: Optional[datetime] = None) -> None:
         """Active le feature flag."""
-        logger.debug(f"Activation du feature flag: {self.flag_name}")
-        self.is_enabled = True
-        self.updated_at = datetime.now()
+        logger.debug("Activation du feature flag: %s", self.flag_name)
+        self._update_state(True, now)
 
-    def disable(self) -> None:
+    def disable(self, now: Optional[datetime] = None) -> None:
         """Désactive le feature flag."""
-        logger.debug(f"Désactivation du feature flag: {self.flag_name}")
-        self.is_enabled = False
-        self.updated_at = datetime.now()
+        logger.debug("Désactivation du feature flag: %s", self.flag_name)
+        self._update_state(False, now)
 
-    def toggle(self) -> None:
+    def toggle(self, now: Optional[datetime] = None) -> None:
         """Inverse l'état du feature flag."""
-        logger.debug(f"Inversion du feature flag: {self.flag_name} ({self.is_enabled} -> {not self.is_enabled})")
-        self.is_enabled = not self.is_enabled
-        self.updated_at = datetime.now()
+        logger.debug("Inversion du feature flag: %s (%s -> %s)", self.flag_name, self.is_enabled, not self.is_enabled)
+        self._update_state(not self.is_enabled, now)
 
     def to_dict(self) -> dict:
         """Convertit l'entité en dictionnaire pour sérialisation."""
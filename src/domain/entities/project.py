@@ -13,11 +13,36 @@ logger = get_logger(__name__)
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 import random
 from enum import Enum
+from types import MappingProxyType
+from uuid import uuid4
 
 from .unit import Unit, UnitType, UnitStatus
+from .slots import with_slots
+
+# Types des unités générées et probabilités cumulées (80 % résidentiel, 15 % commercial, 5 % stationnement)
+_GENERATED_UNIT_TYPES = (UnitType.RESIDENTIAL, UnitType.COMMERCIAL, UnitType.PARKING)
+_GENERATED_TYPE_CUM_WEIGHTS = (0.8, 0.95, 1.0)
+
+# Multiplicateur (immuable) de la superficie moyenne selon le type d'unité
+_AREA_MULTIPLIERS = MappingProxyType({
+    UnitType.RESIDENTIAL: 1.0,    # Taille standard
+    UnitType.COMMERCIAL: 1.2,     # Légèrement plus grand
+    UnitType.PARKING: 0.8,        # Plus petit
+    UnitType.STORAGE: 0.7         # Plus petit
+})
+
+def _generated_unit_number(index: int) -> str:
+    """Numéro d'une unité générée (A-101, B-205, etc.) selon sa position dans le projet."""
+    floor = (index // 4) + 1
+    unit_on_floor = (index % 4) + 1
+    building_section = chr(65 + (index // 100))  # A, B, C, etc. par tranche de 100
+    return f"{building_section}-{floor:01d}{unit_on_floor:02d}"
+
+# Numéros précalculés couvrant les projets courants (moins de 400 unités)
+_UNIT_NUMBERS = tuple(_generated_unit_number(i) for i in range(400))
 
 class ProjectStatus(Enum):
     """Énumération des statuts de projet."""
@@ -26,6 +51,7 @@ class ProjectStatus(Enum):
     COMPLETED = "COMPLETED"
     CANCELLED = "CANCELLED"
 
+@with_slots()
 @dataclass
 class Project:
     """
@@ -57,8 +83,7 @@ class Project:
 
         # Générer automatiquement un project_id si vide
         if not self.project_id or not self.project_id.strip():
-            import uuid
-            self.project_id = str(uuid.uuid4())[:8]  # ID court de 8 caractères
+            self.project_id = uuid4().hex[:8]  # ID court de 8 caractères
 
         if not self.address or not self.address.strip():
             raise ValueError("L'adresse du projet ne peut pas être vide")
@@ -75,7 +100,7 @@ class Project:
         if not self.constructor or not self.constructor.strip():
             raise ValueError("Le constructeur ne peut pas être vide")
 
-        logger.debug(f"Projet validé: {self.name} avec {self.unit_count} unités")
+        logger.debug("Projet validé: %s avec %s unités", self.name, self.unit_count)
 
     def __str__(self) -> str:
         """Représentation lisible du projet."""
@@ -168,7 +193,52 @@ class Project:
         Returns:
             Dict: Statistiques détaillées du projet
         """
-        total_units = len(self.units)
+        # Chaque unité forme son propre groupe (les unités occupées sont celles avec un propriétaire)
+        unit_groups = (
+            (
+                unit.status,
+                unit.unit_type.value,
+                bool(unit.owner_name and unit.owner_name != "Disponible"),
+                1,
+                unit.estimated_price or 0.0
+            )
+            for unit in self.units
+        )
+        return self.compute_statistics(unit_groups)
+
+    @staticmethod
+    def compute_statistics(unit_groups: Iterable[Tuple[UnitStatus, str, bool, int, float]]) -> Dict[str, Any]:
+        """
+        Calcule les statistiques d'un projet à partir de groupes d'unités.
+
+        Les groupes peuvent provenir des unités en mémoire ou d'un GROUP BY SQL.
+
+        Args:
+            unit_groups: Tuples (statut, type, occupé, nombre d'unités, valeur estimée totale)
+
+        Returns:
+            Dict: Statistiques détaillées du projet
+        """
+        total_units = 0
+        occupied_count = 0
+        available_count = 0
+        reserved_count = 0
+        total_value = 0.0
+        revenue = 0.0
+        units_by_type: Dict[str, int] = {}
+
+        for status, unit_type, occupied, count, value in unit_groups:
+            total_units += count
+            total_value += value
+            if occupied:
+                occupied_count += count
+                revenue += value
+            elif status is UnitStatus.AVAILABLE:
+                available_count += count
+            if status is UnitStatus.RESERVED:
+                reserved_count += count
+            units_by_type[unit_type] = units_by_type.get(unit_type, 0) + count
+
         if total_units == 0:
             return {
                 'total_units': 0,
@@ -182,24 +252,10 @@ class Project:
                 'revenue': 0.0
             }
 
-        # Compter par statut (les unités occupées sont celles avec un propriétaire)
-        occupied_count = sum(1 for unit in self.units if unit.owner_name and unit.owner_name != "Disponible")
-        available_count = sum(1 for unit in self.units if (not unit.owner_name or unit.owner_name == "Disponible") and unit.status == UnitStatus.AVAILABLE)
-        reserved_count = sum(1 for unit in self.units if unit.status == UnitStatus.RESERVED)
-
-        # Calculs financiers
-        total_value = sum(unit.estimated_price for unit in self.units if unit.estimated_price)
-        revenue = sum(unit.estimated_price for unit in self.units if unit.owner_name and unit.owner_name != "Disponible" and unit.estimated_price)
-        average_price = total_value / total_units if total_units > 0 else 0.0
-
-        # Répartition par type
-        units_by_type = {}
-        for unit in self.units:
-            unit_type = unit.unit_type.value if hasattr(unit.unit_type, 'value') else str(unit.unit_type)
-            units_by_type[unit_type] = units_by_type.get(unit_type, 0) + 1
+        average_price = total_value / total_units
 
         # Pourcentage de completion (unités occupées)
-        completion_percentage = (occupied_count / total_units * 100) if total_units > 0 else 0.0
+        completion_percentage = occupied_count / total_units * 100
 
         return {
             'total_units': total_units,
@@ -229,6 +285,8 @@ class Project:
             unit_count = self.unit_count
 
         units = []
+        # Horodatage commun à toutes les unités du lot
+        now = datetime.now()
 
         if blank_units:
             # Créer des unités vierges sans attribution automatique
@@ -240,7 +298,9 @@ class Project:
                     unit_type=UnitType.RESIDENTIAL,  # Type par défaut
                     status=UnitStatus.AVAILABLE,  # Statut disponible
                     estimated_price=0,  # Prix à définir
-                    owner_name="Disponible"  # Pas d'attribution automatique
+                    owner_name="Disponible",  # Pas d'attribution automatique
+                    created_at=now,
+                    updated_at=now
                 )
                 units.append(unit)
 
@@ -250,21 +310,6 @@ class Project:
             return units
 
         # Code existant pour la génération automatique complète
-        # Types de condos et leurs probabilités
-        condo_types = [
-            (UnitType.RESIDENTIAL, 0.8),
-            (UnitType.COMMERCIAL, 0.15),
-            (UnitType.PARKING, 0.05)
-        ]
-
-        # Répartition typique des superficies par type
-        type_areas = {
-            UnitType.RESIDENTIAL: (400, 1600),
-            UnitType.COMMERCIAL: (800, 2000),
-            UnitType.PARKING: (300, 400),      # Minimum 300 pour respect des contraintes métier
-            UnitType.STORAGE: (300, 400)       # Minimum 300 pour respect des contraintes métier
-        }
-
         # Prix au pied carré basé sur l'année de construction et la localisation
         base_price_per_sqft = 350
         if self.construction_year > 2015:
@@ -272,38 +317,20 @@ class Project:
         if self.construction_year > 2020:
             base_price_per_sqft += 30
 
-        logger.debug(f"Génération de {unit_count} unités pour {self.name}")
+        logger.debug("Génération de %d unités pour %s", unit_count, self.name)
+
+        # Superficie moyenne cible, basée sur la répartition du total
+        target_avg_area = self.building_area / unit_count if unit_count else 0
+
+        # Sélection des types selon les probabilités, tirés en un seul appel
+        selected_types = random.choices(_GENERATED_UNIT_TYPES, cum_weights=_GENERATED_TYPE_CUM_WEIGHTS, k=unit_count)
 
-        for i in range(unit_count):
+        for i, selected_type in enumerate(selected_types):
             # Numérotation des unités (A-101, B-205, etc.)
-            floor = (i // 4) + 1
-            unit_on_floor = (i % 4) + 1
-            building_section = chr(65 + (i // 100))  # A, B, C, etc. par tranche de 100
-            unit_number = f"{building_section}-{floor:01d}{unit_on_floor:02d}"
-
-            # Sélection du type selon les probabilités
-            rand = random.random()
-            cumulative = 0
-            selected_type = UnitType.RESIDENTIAL  # défaut
-            for condo_type, probability in condo_types:
-                cumulative += probability
-                if rand <= cumulative:
-                    selected_type = condo_type
-                    break
-
-            # Superficie basée sur la répartition du total
-            # Calculer la superficie moyenne cible
-            target_avg_area = self.building_area / unit_count
+            unit_number = _UNIT_NUMBERS[i] if i < len(_UNIT_NUMBERS) else _generated_unit_number(i)
 
             # Ajuster selon le type d'unité avec des variations plus modérées
-            type_multipliers = {
-                UnitType.RESIDENTIAL: 1.0,    # Taille standard
-                UnitType.COMMERCIAL: 1.2,     # Légèrement plus grand
-                UnitType.PARKING: 0.8,        # Plus petit
-                UnitType.STORAGE: 0.7         # Plus petit
-            }
-
-            base_area = target_avg_area * type_multipliers[selected_type]
+            base_area = target_avg_area * _AREA_MULTIPLIERS[selected_type]
             # Variation aléatoire de ±15% pour rester dans les limites du test
             variation = random.uniform(0.85, 1.15)
             square_feet = int(base_area * variation)
@@ -326,7 +353,9 @@ class Project:
                 area=square_feet,
                 unit_type=selected_type,
                 status=status,
-                estimated_price=price
+                estimated_price=price,
+                created_at=now,
+                updated_at=now
             )
 
             units.append(unit)
@@ -359,6 +388,7 @@ class Project:
 
         # Générer 'count' nouvelles unités en partant du numéro suivant
         next_unit_number = current_unit_count + 1
+        now = datetime.now()
         for i in range(count):
             unit_index = next_unit_number + i - 1  # Index 0-based pour la génération
 
@@ -391,7 +421,9 @@ class Project:
                 area=square_feet,
                 unit_type=selected_type,
                 status=status,
-                estimated_price=price
+                estimated_price=price,
+                created_at=now,
+                updated_at=now
             )
 
             added_units.append(unit)
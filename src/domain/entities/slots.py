@@ -0,0 +1,40 @@
+"""
+Utilitaire __slots__ pour les entités dataclass.
+
+Équivalent de dataclass(slots=True) (Python 3.10+) compatible Python 3.9 :
+les instances n'ont plus de __dict__, ce qui réduit leur empreinte mémoire
+et accélère l'accès aux attributs.
+"""
+
+from dataclasses import fields
+from typing import Callable, Type, TypeVar
+
+T = TypeVar('T')
+
+
+def with_slots(*extra_attributes: str) -> Callable[[Type[T]], Type[T]]:
+    """
+    Recrée une classe dataclass avec des __slots__ couvrant tous ses champs.
+
+    Args:
+        *extra_attributes: Attributs hors champs affectés par les méthodes de l'entité
+
+    Returns:
+        Décorateur à appliquer au-dessus de @dataclass
+    """
+    def decorate(cls: Type[T]) -> Type[T]:
+        field_names = tuple(f.name for f in fields(cls))
+        cls_dict = dict(cls.__dict__)
+        cls_dict['__slots__'] = field_names + extra_attributes
+
+        # Les valeurs par défaut sont déjà capturées par le __init__ généré
+        for name in field_names:
+            cls_dict.pop(name, None)
+        cls_dict.pop('__dict__', None)
+        cls_dict.pop('__weakref__', None)
+
+        slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        slotted_cls.__qualname__ = cls.__qualname__
+        return slotted_cls
+
+    return decorate
@@ -16,8 +16,12 @@ logger = get_logger(__name__)
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from sys import intern
 from typing import Optional
 from enum import Enum
+from types import MappingProxyType
+
+from .slots import with_slots
 
 class UnitStatus(Enum):
     """Statut d'une unité."""
@@ -28,12 +32,42 @@ class UnitStatus(Enum):
     NONE = "none" # Utilisé principalement pour indiqué que c'est occupé par le propriétaire
 
 class UnitType(Enum):
-    """Type d'unité selon la fonction."""
-    RESIDENTIAL = "RESIDENTIAL"
-    COMMERCIAL = "COMMERCIAL"
-    PARKING = "PARKING"
-    STORAGE = "STORAGE"
+    """
+    Type d'unité selon la fonction.
 
+    Chaque membre porte son taux mensuel par pied carré (rate_per_sqft) ;
+    la valeur du membre reste le code stocké en base.
+    """
+    RESIDENTIAL = ("RESIDENTIAL", 0.45)
+    COMMERCIAL = ("COMMERCIAL", 0.60)
+    PARKING = ("PARKING", 0.375)
+    STORAGE = ("STORAGE", 0.30)
+
+    def __new__(cls, code: str, rate_per_sqft: float):
+        member = object.__new__(cls)
+        member._value_ = code
+        member.rate_per_sqft = rate_per_sqft
+        return member
+
+# Icônes (immuables) d'affichage par type et par statut d'unité
+_TYPE_ICONS = MappingProxyType({
+    UnitType.RESIDENTIAL: "🏠",
+    UnitType.COMMERCIAL: "🏢",
+    UnitType.PARKING: "🚗",
+    UnitType.STORAGE: "📦"
+})
+
+_STATUS_ICONS = MappingProxyType({
+    UnitStatus.AVAILABLE: "✅",
+    UnitStatus.RESERVED: "⏳",
+    UnitStatus.MAINTENANCE: "🔧",
+    UnitStatus.INACTIVE: "❌",           # AJOUT: Icône pour statut inactif
+    UnitStatus.NONE: "🏠"
+})
+
+# __dict__ reste disponible pour les attributs contextuels ajoutés dynamiquement ;
+# il n'est alloué qu'à la première affectation de ce type
+@with_slots('purchase_date', '__dict__')
 @dataclass
 class Unit:
     """
@@ -109,15 +143,7 @@ class Unit:
             float: Frais mensuels calculés
         """
         # Calcul par défaut basé sur le type et la superficie
-        rate_per_sqft = {
-            UnitType.RESIDENTIAL: 0.45,
-            UnitType.COMMERCIAL: 0.60,
-            UnitType.PARKING: 0.375,
-            UnitType.STORAGE: 0.30
-        }
-
-        base_rate = rate_per_sqft.get(self.unit_type, 0.45)
-        return float(self.area * base_rate)
+        return float(self.area * self.unit_type.rate_per_sqft)
 
     @property
     def monthly_fees(self) -> float:
@@ -158,13 +184,7 @@ class Unit:
         Returns:
             str: Emoji représentant le type d'unité
         """
-        icons = {
-            UnitType.RESIDENTIAL: "🏠",
-            UnitType.COMMERCIAL: "🏢",
-            UnitType.PARKING: "🚗",
-            UnitType.STORAGE: "📦"
-        }
-        return icons.get(self.unit_type, "🏠")
+        return _TYPE_ICONS.get(self.unit_type, "🏠")
 
     @property
     def status_icon(self) -> str:
@@ -174,38 +194,32 @@ class Unit:
         Returns:
             str: Emoji représentant le statut
         """
-        icons = {
-            UnitStatus.AVAILABLE: "✅",
-            UnitStatus.RESERVED: "⏳",
-            UnitStatus.MAINTENANCE: "🔧",
-            UnitStatus.INACTIVE: "❌",           # AJOUT: Icône pour statut inactif
-            UnitStatus.NONE: "🏠"
-        }
-        return icons.get(self.status, "❓")
+        return _STATUS_ICONS.get(self.status, "❓")
 
     def is_available(self) -> bool:
         """Vérifie si l'unité est disponible."""
-        return self.status == UnitStatus.AVAILABLE
+        return self.status is UnitStatus.AVAILABLE
 
         logger.info(f"Unité {self.unit_number} vendue à {self.owner_name}")
 
-    def transfer_ownership(self, owner_name: str, purchase_date: datetime = None) -> None:
+    def transfer_ownership(self, owner_name: str, purchase_date: datetime = None,
+                           now: Optional[datetime] = None) -> None:
         """
         Transfère la propriété de l'unité.
 
         Args:
             owner_name: Nom du nouveau propriétaire
             purchase_date: Date d'achat (par défaut maintenant)
+            now: Horodatage calculé une fois par l'appelant pour un lot de transferts
         """
-        if purchase_date is None:
-            purchase_date = datetime.now()
+        now = now or datetime.now()
 
         self.owner_name = owner_name
-        self.purchase_date = purchase_date
+        self.purchase_date = purchase_date or now
         self.status = UnitStatus.AVAILABLE  # Status reste available
-        self.updated_at = datetime.now()
+        self.updated_at = now
 
-        logger.debug(f"Unité {self.unit_number} transférée à {owner_name}")
+        logger.debug("Unité %s transférée à %s", self.unit_number, owner_name)
 
     def make_available(self) -> None:
         """Rend l'unité disponible."""
@@ -218,7 +232,7 @@ class Unit:
 
     def reserve(self) -> None:
         """Réserve l'unité."""
-        if self.status != UnitStatus.AVAILABLE:
+        if self.status is not UnitStatus.AVAILABLE:
             raise ValueError("Seules les unités disponibles peuvent être réservées")
 
         self.status = UnitStatus.RESERVED
@@ -267,12 +281,47 @@ class Unit:
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> 'Unit':
+    def _from_trusted_row(cls, unit_number: str, project_id: str, area: float,
+                          unit_type: UnitType, status: UnitStatus,
+                          id: Optional[int] = None, estimated_price: Optional[float] = None,
+                          owner_name: Optional[str] = None, calculated_monthly_fees: Optional[str] = None,
+                          created_at: datetime = None, updated_at: datetime = None) -> 'Unit':
+        """
+        Construit une unité à partir de données déjà validées (ligne SQLite).
+
+        Contourne __init__ et les validations de __post_init__ : les valeurs
+        ont été validées avant leur écriture en base.
+
+        Returns:
+            Unit: Instance créée
+        """
+        unit = object.__new__(cls)
+        # Interné une seule fois à l'hydratation : les recherches par numéro se résolvent par identité
+        unit.unit_number = intern(unit_number)
+        unit.project_id = project_id
+        unit.area = area
+        unit.unit_type = unit_type
+        unit.status = status
+        unit.id = id
+        unit.estimated_price = estimated_price
+        unit.owner_name = owner_name
+        unit.calculated_monthly_fees = calculated_monthly_fees
+        if created_at is None or updated_at is None:
+            now = datetime.now()
+            created_at = created_at or now
+            updated_at = updated_at or now
+        unit.created_at = created_at
+        unit.updated_at = updated_at
+        return unit
+
+    @classmethod
+    def from_dict(cls, data: dict, validate: bool = True) -> 'Unit':
         """
         Crée une instance Unit à partir d'un dictionnaire.
 
         Args:
             data: Dictionnaire contenant les données de l'unité
+            validate: False pour des données de confiance (déjà validées à l'écriture)
 
         Returns:
             Unit: Instance créée
@@ -295,7 +344,8 @@ class Unit:
         if isinstance(updated_at, str):
             updated_at = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
 
-        return cls(
+        factory = cls if validate else cls._from_trusted_row
+        return factory(
             id=data.get('id'),
             unit_number=data['unit_number'],
             project_id=data['project_id'],
@@ -12,6 +12,7 @@ from enum import Enum
 from dataclasses import dataclass
 from typing import Dict, Any, Optional
 from datetime import datetime
+from .slots import with_slots
 import hashlib
 import json
 
@@ -34,6 +35,7 @@ class UserValidationError(Exception):
     """Exception spécialisée pour la validation des données utilisateur."""
     pass
 
+@with_slots()
 @dataclass
 class User:
     """
@@ -10,6 +10,7 @@ from typing import List, Dict, Tuple, Callable, Optional
 from functools import reduce
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 
 from src.domain.entities.unit import Unit, UnitType, UnitStatus
 
@@ -20,6 +21,22 @@ class FeeCalculationMethod(Enum):
     FLAT_RATE = "flat_rate"        # Tarif fixe par unité
     CUSTOM = "custom"              # Calcul personnalisé
 
+# Tarifs fixes (immuables) par type d'unité, indépendants de la superficie
+_FLAT_RATES = MappingProxyType({
+    UnitType.RESIDENTIAL: Decimal('250.00'),
+    UnitType.COMMERCIAL: Decimal('500.00'),
+    UnitType.PARKING: Decimal('50.00'),
+    UnitType.STORAGE: Decimal('75.00')
+})
+
+# Tarifs de base (immuables) par pied carré selon le type d'unité
+_BASE_RATES = MappingProxyType({
+    UnitType.RESIDENTIAL: Decimal('0.25'),
+    UnitType.COMMERCIAL: Decimal('0.35'),
+    UnitType.PARKING: Decimal('0.10'),
+    UnitType.STORAGE: Decimal('0.15')
+})
+
 @dataclass(frozen=True)  # Immutable pour approche fonctionnelle
 class FinancialRecord:
     """Enregistrement financier immutable d'une unité."""
@@ -66,7 +83,7 @@ class FinancialService:
 
         # 1. FILTER: Conserver seulement les unités actives
         active_units = list(filter(
-            lambda unit: unit.status == UnitStatus.AVAILABLE,
+            lambda unit: unit.status is UnitStatus.AVAILABLE,
             units
         ))
 
@@ -169,14 +186,7 @@ class FinancialService:
 
         Tarif fixe par type d'unité, indépendant de la superficie.
         """
-        flat_rates = {
-            UnitType.RESIDENTIAL: Decimal('250.00'),
-            UnitType.COMMERCIAL: Decimal('500.00'),
-            UnitType.PARKING: Decimal('50.00'),
-            UnitType.STORAGE: Decimal('75.00')
-        }
-
-        amount = flat_rates.get(unit.unit_type, Decimal('200.00'))
+        amount = _FLAT_RATES.get(unit.unit_type, Decimal('200.00'))
 
         details = {
             'flat_rate': amount,
@@ -197,7 +207,7 @@ class FinancialService:
 
         # Facteur de complexité personnalisé
         complexity_factor = Decimal('1.0')
-        if unit.unit_type == UnitType.COMMERCIAL:
+        if unit.unit_type is UnitType.COMMERCIAL:
             complexity_factor = Decimal('1.2')
         elif unit.area > 1500:
             complexity_factor = Decimal('1.1')
@@ -219,14 +229,7 @@ class FinancialService:
         Tarifs de base par type.
 
         """
-        rates = {
-            UnitType.RESIDENTIAL: Decimal('0.25'),
-            UnitType.COMMERCIAL: Decimal('0.35'),
-            UnitType.PARKING: Decimal('0.10'),
-            UnitType.STORAGE: Decimal('0.15')
-        }
-
-        return rates.get(unit_type, Decimal('0.25'))
+        return _BASE_RATES.get(unit_type, Decimal('0.25'))
 
     @staticmethod
     def group_by_type_functional(units: List[Unit]) -> Dict[UnitType, List[Unit]]:
@@ -296,7 +299,7 @@ class FinancialService:
         total_income = FinancialService.calculate_total_income_functional(financial_records)
 
         active_units_count = len(
-            [unit for unit in units if unit.status == UnitStatus.AVAILABLE]
+            [unit for unit in units if unit.status is UnitStatus.AVAILABLE]
         )
 
         average_fees = total_income / active_units_count if active_units_count > 0 else Decimal('0.00')
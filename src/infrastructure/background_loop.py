@@ -0,0 +1,86 @@
+"""
+BackgroundEventLoop - Boucle asyncio persistante sur un thread dédié.
+
+Permet au code synchrone (routes Flask, services) d'exécuter des coroutines
+sans créer, rechercher ni fermer une boucle d'événements à chaque appel :
+les coroutines sont transmises à une boucle unique via
+asyncio.run_coroutine_threadsafe().
+
+La boucle utilise uvloop lorsqu'il est installé (boucle libuv plus rapide),
+sinon la boucle asyncio standard.
+"""
+
+from src.infrastructure.logger_manager import get_logger
+logger = get_logger(__name__)
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Optional
+
+try:
+    import uvloop
+except ImportError:  # dépendance optionnelle (absente sous Windows)
+    uvloop = None
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Crée une boucle uvloop si disponible, sinon une boucle asyncio standard."""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+class BackgroundEventLoop:
+    """
+    Boucle d'événements exécutée en continu dans un thread démon.
+
+    La boucle est partagée par le processus : les services construits à
+    chaque requête la réutilisent au lieu d'en créer une nouvelle.
+    """
+
+    def __init__(self):
+        self._loop = new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='BackgroundEventLoop', daemon=True)
+        self._thread.start()
+
+    def is_running(self) -> bool:
+        """Indique si la boucle accepte encore des coroutines."""
+        return self._thread.is_alive() and not self._loop.is_closed()
+
+    def run(self, coroutine: Awaitable[Any]) -> Any:
+        """
+        Exécute une coroutine sur la boucle et attend son résultat.
+
+        Args:
+            coroutine: Coroutine à exécuter
+
+        Returns:
+            Résultat de la coroutine (ses exceptions sont propagées)
+        """
+        if threading.current_thread() is self._thread:
+            # Attendre depuis la boucle elle-même bloquerait indéfiniment
+            coroutine.close()
+            raise RuntimeError("Appel synchrone impossible depuis la boucle d'arrière-plan")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def close(self) -> None:
+        """Arrête la boucle et attend la fin de son thread."""
+        if self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+        if not self._loop.is_closed():
+            self._loop.close()
+
+
+_background_loop: Optional[BackgroundEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> BackgroundEventLoop:
+    """Retourne la boucle d'arrière-plan du processus, démarrée à la première utilisation."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None or not _background_loop.is_running():
+            _background_loop = BackgroundEventLoop()
+            logger.debug("Boucle d'événements d'arrière-plan démarrée")
+        return _background_loop
@@ -0,0 +1,98 @@
+"""
+Cache Manager - Cache en mémoire invalidé par étiquettes.
+
+Chaque entrée est associée à un ensemble d'étiquettes (ex: "all_projects",
+identifiant de projet). Une écriture invalide uniquement les étiquettes
+qu'elle touche, plutôt que de recharger défensivement toutes les données.
+Une entrée peut aussi recevoir une durée de vie (TTL) lorsque des écritures
+échappent au service qui la met en cache.
+"""
+
+from src.infrastructure.logger_manager import get_logger
+logger = get_logger(__name__)
+
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Set
+
+
+class TaggedCache:
+    """
+    Cache clé/valeur thread-safe avec invalidation par étiquettes.
+
+    Les caches partagés (voir shared) permettent aux instances de service
+    construites à chaque requête de profiter des mêmes entrées.
+    """
+
+    _shared: Dict[str, 'TaggedCache'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        """Initialise un cache vide."""
+        self._entries: Dict[str, Any] = {}
+        self._expires_at: Dict[str, float] = {}
+        self._keys_by_tag: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, namespace: str) -> 'TaggedCache':
+        """
+        Retourne le cache partagé pour un espace de noms.
+
+        Args:
+            namespace: Espace de noms du cache (ex: chemin de la base)
+
+        Returns:
+            TaggedCache: Cache unique pour cet espace de noms
+        """
+        with cls._shared_lock:
+            cache = cls._shared.get(namespace)
+            if cache is None:
+                cache = cls()
+                cls._shared[namespace] = cache
+            return cache
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Retourne la valeur en cache pour une clé, ou la valeur par défaut si absente ou expirée."""
+        with self._lock:
+            expires_at = self._expires_at.get(key)
+            if expires_at is not None and time.monotonic() >= expires_at:
+                self._entries.pop(key, None)
+                del self._expires_at[key]
+                return default
+            return self._entries.get(key, default)
+
+    def set(self, key: str, value: Any, tags: Iterable[str], ttl: Optional[float] = None) -> None:
+        """
+        Met une valeur en cache sous les étiquettes données.
+
+        Args:
+            key: Clé de l'entrée
+            value: Valeur à mettre en cache
+            tags: Étiquettes dont l'invalidation supprime l'entrée
+            ttl: Durée de vie en secondes (None : jusqu'à invalidation)
+        """
+        with self._lock:
+            self._entries[key] = value
+            if ttl is None:
+                self._expires_at.pop(key, None)
+            else:
+                self._expires_at[key] = time.monotonic() + ttl
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """Supprime toutes les entrées associées à l'une des étiquettes."""
+        with self._lock:
+            for tag in tags:
+                for key in self._keys_by_tag.pop(tag, ()):
+                    self._entries.pop(key, None)
+                    self._expires_at.pop(key, None)
+        logger.debug("Cache invalidé pour les étiquettes: %s", tags)
+
+    def clear(self) -> None:
+        """Vide entièrement le cache."""
+        with self._lock:
+            self._entries.clear()
+            self._expires_at.clear()
+            self._keys_by_tag.clear()
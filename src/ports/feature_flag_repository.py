@@ -9,7 +9,7 @@ from src.infrastructure.logger_manager import get_logger
 logger = get_logger(__name__)
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from src.domain.entities.feature_flag import FeatureFlag
 
 class FeatureFlagRepositoryPort(ABC):
@@ -55,6 +55,19 @@ class FeatureFlagRepositoryPort(ABC):
         """
         pass
 
+    @abstractmethod
+    def is_enabled_many(self, flag_names: Iterable[str]) -> Dict[str, bool]:
+        """
+        Vérifie l'état de plusieurs feature flags en une seule requête.
+
+        Args:
+            flag_names: Noms des feature flags à vérifier
+
+        Returns:
+            Dict[str, bool]: État de chaque flag demandé (False si non trouvé)
+        """
+        pass
+
     @abstractmethod
     def create(self, feature_flag: FeatureFlag) -> FeatureFlag:
         """
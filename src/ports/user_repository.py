@@ -57,6 +57,22 @@ class UserRepositoryPort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_users_by_usernames(self, usernames: List[str]) -> List[User]:
+        """
+        Récupère plusieurs utilisateurs en une seule lecture.
+
+        Args:
+            usernames: Noms d'utilisateur à rechercher
+
+        Returns:
+            Utilisateurs trouvés (les noms inconnus sont ignorés)
+
+        Raises:
+            Exception: En cas d'erreur de lecture
+        """
+        pass
+
     @abstractmethod
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """
@@ -153,6 +169,19 @@ class UserRepositoryPort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_role_counts(self) -> Dict[str, int]:
+        """
+        Compte les utilisateurs par rôle.
+
+        Returns:
+            Dictionnaire valeur de rôle -> nombre d'utilisateurs (rôles absents omis)
+
+        Raises:
+            Exception: En cas d'erreur de lecture
+        """
+        pass
+
     @abstractmethod
     async def update_user_password(self, username: str, new_password_hash: str) -> bool:
         """
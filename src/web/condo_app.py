@@ -13,13 +13,14 @@ Architecture :
 - Templates HTML pour l'interface utilisateur
 """
 
-from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify
-import asyncio
+from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify, g
 import functools
 import logging
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Union
 from datetime import datetime
+from sys import intern
 import json
 
 # Imports du domaine
@@ -28,11 +29,39 @@ from src.domain.entities.unit import Unit, UnitType, UnitStatus
 from src.domain.entities.project import Project, ProjectStatus
 from src.domain.services.authentication_service import AuthenticationService
 
+@dataclass
+class CondoRecord:
+    """Enregistrement compact d'une unité formatée pour l'affichage (un par unité listée)."""
+    __slots__ = ('id', 'unit_number', 'owner_name', 'square_feet', 'unit_type', 'status',
+                 'monthly_fees', 'is_available', 'type_icon', 'status_icon')
+
+    id: Union[int, str]
+    unit_number: str
+    owner_name: Optional[str]
+    square_feet: float
+    unit_type: str
+    status: str
+    monthly_fees: float
+    is_available: bool
+    type_icon: str
+    status_icon: str
+
 # Classe pour la compatibilité entre le backend et les templates
 class UnitData:
     """Classe de données unifiée pour les templates."""
-    def __init__(self, unit=None, project_name='', from_dict=None):
-        if from_dict:
+    def __init__(self, unit=None, project_name='', from_dict=None, record=None):
+        if record is not None:
+            # Création depuis un CondoRecord (liste des condos)
+            self.id = record.id
+            self.unit_number = record.unit_number
+            self.owner_name = record.owner_name
+            self.square_feet = record.square_feet
+            self.condo_type = record.unit_type
+            self.status = record.status
+            self.monthly_fees = record.monthly_fees
+            self.building_name = project_name
+            self.project_id = ''
+        elif from_dict:
             # Création depuis un dictionnaire (compatibilité ancienne API)
             self.id = from_dict.get('id', '')  # Ajouter l'ID
             self.unit_number = from_dict.get('unit_number', '')
@@ -82,6 +111,7 @@ from src.adapters.user_repository_sqlite import UserRepositorySQLite
 from src.adapters.sqlite_adapter import SQLiteAdapter
 from src.infrastructure.config_manager import ConfigurationManager
 from src.infrastructure.logger_manager import get_logger
+from src.infrastructure.background_loop import get_background_loop
 from src.application.services.project_service import ProjectService
 
 # Configuration de l'application
@@ -125,7 +155,32 @@ def is_feature_enabled(flag_name: str) -> bool:
         logger.error(f"Erreur vérification feature flag '{flag_name}' dans template: {e}")
         return True  # Par défaut, autoriser en cas d'erreur
 
-# Rendre la fonction disponible dans tous les templates
+def are_features_enabled(*flag_names: str) -> Dict[str, bool]:
+    """Vérifie plusieurs feature flags en une seule requête pour utilisation dans les templates."""
+    global feature_flag_service
+    try:
+        if feature_flag_service is None:
+            ensure_services_initialized()
+
+        if feature_flag_service is None:
+            return dict.fromkeys(flag_names, True)  # Par défaut, autoriser si service non disponible
+
+        return feature_flag_service.are_enabled(flag_names)
+    except Exception as e:
+        logger.error(f"Erreur vérification groupée des feature flags {flag_names} dans template: {e}")
+        return dict.fromkeys(flag_names, True)  # Par défaut, autoriser en cas d'erreur
+
+# Feature flags consultés par les templates, résolus en un seul appel par requête
+TEMPLATE_FEATURE_FLAGS = ('finance_module',)
+
+@app.context_processor
+def inject_feature_flags() -> Dict[str, Any]:
+    """Expose aux templates l'état des feature flags, mémorisé pour la durée de la requête."""
+    if 'feature_flags' not in g:
+        g.feature_flags = are_features_enabled(*TEMPLATE_FEATURE_FLAGS)
+    return {'feature_flags': g.feature_flags}
+
+# Rendre la vérification unitaire disponible dans tous les templates
 app.jinja_env.globals['is_feature_enabled'] = is_feature_enabled
 
 # Service pour gérer les unités comme des condos dans l'interface
@@ -143,7 +198,7 @@ class SQLiteCondoService:
             # récupérer tous les projets
             projects_result = self.project_service.get_all_projects()
             if not projects_result['success']:
-                logger.error(f"Erreur récupération projets: {projects_result['error']}")
+                logger.error("Erreur récupération projets: %s", projects_result['error'])
                 return []
 
             condos = []
@@ -154,115 +209,127 @@ class SQLiteCondoService:
                         unit_id = unit.id if unit.id is not None else f"temp_{idx}"
 
                         # Formater pour l'affichage
-                        condo = {
-                            'id': unit_id,  # Utiliser le vrai ID de la base de données
-                            'unit_number': unit.unit_number,
-                            'owner_name': unit.owner_name,
-                            'square_feet': unit.area,
-                            'unit_type': {'name': unit.unit_type.value.upper()},
-                            'status': unit.status.value.upper(),
-                            'monthly_fees': float(unit.calculated_monthly_fees) if unit.calculated_monthly_fees else 0.0,
-                            'is_available': unit.status == UnitStatus.AVAILABLE,
-                            'type_icon': unit.type_icon,
-                            'status_icon': unit.status_icon
-                        }
+                        condo = CondoRecord(
+                            id=unit_id,  # Utiliser le vrai ID de la base de données
+                            unit_number=unit.unit_number,
+                            owner_name=unit.owner_name,
+                            square_feet=unit.area,
+                            unit_type=unit.unit_type.value,
+                            status=unit.status.value.upper(),
+                            monthly_fees=float(unit.calculated_monthly_fees) if unit.calculated_monthly_fees else 0.0,
+                            is_available=unit.status == UnitStatus.AVAILABLE,
+                            type_icon=unit.type_icon,
+                            status_icon=unit.status_icon
+                        )
                         condos.append(condo)
 
-            logger.info(f"récupération de {len(condos)} condos depuis SQLite pour rÃ´le {user_role}")
+            logger.info("récupération de %d condos depuis SQLite pour rÃ´le %s", len(condos), user_role)
             return condos
         except Exception as e:
-            logger.error(f"Erreur lors de la récupération des condos SQLite: {e}")
+            logger.error("Erreur lors de la récupération des condos SQLite: %s", e)
             return []
 
     def create_condo(self, condo_data):
         """Crée un nouveau condo (unité)."""
-        try:
-            from src.domain.entities.unit import Unit, UnitType, UnitStatus
-            from src.domain.entities.project import Project, ProjectStatus
-
-            # Trouver ou créer un projet pour cette unité
-            projects_result = self.project_service.get_all_projects()
-            project_id = None
-
-            if projects_result['success'] and projects_result['projects']:
-                # Utiliser le premier projet existant
-                project = projects_result['projects'][0]
-                project_id = project.project_id
-            else:
-                # Créer un nouveau projet d'abord
-                project = Project(
-                    name="Résidence par défaut",
-                    address="Adresse par défaut",
-                    building_area=1000.0,
-                    construction_year=2023,
-                    unit_count=1,
-                    constructor="Default Constructor",
-                    status=ProjectStatus.ACTIVE
-                )
-                save_result = self.project_service.create_project(project)
-                if not save_result['success']:
-                    logger.error(f"Erreur sauvegarde nouveau projet: {save_result['error']}")
-                    return False
-                project_id = project.project_id
+        from src.domain.exceptions.business_exceptions import (
+            DuplicateProjectError,
+            InvalidProjectDataError,
+            ProjectCreationError
+        )
 
-            # Créer l'unité avec tous les paramètres requis
+        # Les conversions des données du formulaire et create_project lèvent des exceptions ;
+        # les autres appels au ProjectService retournent un résultat {'success': ...}
+        try:
+            unit_number = intern(condo_data['unit_number'])
+            area = float(condo_data['square_feet'])
             unit_type = UnitType(condo_data.get('condo_type', 'residential'))
             status = UnitStatus(condo_data.get('status', 'available'))
+            estimated_price = float(condo_data.get('estimated_price', 0)) if condo_data.get('estimated_price') else None
+        except (KeyError, ValueError, TypeError) as e:
+            logger.error("Erreur création condo: données invalides: %s", e)
+            return False
+
+        # Trouver ou créer un projet pour cette unité
+        projects_result = self.project_service.get_all_projects()
+        project_id = None
+
+        if projects_result['success'] and projects_result['projects']:
+            # Utiliser le premier projet existant
+            project = projects_result['projects'][0]
+            project_id = project.project_id
+        else:
+            # Créer un nouveau projet d'abord
+            project = Project(
+                name="Résidence par défaut",
+                address="Adresse par défaut",
+                building_area=1000.0,
+                construction_year=2023,
+                unit_count=1,
+                constructor="Default Constructor",
+                status=ProjectStatus.ACTIVE
+            )
+            try:
+                self.project_service.create_project(project)
+            except (DuplicateProjectError, InvalidProjectDataError, ProjectCreationError) as e:
+                logger.error("Erreur sauvegarde nouveau projet: %s", e)
+                return False
+            project_id = project.project_id
 
+        try:
             unit = Unit(
-                unit_number=condo_data['unit_number'],
+                unit_number=unit_number,
                 project_id=project_id,
-                area=float(condo_data['square_feet']),
+                area=area,
                 unit_type=unit_type,
                 status=status,
                 owner_name=condo_data.get('owner_name', ''),
-                estimated_price=float(condo_data.get('estimated_price', 0)) if condo_data.get('estimated_price') else None
+                estimated_price=estimated_price
             )
+        except ValueError as e:
+            logger.error("Erreur création condo: %s", e)
+            return False
 
-            # Récupérer le projet cible et ajouter l'unité
-            target_project_result = self.project_service.get_project_by_id(project_id)
-            if not target_project_result['success']:
-                logger.error(f"Impossible de récupérer le projet cible: {target_project_result['error']}")
-                return False
-
-            target_project = target_project_result['project']
-            target_project.units.append(unit)
-
-            # Sauvegarder le projet avec la nouvelle unité
-            save_result = self.project_service.update_project(target_project)
-            if not save_result['success']:
-                logger.error(f"Erreur sauvegarde unité: {save_result['error']}")
-                return False
+        # Récupérer le projet cible et ajouter l'unité
+        target_project_result = self.project_service.get_project_by_id(project_id)
+        if not target_project_result['success']:
+            logger.error("Impossible de récupérer le projet cible: %s", target_project_result['error'])
+            return False
 
-            logger.info(f"Condo créé avec succès: {condo_data['unit_number']}")
-            return True
+        target_project = target_project_result['project']
+        target_project.units.append(unit)
 
-        except Exception as e:
-            logger.error(f"Erreur création condo: {e}")
+        # Sauvegarder le projet avec la nouvelle unité
+        save_result = self.project_service.update_project(target_project)
+        if not save_result['success']:
+            logger.error("Erreur sauvegarde unité: %s", save_result['error'])
             return False
 
+        logger.info("Condo créé avec succès: %s", unit_number)
+        return True
+
     def get_condo_by_unit_number(self, unit_number):
         """Récupère un condo par son numéro d'unité."""
         try:
-            condos = self.get_all_condos()
-            for condo in condos:
-                if condo['unit_number'] == unit_number:
-                    return UnitData(from_dict=condo)
-            return None
+            # Numéros internés : la comparaison se résout par identité
+            unit_number = intern(unit_number)
+            condo = next((c for c in self.get_all_condos() if c.unit_number == unit_number), None)
+            if condo is None:
+                logger.warning("Condo introuvable pour le numéro d'unité %s", unit_number)
+                return None
+            return UnitData(record=condo)
         except Exception as e:
-            logger.error(f"Erreur récupération condo {unit_number}: {e}")
+            logger.error("Erreur récupération condo %s: %s", unit_number, e)
             return None
 
     def get_condo_by_id(self, unit_id):
         """Récupère un condo par son ID unique (conforme aux nouvelles instructions API)."""
         try:
-            condos = self.get_all_condos()
-            for condo in condos:
-                if condo['id'] == unit_id:
-                    return UnitData(from_dict=condo)
-            return None
+            condo = next((c for c in self.get_all_condos() if c.id == unit_id), None)
+            if condo is None:
+                return None
+            return UnitData(record=condo)
         except Exception as e:
-            logger.error(f"Erreur récupération condo par ID {unit_id}: {e}")
+            logger.error("Erreur récupération condo par ID %s: %s", unit_id, e)
             return None
 
     def get_condo_by_identifier(self, identifier):
@@ -295,99 +362,73 @@ class SQLiteCondoService:
             # Fallback sur unit_number pour compatibilité
             return self.get_condo_by_unit_number(identifier)
         except Exception as e:
-            logger.error(f"Erreur récupération condo par identifiant {identifier}: {e}")
+            logger.error("Erreur récupération condo par identifiant %s: %s", identifier, e)
             return None
 
     def update_condo(self, identifier, condo_data):
         """Met à jour un condo par son ID ou unit_number."""
+        from src.domain.exceptions.business_exceptions import (
+            UnitNotFoundError,
+            InvalidUnitDataError
+        )
+
         try:
-            from src.domain.exceptions.business_exceptions import (
-                UnitNotFoundError,
-                InvalidUnitDataError
-            )
-            
             # D'abord, essayer de trouver l'unité par ID (méthode préférée)
             if identifier.isdigit():
                 unit_id = int(identifier)
-                # Utiliser la nouvelle méthode pour mettre à jour directement par ID
-                try:
-                    result = self.project_service.update_unit_by_id(unit_id, condo_data)
-                    if result['success']:
-                        logger.info(f"Unité ID {unit_id} mise à jour avec succès")
-                        return True
-                    else:
-                        logger.error(f"Échec mise à jour unité ID {unit_id}: {result['error']}")
-                        return False
-                except (UnitNotFoundError, InvalidUnitDataError):
-                    raise
-
             # Fallback: recherche par unit_number (moins efficace)
             else:
-                # Récupérer tous les projets
+                identifier = intern(identifier)
                 projects_result = self.project_service.get_all_projects()
                 if not projects_result['success']:
                     raise InvalidUnitDataError("projects", f"erreur récupération projets: {projects_result['error']}")
 
-                # Trouver le projet et l'unité correspondante
-                unit_found = False
-                for project in projects_result['projects']:
-                    for unit in project.units:
-                        if unit.unit_number == identifier:
-                            # Utiliser la nouvelle méthode avec l'ID de l'unité trouvée
-                            try:
-                                result = self.project_service.update_unit_by_id(unit.id, condo_data)
-                                if result['success']:
-                                    logger.info(f"Unité {identifier} (ID {unit.id}) mise à jour avec succès")
-                                    return True
-                                else:
-                                    logger.error(f"Échec mise à jour unité {identifier}: {result['error']}")
-                                    return False
-                            except (UnitNotFoundError, InvalidUnitDataError):
-                                raise
-                            unit_found = True
-                            break
-                    if unit_found:
-                        break
-
-                if not unit_found:
+                # Trouver l'unité correspondante pour obtenir son ID
+                unit_id = next(
+                    (unit.id for project in projects_result['projects']
+                     for unit in project.units if unit.unit_number == identifier),
+                    None
+                )
+                if unit_id is None:
                     raise UnitNotFoundError(f"Unité {identifier} introuvable")
 
+            # Mettre à jour directement par ID
+            result = self.project_service.update_unit_by_id(unit_id, condo_data)
         except (UnitNotFoundError, InvalidUnitDataError):
             raise
         except Exception as e:
-            logger.error(f"Erreur lors de la modification du condo {identifier}: {e}")
+            logger.error("Erreur lors de la modification du condo %s: %s", identifier, e)
             raise InvalidUnitDataError("system", f"erreur système lors de la modification: {str(e)}")
 
+        if result['success']:
+            logger.info("Unité %s (ID %s) mise à jour avec succès", identifier, unit_id)
+            return True
+        logger.error("Échec mise à jour unité %s: %s", identifier, result['error'])
+        return False
+
     def get_statistics(self):
         """Génère les statistiques des condos."""
-        try:
-            condos = self.get_all_condos()
-            stats = {
-                'total_condos': len(condos),
-                'occupied_condos': len([c for c in condos if not c['is_available']]),
-                'available_condos': len([c for c in condos if c['is_available']]),
-                'residential_condos': len([c for c in condos if c['unit_type']['name'] == 'RESIDENTIAL']),
-                'commercial_condos': len([c for c in condos if c['unit_type']['name'] == 'COMMERCIAL']),
-                'parking_condos': len([c for c in condos if c['unit_type']['name'] == 'PARKING']),
-                'storage_condos': len([c for c in condos if c['unit_type']['name'] == 'STORAGE']),
-                'total_revenue': sum(c['monthly_fees'] for c in condos),
-                'average_fees': sum(c['monthly_fees'] for c in condos) / len(condos) if condos else 0
-            }
-            logger.debug(f"Statistiques générées: {stats}")
-            return stats
-        except Exception as e:
-            logger.error(f"Erreur génération statistiques: {e}")
-            return {
-                'total_condos': 0,
-                'occupied_condos': 0,
-                'available_condos': 0,
-                'residential_condos': 0,
-                'commercial_condos': 0,
-                'parking_condos': 0,
-                'storage_condos': 0,
-                'total_revenue': 0,
-                'average_fees': 0
-            }
+        # Totaux agrégés par SQLite : aucune unité n'est matérialisée
+        result = self.project_service.get_units_overview()
+        if not result['success']:
+            logger.error("Erreur calcul statistiques des condos: %s", result['error'])
+        overview = result.get('statistics', {})
+        units_by_type = overview.get('units_by_type', {})
+        total = overview.get('total_units', 0)
+        total_revenue = overview.get('total_monthly_fees', 0.0)
+        stats = {
+            'total_condos': total,
+            'occupied_condos': overview.get('occupied_units', 0),
+            'available_condos': overview.get('available_units', 0),
+            'residential_condos': units_by_type.get('RESIDENTIAL', 0),
+            'commercial_condos': units_by_type.get('COMMERCIAL', 0),
+            'parking_condos': units_by_type.get('PARKING', 0),
+            'storage_condos': units_by_type.get('STORAGE', 0),
+            'total_revenue': total_revenue,
+            'average_fees': total_revenue / total if total else 0
+        }
+        logger.debug("Statistiques générées: %s", stats)
+        return stats
 
 def calculate_relative_time(dt):
     """Calcule le temps relatif par rapport à maintenant."""
@@ -766,7 +807,7 @@ def login():
                 return await auth_service.authenticate(username, password)
 
             # Exécuter l'authentification asynchrone
-            authenticated_user = asyncio.run(authenticate_user())
+            authenticated_user = get_background_loop().run(authenticate_user())
 
             if authenticated_user:
                 # Authentification réussie
@@ -781,7 +822,7 @@ def login():
                     await user_repository.save_user(authenticated_user)
 
                 try:
-                    asyncio.run(update_last_login())
+                    get_background_loop().run(update_last_login())
                 except Exception as e:
                     logger.warning(f"Erreur mise à jour derniÃ¨re connexion pour {username}: {e}")
 
@@ -1188,7 +1229,9 @@ def users_new():
                                      error="RÃ´le invalide"), 400
 
             # Utilisation du service de création
-            asyncio.run(create_user_async(username, email, password, full_name, role, condo_unit))
+            get_background_loop().run(create_user_async(username, email, password, full_name, role, condo_unit))
+            if user_service is not None:
+                user_service.clear_cache()
 
             logger.info(f"Utilisateur créé avec succès: {username}")
             return render_template('success.html',
@@ -1318,7 +1361,6 @@ def api_delete_user(username):
 
         # Vérifier l'auto-suppression
         if not user_service.can_delete_user(username, current_username):
-            logger.warning(f"Tentative d'auto-suppression refusée: {current_username}")
             return jsonify({'success': False, 'error': 'Impossible de supprimer votre propre compte'}), 400
 
         # Supprimer l'utilisateur
@@ -1523,7 +1565,7 @@ def profile():
         async def get_user_data():
             return await user_repository.get_user_by_username(username)
 
-        user_data = asyncio.run(get_user_data())
+        user_data = get_background_loop().run(get_user_data())
 
         logger.info(f"Données utilisateur récupérées pour {username}: {user_data is not None}")
         if user_data:
@@ -1670,7 +1712,7 @@ def change_password():
                 username, current_password, new_password
             )
 
-        result = asyncio.run(change_password_async())
+        result = get_background_loop().run(change_password_async())
 
         if result:
             # Rediriger vers une page de succès
@@ -1755,7 +1797,7 @@ def admin_setup_password():
                 username, current_password, new_password
             )
 
-        result = asyncio.run(change_password_async())
+        result = get_background_loop().run(change_password_async())
 
         if result:
             # Marquer que l'admin a changé son mot de passe
@@ -2115,33 +2157,11 @@ def projets():
 
             # Calcul des statistiques globales basées sur les vraies données
             total_units = sum(p.unit_count for p in projects)
-            total_units_with_data = sum(len(p.units) for p in projects if p.units)
 
-            # Calculer les unités vendues et disponibles
-            occupied_units = 0
-            available_units = 0
-            for project in projects:
-                if project.units:
-                    for unit in project.units:
-                        if hasattr(unit, 'is_available') and callable(getattr(unit, 'is_available')):
-                            # Utiliser la méthode is_available() de l'entité Unit
-                            if unit.is_available():
-                                available_units += 1
-                            else:
-                                occupied_units += 1
-                        elif hasattr(unit, 'status'):
-                            # Fallback: Comparaison directe avec l'enum
-                            from src.domain.entities.unit import UnitStatus
-                            if unit.status == UnitStatus.AVAILABLE:
-                                available_units += 1
-                            else:
-                                occupied_units += 1
-                        elif hasattr(unit, 'owner_name'):
-                            # Fallback final: Vérification par propriétaire
-                            if unit.owner_name and unit.owner_name != 'Disponible':
-                                occupied_units += 1
-                            else:
-                                available_units += 1
+            # Calculer les unités vendues et disponibles (is_available() de l'entité Unit)
+            loaded_units = sum(len(p.units) for p in projects)
+            available_units = sum(1 for p in projects for unit in p.units if unit.is_available())
+            occupied_units = loaded_units - available_units
 
             # Statistiques pour la page
             stats = {
@@ -2420,14 +2440,13 @@ def project_api_statistics(project_id):
     try:
         from src.application.services.project_service import ProjectService
         project_service = ProjectService()
-        result = project_service.get_project_by_id(project_id)
+        # Statistiques agrégées en SQL et mémorisées jusqu'à la prochaine écriture du projet
+        result = project_service.get_project_statistics_by_id(project_id)
 
         if result['success']:
-            project = result['project']
-            stats = project.get_project_statistics()
             return jsonify({
                 'success': True,
-                'statistics': stats
+                'statistics': result['statistics']
             })
         else:
             return jsonify({
@@ -14,10 +14,10 @@ Architecture :
 """
 
 from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify, abort
-import asyncio
 import functools
 import logging
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, Optional, Callable
 from datetime import datetime
 import json
@@ -28,6 +28,21 @@ from src.domain.services.authentication_service import AuthenticationService
 from src.adapters.user_repository_sqlite import UserRepositorySQLite
 from src.adapters.sqlite_adapter import SQLiteAdapter
 from src.infrastructure.config_manager import ConfigurationManager
+from src.infrastructure.background_loop import get_background_loop
+
+# Icônes (immuables) d'affichage des condos par type et par statut
+_CONDO_TYPE_ICONS = MappingProxyType({
+    'RESIDENTIAL': '🏠',
+    'COMMERCIAL': '🏢',
+    'PARKING': '🚗',
+    'STORAGE': '📦'
+})
+
+_CONDO_STATUS_ICONS = MappingProxyType({
+    'ACTIVE': '✅',
+    'INACTIVE': '❌',
+    'MAINTENANCE': '🔧'
+})
 
 # Configuration de l'application
 app = Flask(__name__,
@@ -345,22 +360,11 @@ def init_services():
 
             def _get_type_icon(self, condo_type):
                 """Retourne l'icône du type de condo."""
-                icons = {
-                    'RESIDENTIAL': '🏠',
-                    'COMMERCIAL': '🏢',
-                    'PARKING': '🚗',
-                    'STORAGE': '📦'
-                }
-                return icons.get(condo_type.value.upper(), '🏠')
+                return _CONDO_TYPE_ICONS.get(condo_type.value.upper(), '🏠')
 
             def _get_status_icon(self, status):
                 """Retourne l'icône du statut."""
-                icons = {
-                    'ACTIVE': '✅',
-                    'INACTIVE': '❌',
-                    'MAINTENANCE': '🔧'
-                }
-                return icons.get(status.value.upper(), '✅')
+                return _CONDO_STATUS_ICONS.get(status.value.upper(), '✅')
 
             def create_condo(self, condo_data):
                 """Crée un nouveau condo dans SQLite."""
@@ -629,7 +633,7 @@ def login():
                 return await auth_service.authenticate(username, password)
 
             # Exécuter l'authentification asynchrone
-            authenticated_user = asyncio.run(authenticate_user())
+            authenticated_user = get_background_loop().run(authenticate_user())
 
             if authenticated_user:
                 # Authentification réussie
@@ -644,7 +648,7 @@ def login():
                     await user_repository.save_user(authenticated_user)
 
                 try:
-                    asyncio.run(update_last_login())
+                    get_background_loop().run(update_last_login())
                 except Exception as e:
                     logger.warning(f"Erreur mise à jour dernière connexion pour {username}: {e}")
 
@@ -1015,7 +1019,9 @@ def users_new():
                                      error="Rôle invalide"), 400
 
             # Utilisation du service de création
-            asyncio.run(create_user_async(username, email, password, full_name, role, condo_unit))
+            get_background_loop().run(create_user_async(username, email, password, full_name, role, condo_unit))
+            if user_service is not None:
+                user_service.clear_cache()
 
             logger.info(f"Utilisateur créé avec succès: {username}")
             return render_template('success.html',
@@ -1250,7 +1256,7 @@ def profile():
         async def get_user_data():
             return await user_repository.get_user_by_username(username)
 
-        user_data = asyncio.run(get_user_data())
+        user_data = get_background_loop().run(get_user_data())
 
         logger.info(f"Données utilisateur récupérées pour {username}: {user_data is not None}")
         if user_data:
@@ -1380,7 +1386,7 @@ def change_password():
                 username, current_password, new_password
             )
 
-        result = asyncio.run(change_password_async())
+        result = get_background_loop().run(change_password_async())
 
         if result:
             # Rediriger vers une page de succès
@@ -2148,6 +2154,10 @@ def is_feature_enabled(feature_name):
     except Exception:
         return False
 
+# Les templates partagés avec condo_app lisent feature_flags ; cette application n'a pas
+# de service de feature flags : aucun flag n'est actif (mapping constant, sans lecture)
+app.jinja_env.globals['feature_flags'] = MappingProxyType({})
+
 @app.template_global()
 def get_current_user():
     """Fonction de template pour obtenir l'utilisateur actuel."""
@@ -894,10 +894,7 @@ class TestProjectAcceptance(unittest.TestCase):
         # Mock du repository pour les opérations de sauvegarde
         self.mock_project_repository.save_project.return_value = existing_project.project_id
         self.mock_project_repository.update_project.return_value = True
-        self.mock_project_repository.get_project_by_id.return_value = {
-            'success': True,
-            'project': existing_project
-        }
+        self.mock_project_repository.get_project_by_id.return_value = existing_project
         
         # QUAND: L'administrateur modifie les informations autorisées
         # Créer une copie pour la modification
@@ -914,6 +911,9 @@ class TestProjectAcceptance(unittest.TestCase):
         updated_project.building_area = 2000.0  # Modifiable (correction d'erreur)
         updated_project.status = 'completed'  # Modifiable
         
+        # La base renvoie le projet modifié une fois la sauvegarde effectuée
+        self.mock_project_repository.get_all_projects.return_value = [updated_project]
+        
         # Mock de la sauvegarde pour réussir
         with patch.object(self.project_service, '_save_projects') as mock_save:
             mock_save.return_value = None  # Sauvegarde réussie
@@ -1012,11 +1012,8 @@ class TestProjectAcceptance(unittest.TestCase):
         # Ajouter le projet à la liste interne du service
         self.project_service._projects = [project_with_units]
         
-        # Mock pour la cohérence (optionnel)
-        self.mock_project_repository.get_project_by_id.return_value = {
-            'success': True,
-            'project': project_with_units
-        }
+        # Le repository retourne le projet lu par ID
+        self.mock_project_repository.get_project_by_id.return_value = project_with_units
         
         # QUAND: Récupération des données pour le popup d'édition
         result = self.project_service.get_project_by_id(project_with_units.project_id)
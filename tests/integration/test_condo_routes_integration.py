@@ -227,6 +227,21 @@ class TestCondoRoutesIntegration(unittest.TestCase):
         # Doit retourner le formulaire avec erreurs ou rediriger
         self.assertIn(response.status_code, [200, 302])
 
+    @patch('src.application.services.system_config_service.SystemConfigService.is_admin_password_changed', return_value=True)
+    @patch.object(ProjectService, 'get_project_statistics_by_id')
+    def test_project_statistics_api_uses_service_statistics(self, mock_statistics, mock_admin_password_changed):
+        """Test que l'API de statistiques retourne les statistiques mémorisées du service."""
+        mock_statistics.return_value = {
+            'success': True,
+            'statistics': {'total_units': 4, 'occupied_units': 1}
+        }
+
+        response = self.client.get('/api/projets/projet-123/statistics')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['statistics'], {'total_units': 4, 'occupied_units': 1})
+        mock_statistics.assert_called_once_with('projet-123')
+
 
 if __name__ == '__main__':
     unittest.main()
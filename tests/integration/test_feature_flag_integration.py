@@ -219,6 +219,23 @@ class TestFeatureFlagIntegration(unittest.TestCase):
         ]
         self.mock_repository.is_enabled.assert_has_calls(expected_calls)
 
+    @patch('src.web.condo_app.feature_flag_service')
+    def test_template_feature_flags_resolved_once_per_request(self, mock_service):
+        """Test que les flags des templates sont lus en un seul appel groupé par requête."""
+        # Arrange
+        from src.web.condo_app import app, inject_feature_flags
+        mock_service.are_enabled.return_value = {'finance_module': False}
+        
+        # Act - base.html et la page consultent les flags dans la même requête
+        with app.test_request_context('/'):
+            first = inject_feature_flags()
+            second = inject_feature_flags()
+        
+        # Assert
+        self.assertFalse(first['feature_flags']['finance_module'])
+        self.assertIs(second['feature_flags'], first['feature_flags'])
+        mock_service.are_enabled.assert_called_once_with(('finance_module',))
+
 
 if __name__ == '__main__':
     unittest.main()
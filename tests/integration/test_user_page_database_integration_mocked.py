@@ -23,6 +23,11 @@ class TestUserPageIntegrationMocked(unittest.TestCase):
         self.app.config['WTF_CSRF_ENABLED'] = False
         self.client = self.app.test_client()
         
+        # Repartir d'un cache utilisateurs vide pour que les lectures atteignent le repository mocké
+        from src.web import condo_app
+        condo_app.ensure_services_initialized()
+        condo_app.user_service.clear_cache()
+        
         # Simuler un utilisateur admin connecté
         with self.client.session_transaction() as sess:
             sess['user_id'] = 1
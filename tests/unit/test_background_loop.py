@@ -0,0 +1,63 @@
+"""
+Tests unitaires pour la boucle d'événements d'arrière-plan
+"""
+import asyncio
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from src.infrastructure import background_loop
+from src.infrastructure.background_loop import BackgroundEventLoop, get_background_loop, new_event_loop
+
+
+class TestBackgroundEventLoop(unittest.TestCase):
+    """Tests unitaires pour BackgroundEventLoop"""
+
+    def setUp(self):
+        """Démarre une boucle dédiée pour chaque test"""
+        self.background_loop = BackgroundEventLoop()
+
+    def tearDown(self):
+        """Arrête la boucle du test"""
+        self.background_loop.close()
+
+    def test_run_returns_coroutine_result_from_loop_thread(self):
+        """Test que la coroutine s'exécute sur le thread de la boucle"""
+        async def current_thread_name():
+            await asyncio.sleep(0)
+            return threading.current_thread().name
+
+        self.assertEqual(self.background_loop.run(current_thread_name()), 'BackgroundEventLoop')
+
+    def test_run_propagates_coroutine_exception(self):
+        """Test que l'exception de la coroutine est relancée à l'appelant"""
+        async def failing():
+            raise ValueError("lecture impossible")
+
+        with self.assertRaises(ValueError):
+            self.background_loop.run(failing())
+
+    def test_close_stops_loop(self):
+        """Test que close() arrête la boucle et son thread"""
+        self.background_loop.close()
+
+        self.assertFalse(self.background_loop.is_running())
+
+    def test_new_event_loop_uses_uvloop_when_available(self):
+        """Test que uvloop est utilisé s'il est installé, sinon la boucle standard"""
+        fake_uvloop = Mock()
+        with patch.object(background_loop, 'uvloop', fake_uvloop):
+            self.assertIs(new_event_loop(), fake_uvloop.new_event_loop.return_value)
+
+        with patch.object(background_loop, 'uvloop', None):
+            loop = new_event_loop()
+            self.addCleanup(loop.close)
+            self.assertIsInstance(loop, asyncio.AbstractEventLoop)
+
+    def test_shared_loop_is_reused(self):
+        """Test que la boucle du processus est partagée entre les appels"""
+        self.assertIs(get_background_loop(), get_background_loop())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""
+Tests unitaires pour le cache invalidé par étiquettes
+"""
+import unittest
+from unittest.mock import patch
+
+from src.infrastructure.cache_manager import TaggedCache
+
+
+class TestTaggedCache(unittest.TestCase):
+    """Tests unitaires pour TaggedCache"""
+
+    def setUp(self):
+        """Configuration initiale pour chaque test"""
+        self.cache = TaggedCache()
+
+    def test_get_returns_default_when_missing(self):
+        """Test qu'une clé absente retourne la valeur par défaut"""
+        self.assertIsNone(self.cache.get('absente'))
+        self.assertEqual(self.cache.get('absente', []), [])
+
+    def test_invalidate_removes_only_tagged_entries(self):
+        """Test que l'invalidation ne touche que les entrées des étiquettes données"""
+        self.cache.set('all_projects', ['p1', 'p2'], {'all_projects'})
+        self.cache.set('project:p1', 'p1', {'p1'})
+        self.cache.set('project:p2', 'p2', {'p2'})
+
+        self.cache.invalidate({'all_projects', 'p1'})
+
+        self.assertIsNone(self.cache.get('all_projects'))
+        self.assertIsNone(self.cache.get('project:p1'))
+        self.assertEqual(self.cache.get('project:p2'), 'p2')
+
+    def test_entry_expires_after_ttl(self):
+        """Test qu'une entrée avec durée de vie n'est plus retournée après expiration"""
+        with patch('src.infrastructure.cache_manager.time.monotonic', side_effect=[100.0, 104.0, 105.0]):
+            self.cache.set('users:all', ['alice'], {'users'}, ttl=5)
+
+            self.assertEqual(self.cache.get('users:all'), ['alice'])
+            self.assertIsNone(self.cache.get('users:all'))
+
+    def test_shared_returns_same_cache_per_namespace(self):
+        """Test que le cache partagé est unique par espace de noms"""
+        self.assertIs(TaggedCache.shared('test-ns'), TaggedCache.shared('test-ns'))
+        self.assertIsNot(TaggedCache.shared('test-ns'), TaggedCache.shared('autre-ns'))
+
+
+if __name__ == '__main__':
+    unittest.main()
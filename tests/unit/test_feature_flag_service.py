@@ -95,5 +95,42 @@ class TestFeatureFlagService(unittest.TestCase):
         self.mock_repository.is_enabled.assert_called_once_with(feature_name)
 
 
+    def test_are_enabled_uses_single_repository_call(self):
+        """Test que are_enabled interroge le repository une seule fois pour tous les flags."""
+        # Arrange
+        feature_names = ['finance_module', 'analytics_module']
+        self.mock_repository.is_enabled_many.return_value = {
+            'finance_module': True,
+            'analytics_module': False
+        }
+        
+        # Act
+        result = self.service.are_enabled(feature_names)
+        
+        # Assert
+        self.assertEqual(result, {'finance_module': True, 'analytics_module': False})
+        self.mock_repository.is_enabled_many.assert_called_once_with(feature_names)
+        self.mock_repository.is_enabled.assert_not_called()
+    
+    def test_are_enabled_handles_exception(self):
+        """Test que are_enabled retourne False pour tous les flags en cas d'erreur."""
+        # Arrange
+        self.mock_repository.is_enabled_many.side_effect = Exception("Database error")
+        
+        # Act
+        result = self.service.are_enabled(['finance_module', 'analytics_module'])
+        
+        # Assert
+        self.assertEqual(result, {'finance_module': False, 'analytics_module': False})
+    
+    def test_are_enabled_with_empty_list(self):
+        """Test que are_enabled n'interroge pas le repository sans flags."""
+        # Act
+        result = self.service.are_enabled([])
+        
+        # Assert
+        self.assertEqual(result, {})
+        self.mock_repository.is_enabled_many.assert_not_called()
+
 if __name__ == '__main__':
     unittest.main()
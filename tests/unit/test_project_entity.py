@@ -149,6 +149,18 @@ class TestProjectEntity(unittest.TestCase):
             self.assertGreater(unit.area, expected_avg_area * 0.6)
             self.assertLess(unit.area, expected_avg_area * 1.4)
     
+    def test_unites_generees_partagent_horodatage(self):
+        """Les unités d'un même lot partagent un seul horodatage de création"""
+        # Arrange
+        project = Project(**self.valid_project_data)
+
+        # Act
+        units = project.generate_units()
+
+        # Assert
+        self.assertEqual(len({(u.created_at, u.updated_at) for u in units}), 1)
+        self.assertEqual(units[0].created_at, units[0].updated_at)
+
     def test_serialization_projet(self):
         """Test de sérialisation/désérialisation du projet"""
         # Arrange
@@ -194,6 +206,17 @@ class TestProjectEntity(unittest.TestCase):
         expected_average = project.building_area / project.unit_count
         self.assertAlmostEqual(average_area, expected_average, delta=50.0)  # Tolérance de 50 sq ft
 
+    def test_project_utilise_slots(self):
+        """Les attributs du projet sont stockés dans des slots, sans __dict__"""
+        # Arrange & Act
+        project = Project(**self.valid_project_data)
+        
+        # Assert
+        self.assertFalse(hasattr(project, '__dict__'))
+        self.assertIn('units', Project.__slots__)
+        self.assertEqual(project.status.value, 'PLANNING')
+        self.assertEqual(project.units, [])
+
 
 if __name__ == '__main__':
     unittest.main()
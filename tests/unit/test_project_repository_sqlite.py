@@ -0,0 +1,193 @@
+"""
+Tests unitaires pour ProjectRepositorySQLite
+
+Tests exécutés sur une base SQLite temporaire initialisée avec le schéma
+de migration, afin de valider le comportement réel des requêtes.
+"""
+
+import unittest
+import sqlite3
+import tempfile
+import shutil
+import os
+from pathlib import Path
+
+from src.adapters.project_repository_sqlite import ProjectRepositorySQLite, ALL_PROJECTS_TAG
+from src.domain.entities.project import Project
+from src.domain.entities.unit import UnitStatus
+
+SCHEMA_PATH = Path(__file__).parent.parent.parent / "data" / "migrations" / "001_recreate_schemas_condos1db.sql"
+
+
+class TestProjectRepositorySQLite(unittest.TestCase):
+    """Tests unitaires pour le repository SQLite des projets."""
+
+    def setUp(self):
+        """Crée une base temporaire avec le schéma complet."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'test_projects.db')
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executescript(SCHEMA_PATH.read_text(encoding='utf-8'))
+        self.repository = ProjectRepositorySQLite(db_path=self.db_path)
+
+    def tearDown(self):
+        """Ferme le pool partagé et supprime la base temporaire."""
+        self.repository._pool.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _make_project(self) -> Project:
+        """Crée un projet de 4 unités générées."""
+        project = Project(
+            name='Résidence du Parc',
+            address='123 Rue de la Paix, Montréal, QC H1A 1A1',
+            building_area=5000.0,
+            construction_year=2020,
+            unit_count=4,
+            constructor='Construction ABC Inc.'
+        )
+        project.generate_units()
+        return project
+
+    def test_database_uses_wal_journal(self):
+        """Le repository active le journal WAL sur une base fichier."""
+        with sqlite3.connect(self.db_path) as conn:
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+        self.assertEqual(journal_mode, 'wal')
+
+    def test_writer_connection_applies_session_pragmas(self):
+        """La connexion d'écriture du pool applique les PRAGMA de session."""
+        with self.repository._pool.writer() as conn:
+            self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)
+            self.assertEqual(conn.execute("PRAGMA busy_timeout").fetchone()[0], 5000)
+            self.assertEqual(conn.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+            self.assertEqual(conn.execute("PRAGMA temp_store").fetchone()[0], 2)
+            self.assertEqual(conn.execute("PRAGMA cache_size").fetchone()[0], -64000)
+
+    def test_repositories_share_pool_for_same_database(self):
+        """Deux repositories sur le même fichier partagent le même pool."""
+        other = ProjectRepositorySQLite(db_path=self.db_path)
+
+        self.assertIs(other._pool, self.repository._pool)
+
+    def test_reader_connection_is_read_only(self):
+        """Les connexions de lecture sont ouvertes en mode lecture seule."""
+        with self.repository._pool.reader() as conn:
+            with self.assertRaises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM projects")
+
+    def test_save_project_round_trips_units(self):
+        """Les unités insérées en lot sont relues avec leurs propriétaires."""
+        project = self._make_project()
+        project.units[1].transfer_ownership('Marie Tremblay')
+
+        self.repository.save_project(project)
+        loaded = self.repository.get_all_projects()
+
+        self.assertEqual(len(loaded), 1)
+        self.assertEqual([u.unit_number for u in loaded[0].units], [u.unit_number for u in project.units])
+        self.assertEqual(loaded[0].units[1].owner_name, 'Marie Tremblay')
+
+    def test_writes_report_touched_cache_tags(self):
+        """Les écritures retournent les étiquettes de cache du projet touché."""
+        project = self._make_project()
+
+        saved = self.repository.save_project(project)
+        transferred = self.repository.transfer_units_bulk(
+            project.project_id, [(project.units[0].unit_number, 'Jean Dupont', 'available')]
+        )
+
+        expected_tags = {ALL_PROJECTS_TAG, project.project_id}
+        self.assertEqual(saved.project_id, project.project_id)
+        self.assertEqual(saved.invalidation_tags, expected_tags)
+        self.assertEqual(transferred.invalidation_tags, expected_tags)
+        self.assertEqual(transferred.rowcount, 1)
+
+    def test_get_project_by_id_loads_single_project(self):
+        """La lecture par ID retourne le projet et ses unités, ou None s'il n'existe pas."""
+        project = self._make_project()
+        self.repository.save_project(project)
+
+        loaded = self.repository.get_project_by_id(project.project_id)
+
+        self.assertEqual(loaded.name, 'Résidence du Parc')
+        self.assertEqual(len(loaded.units), 4)
+        self.assertIsNone(self.repository.get_project_by_id('inexistant'))
+
+    def test_update_unit_maps_form_fields_to_columns(self):
+        """Les champs de formulaire sont traduits vers les colonnes de la table units."""
+        project = self._make_project()
+        self.repository.save_project(project)
+        unit_id = self.repository.get_project_by_id(project.project_id).units[0].id
+
+        updated = self.repository.update_unit(unit_id, {'square_feet': 850.0, 'owner_name': 'Jean Dupont'})
+        unit = self.repository.get_project_by_id(project.project_id).units[0]
+
+        self.assertTrue(updated)
+        self.assertEqual(updated.invalidation_tags, {ALL_PROJECTS_TAG, project.project_id})
+        self.assertEqual(unit.area, 850.0)
+        self.assertEqual(unit.owner_name, 'Jean Dupont')
+
+    def test_delete_project_cascade_reports_deleted_project(self):
+        """La suppression retourne le nom et le nombre d'unités du projet supprimé."""
+        project = self._make_project()
+        self.repository.save_project(project)
+
+        result = self.repository.delete_project_cascade(project.project_id)
+
+        self.assertEqual(result, {'deleted': True, 'project_name': 'Résidence du Parc', 'total_units': 4})
+        self.assertIsNone(self.repository.get_project_by_id(project.project_id))
+        with self.repository._pool.reader() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM units").fetchone()[0], 0)
+        self.assertEqual(
+            self.repository.delete_project_cascade(project.project_id),
+            {'deleted': False, 'project_name': None, 'total_units': 0}
+        )
+
+    def test_get_status_counts_matches_in_memory_statistics(self):
+        """Les statistiques issues du GROUP BY égalent celles calculées en mémoire."""
+        project = self._make_project()
+        project.units[0].transfer_ownership('Jean Dupont')
+        project.units[1].reserve()
+        self.repository.save_project(project)
+        loaded = self.repository.get_all_projects()[0]
+
+        sql_stats = Project.compute_statistics(self.repository.get_status_counts(project.project_id))
+
+        self.assertEqual(sql_stats, loaded.get_project_statistics())
+        self.assertEqual(sql_stats['occupied_units'], 1)
+        self.assertEqual(sql_stats['reserved_units'], 1)
+
+    def test_get_unit_totals_groups_units_by_status_and_type(self):
+        """Les totaux agrégés comptent les unités et additionnent leurs frais stockés."""
+        project = self._make_project()
+        project.units[0].reserve()
+        project.units[0].calculated_monthly_fees = '450.00'
+        project.units[1].calculated_monthly_fees = '375.50'
+        self.repository.save_project(project)
+
+        totals = self.repository.get_unit_totals()
+
+        self.assertEqual(sum(count for _, _, count, _ in totals), 4)
+        self.assertEqual(sum(count for status, _, count, _ in totals if status == UnitStatus.RESERVED), 1)
+        self.assertAlmostEqual(sum(fees for _, _, _, fees in totals), 825.5)
+
+    def test_get_projects_summary_aggregates_units_per_project(self):
+        """Le résumé compte les unités totales et occupées de chaque projet."""
+        project = self._make_project()
+        project.units[0].transfer_ownership('Jean Dupont')
+        self.repository.save_project(project)
+
+        summary = self.repository.get_projects_summary()
+
+        self.assertEqual(summary, [{
+            'project_id': project.project_id,
+            'name': 'Résidence du Parc',
+            'total_units': 4,
+            'occupied_units': 1,
+            'available_units': 3
+        }])
+
+
+if __name__ == '__main__':
+    unittest.main()
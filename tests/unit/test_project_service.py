@@ -6,14 +6,18 @@ import unittest
 from unittest.mock import Mock, patch, AsyncMock
 import sys
 import os
+import time
 from datetime import datetime
 
 # Ajouter le répertoire src au chemin Python
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-from src.application.services.project_service import ProjectService
+from src.application.services.project_service import ProjectService, PROJECT_CACHE_TTL_SECONDS
+from src.adapters.project_repository_sqlite import SaveResult
+from src.infrastructure.cache_manager import TaggedCache
 from src.domain.entities.project import Project
 from src.domain.entities.unit import Unit, UnitType, UnitStatus
+from src.domain.exceptions.business_exceptions import DuplicateProjectError
 
 
 class TestProjectService(unittest.TestCase):
@@ -23,6 +27,7 @@ class TestProjectService(unittest.TestCase):
         """Configuration initiale pour chaque test"""
         # Mock du repository
         self.mock_project_repository = Mock()
+        self.mock_project_repository.get_all_projects.return_value = []
         self.mock_condo_repository = Mock()
         
         # Service à tester
@@ -41,11 +46,9 @@ class TestProjectService(unittest.TestCase):
             'constructor': 'Construction ABC Inc.'
         }
     
-    @patch('application.services.project_service.asyncio.run')
-    def test_create_project_success(self, mock_asyncio_run):
+    def test_create_project_success(self):
         """Test de création réussie d'un projet avec unités"""
         # Arrange
-        mock_asyncio_run.return_value = True  # Simulation succès save
         self.mock_project_repository.save_project.return_value = AsyncMock(return_value=True)
         self.mock_condo_repository.save_unit.return_value = AsyncMock(return_value=True)
         
@@ -64,6 +67,33 @@ class TestProjectService(unittest.TestCase):
         self.assertEqual(project.unit_count, 15)
         self.assertEqual(len(project.units), 15)
     
+    def test_create_project_with_project_entity(self):
+        """Test de création directe d'un projet à partir d'une entité Project"""
+        # Arrange
+        project = Project(**self.valid_project_data)
+        self.mock_project_repository.get_project_by_id.return_value = None
+        
+        # Act
+        result = self.project_service.create_project(project)
+        
+        # Assert
+        self.assertTrue(result['success'])
+        self.assertEqual(result['project_id'], project.project_id)
+        self.mock_project_repository.save_project.assert_called_once_with(project)
+
+    def test_create_project_rejects_casefold_duplicate_name(self):
+        """Test que create_project refuse un nom déjà pris, sans tenir compte de la casse"""
+        # Arrange
+        self.mock_project_repository.get_all_projects.return_value = [Project(**self.valid_project_data)]
+        self.mock_project_repository.get_project_by_id.return_value = None
+        duplicate_data = self.valid_project_data.copy()
+        duplicate_data['name'] = self.valid_project_data['name'].upper()
+        
+        # Act & Assert
+        with self.assertRaises(DuplicateProjectError):
+            self.project_service.create_project(Project(**duplicate_data))
+        self.mock_project_repository.save_project.assert_not_called()
+    
     def test_create_project_validation_error(self):
         """Test de gestion d'erreur de validation lors de création"""
         # Arrange
@@ -147,8 +177,12 @@ class TestProjectService(unittest.TestCase):
         project.units[0].transfer_ownership("Jean Dupont")
         project.units[1].transfer_ownership("Marie Tremblay")
         
-        # Mock le repository pour retourner notre projet
+        # Mock le repository pour retourner notre projet et ses agrégats par statut
         self.mock_project_repository.get_all_projects.return_value = [project]
+        self.mock_project_repository.get_status_counts.return_value = [
+            (UnitStatus.AVAILABLE, 'RESIDENTIAL', True, 2, 0.0),
+            (UnitStatus.AVAILABLE, 'RESIDENTIAL', False, 13, 0.0)
+        ]
         
         # Act
         result = self.project_service.get_project_statistics(project.project_id)
@@ -158,9 +192,35 @@ class TestProjectService(unittest.TestCase):
         stats = result['statistics']
         
         self.assertEqual(stats['total_units'], 15)
+        self.mock_project_repository.save_project.assert_not_called()
         self.assertEqual(stats['occupied_units'], 2)
         self.assertEqual(stats['available_units'], 13)
         self.assertAlmostEqual(stats['occupancy_rate'], (2/15)*100, places=1)
+        self.mock_project_repository.get_status_counts.assert_called_once_with(project.project_id)
+
+    def test_get_units_overview_aggregates_unit_totals(self):
+        """Test que les statistiques globales des unités proviennent des totaux SQL, mémorisés"""
+        # Arrange
+        self.mock_project_repository.get_unit_totals.return_value = [
+            (UnitStatus.AVAILABLE, 'RESIDENTIAL', 3, 900.0),
+            (UnitStatus.RESERVED, 'RESIDENTIAL', 1, 300.0),
+            (UnitStatus.AVAILABLE, 'PARKING', 2, 75.0)
+        ]
+
+        # Act
+        result = self.project_service.get_units_overview()
+        self.project_service.get_units_overview()
+
+        # Assert
+        self.assertTrue(result['success'])
+        stats = result['statistics']
+        self.assertEqual(stats['total_units'], 6)
+        self.assertEqual(stats['available_units'], 5)
+        self.assertEqual(stats['occupied_units'], 1)
+        self.assertEqual(stats['units_by_type']['RESIDENTIAL'], 4)
+        self.assertEqual(stats['units_by_type']['STORAGE'], 0)
+        self.assertEqual(stats['total_monthly_fees'], 1275.0)
+        self.mock_project_repository.get_unit_totals.assert_called_once_with()
 
     def test_unit_area_distribution(self):
         """Test de la distribution des superficies des unités"""
@@ -242,10 +302,9 @@ class TestProjectService(unittest.TestCase):
         
         # Configuration des mocks pour éviter l'erreur de chargement
         self.mock_project_repository.get_all_projects.return_value = [mock_project]
-        self.mock_project_repository.delete_project.return_value = True
-        
-        # Recharger manuellement pour que les projets soient dans la liste
-        self.project_service._load_projects()
+        self.mock_project_repository.delete_project_cascade.return_value = {
+            'deleted': True, 'project_name': project_name, 'total_units': 2
+        }
         
         # Act
         result = self.project_service.delete_project(project_name)
@@ -257,14 +316,13 @@ class TestProjectService(unittest.TestCase):
         self.assertIn('supprimé avec succès', result['message'])
         
         # Vérifier que le repository a été appelé avec le bon ID
-        self.mock_project_repository.delete_project.assert_called_once_with(project_id)
+        self.mock_project_repository.delete_project_cascade.assert_called_once_with(project_id)
 
     def test_delete_project_not_found(self):
         """Test de suppression d'un projet inexistant"""
         # Arrange
         project_name = "Projet Inexistant"
         self.mock_project_repository.get_all_projects.return_value = []  # Aucun projet
-        self.project_service._load_projects()  # Recharger avec liste vide
         
         # Act
         result = self.project_service.delete_project(project_name)
@@ -275,7 +333,7 @@ class TestProjectService(unittest.TestCase):
         self.assertIn(project_name, result['error'])
         
         # Vérifier que le repository n'a pas été appelé
-        self.mock_project_repository.delete_project.assert_not_called()
+        self.mock_project_repository.delete_project_cascade.assert_not_called()
 
     def test_delete_project_repository_error(self):
         """Test de suppression avec erreur dans le repository"""
@@ -289,8 +347,9 @@ class TestProjectService(unittest.TestCase):
         mock_project.units = []
         
         self.mock_project_repository.get_all_projects.return_value = [mock_project]
-        self.mock_project_repository.delete_project.return_value = False  # Échec
-        self.project_service._load_projects()  # Charger le projet
+        self.mock_project_repository.delete_project_cascade.return_value = {
+            'deleted': False, 'project_name': project_name, 'total_units': 0
+        }  # Échec
         
         # Act
         result = self.project_service.delete_project(project_name)
@@ -335,6 +394,424 @@ class TestProjectService(unittest.TestCase):
             self.assertEqual(unit.status.value, "available")  # Statut disponible
             self.assertEqual(unit.estimated_price, 0)  # Pas de prix automatique (estimated_price, pas price)
 
+    def test_create_project_with_units_refreshes_cached_projects(self):
+        """Test que la création invalide la liste en cache, relue une seule fois ensuite"""
+        # Arrange
+        self.mock_project_repository.save_project.return_value = "new-project-id"
+        self.project_service.get_all_projects()  # Premier accès : chargement paresseux
+        self.mock_project_repository.get_all_projects.reset_mock()
+        
+        # Act
+        result = self.project_service.create_project_with_units(self.valid_project_data)
+        created_project = result['project']
+        self.mock_project_repository.get_all_projects.return_value = [created_project]
+        self.mock_project_repository.get_project_by_id.return_value = created_project
+        
+        # Assert
+        self.assertTrue(result['success'])
+        self.mock_project_repository.get_all_projects.assert_not_called()
+        
+        lookup = self.project_service.get_project_by_id(created_project.project_id)
+        self.assertTrue(lookup['success'])
+        self.assertEqual(lookup['project'].project_id, created_project.project_id)
+        
+        # Le nom est désormais réservé (insensible à la casse)
+        duplicate_data = self.valid_project_data.copy()
+        duplicate_data['name'] = self.valid_project_data['name'].upper()
+        duplicate_result = self.project_service.create_project_with_units(duplicate_data)
+        self.assertFalse(duplicate_result['success'])
+        self.mock_project_repository.get_all_projects.assert_called_once()
+
+    def test_transfer_multiple_units_uses_single_bulk_update(self):
+        """Test que les transferts multiples sont persistés en un seul appel groupé"""
+        # Arrange
+        project = Project(**self.valid_project_data)
+        project.generate_units()
+        self.mock_project_repository.get_project_by_id.return_value = project
+        transfers = [
+            {'unit_number': project.units[0].unit_number, 'new_owner': 'Jean Dupont'},
+            {'unit_number': project.units[1].unit_number, 'new_owner': 'Marie Tremblay'},
+            {'unit_number': 'Z-999', 'new_owner': 'Inconnu'}
+        ]
+        
+        # Act
+        result = self.project_service.transfer_multiple_units(project.project_id, transfers)
+        
+        # Assert
+        self.assertTrue(result['success'])
+        self.assertEqual(len(result['successful_transfers']), 2)
+        self.assertEqual(len(result['failed_transfers']), 1)
+        self.mock_project_repository.save_project.assert_not_called()
+        self.mock_project_repository.transfer_units_bulk.assert_called_once()
+        
+        bulk_project_id, bulk_rows = self.mock_project_repository.transfer_units_bulk.call_args[0]
+        self.assertEqual(bulk_project_id, project.project_id)
+        self.assertEqual(bulk_rows, [
+            (project.units[0].unit_number, 'Jean Dupont', 'available'),
+            (project.units[1].unit_number, 'Marie Tremblay', 'available')
+        ])
+
+    def test_validate_creation_payload_reports_first_failing_rule(self):
+        """Test que la validation par table retourne le message de la première règle en échec"""
+        cases = [
+            ({'name': ''}, "Le nom du projet est obligatoire"),
+            ({'name': 'AB'}, "Le nom du projet doit contenir au moins 3 caractères"),
+            ({'building_area': 'abc'}, "La superficie du bâtiment doit être un nombre valide"),
+            ({'construction_year': 1800}, "L'année de construction doit être entre 1900 et 2030"),
+            ({'unit_count': 501}, "Le nombre d'unités doit être entre 1 et 500"),
+        ]
+        for overrides, expected_error in cases:
+            with self.subTest(overrides=overrides):
+                data = {**self.valid_project_data, **overrides}
+                result = self.project_service._validate_creation_payload(data)
+                self.assertFalse(result['valid'])
+                self.assertEqual(result['error'], expected_error)
+        
+        self.assertEqual(self.project_service._validate_creation_payload(self.valid_project_data), {'valid': True})
+
+    def test_project_name_uniqueness_uses_casefold(self):
+        """Test que l'unicité des noms utilise casefold (ex: ß et SS)"""
+        # Arrange
+        data = {**self.valid_project_data, 'name': 'Résidence Straße'}
+        project = Project(**data)
+        self.project_service._projects = [project]
+        
+        # Act & Assert
+        self.assertTrue(self.project_service._is_project_name_taken('RÉSIDENCE STRASSE'))
+        self.assertFalse(self.project_service._is_project_name_taken('Résidence Strase'))
+
+    def test_project_service_has_no_simulated_latency(self):
+        """Test de non-régression : aucune pause simulée dans le service des projets"""
+        # Arrange
+        self.mock_project_repository.save_project.return_value = "new-project-id"
+        
+        # Act
+        with patch('time.sleep') as mock_sleep, patch('asyncio.sleep') as mock_async_sleep:
+            result = self.project_service.create_project_with_units(self.valid_project_data)
+        
+        # Assert
+        self.assertTrue(result['success'])
+        self.assertFalse(hasattr(ProjectService, '_simulate_async_save'))
+        mock_sleep.assert_not_called()
+        mock_async_sleep.assert_not_called()
+
+    def test_projects_are_loaded_lazily_on_first_access(self):
+        """Test que le service ne charge les projets qu'au premier accès"""
+        # Arrange
+        repository = Mock()
+        repository.get_all_projects.return_value = []
+        
+        # Act
+        service = ProjectService(project_repository=repository)
+        
+        # Assert
+        repository.get_all_projects.assert_not_called()
+        self.assertEqual(service.get_all_projects()['count'], 0)
+        repository.get_all_projects.assert_called_once()
+
+    def test_get_all_projects_summary_uses_repository_aggregates(self):
+        """Test que le résumé global est calculé à partir des agrégats du repository"""
+        # Arrange
+        self.mock_project_repository.get_projects_summary.return_value = [
+            {'project_id': 'p1', 'name': 'A', 'total_units': 10, 'occupied_units': 5, 'available_units': 5},
+            {'project_id': 'p2', 'name': 'B', 'total_units': 0, 'occupied_units': 0, 'available_units': 0}
+        ]
+        
+        # Act
+        result = self.project_service.get_all_projects_summary()
+        
+        # Assert
+        self.assertTrue(result['success'])
+        self.assertEqual(result['total_projects'], 2)
+        self.assertEqual(result['total_units'], 10)
+        self.assertEqual(result['total_occupied'], 5)
+        self.assertEqual(result['overall_occupancy'], 50.0)
+        self.assertEqual([p['occupancy_rate'] for p in result['projects']], [50.0, 0.0])
+
+    def test_project_reads_are_cached_until_write_invalidates(self):
+        """Test que les lectures utilisent le cache et qu'une écriture invalide ses étiquettes"""
+        # Arrange
+        project = Project(**self.valid_project_data)
+        project.generate_units()
+        self.mock_project_repository.get_all_projects.return_value = [project]
+        self.mock_project_repository.get_all_projects.reset_mock()
+        
+        # Act - lectures répétées
+        self.project_service.get_project_by_name(project.name)
+        self.project_service.get_project_statistics(project.project_id)
+        self.project_service.get_project_by_name(project.name)
+        
+        # Assert - une seule lecture en base
+        self.assertEqual(self.mock_project_repository.get_all_projects.call_count, 1)
+        
+        # Act - une écriture invalide le cache
+        self.project_service.update_project_units(project.project_id, 20)
+        self.project_service.get_project_by_name(project.name)
+        
+        # Assert
+        self.assertEqual(self.mock_project_repository.get_all_projects.call_count, 2)
+
+    def test_write_by_another_instance_refreshes_projects(self):
+        """Test qu'une écriture d'une autre instance sur la même base rafraîchit les projets lus"""
+        # Arrange - deux services partageant le cache d'une même base
+        self.mock_project_repository.db_path = 'test-project-service-shared.db'
+        TaggedCache.shared(self.mock_project_repository.db_path).clear()
+        reader = ProjectService(project_repository=self.mock_project_repository)
+        writer = ProjectService(project_repository=self.mock_project_repository)
+        project = Project(**self.valid_project_data)
+        project.generate_units()
+        self.mock_project_repository.get_all_projects.return_value = [project]
+        reader.get_all_projects()
+        
+        # Act - transfert par l'autre instance, la base renvoie ensuite l'état persisté
+        persisted = Project(**self.valid_project_data)
+        persisted.project_id = project.project_id
+        self.mock_project_repository.get_all_projects.return_value = [persisted]
+        result = writer.transfer_unit_ownership(project.project_id, project.units[0].unit_number, 'Jean Dupont')
+        
+        # Assert
+        self.assertTrue(result['success'])
+        self.assertEqual(reader.get_all_projects()['projects'], [persisted])
+        self.assertEqual(reader.get_project_by_id(project.project_id)['project'].project_id, persisted.project_id)
+
+    def test_unsaved_changes_do_not_leak_to_other_instances(self):
+        """Test que les projets retournés sont des copies : une modification non sauvegardée reste locale"""
+        # Arrange - deux services partageant le cache d'une même base
+        self.mock_project_repository.db_path = 'test-project-service-snapshots.db'
+        TaggedCache.shared(self.mock_project_repository.db_path).clear()
+        first = ProjectService(project_repository=self.mock_project_repository)
+        second = ProjectService(project_repository=self.mock_project_repository)
+        project = Project(**self.valid_project_data)
+        project.generate_units()
+        self.mock_project_repository.get_all_projects.return_value = [project]
+        
+        # Act - modifications en place sans sauvegarde
+        projects = first.get_all_projects()['projects']
+        projects[0].units[0].owner_name = 'Modification non sauvegardée'
+        projects.clear()
+        
+        # Assert
+        self.assertEqual(second.get_all_projects()['count'], 1)
+        unit = second.get_project_by_id(project.project_id)['project'].units[0]
+        self.assertNotEqual(unit.owner_name, 'Modification non sauvegardée')
+
+    def test_write_invalidates_tags_reported_by_repository(self):
+        """Test que le service invalide les étiquettes signalées par le SaveResult du repository"""
+        # Arrange
+        project = Project(**self.valid_project_data)
+        project.generate_units()
+        self.mock_project_repository.get_project_by_id.return_value = project
+        self.mock_project_repository.save_project.return_value = SaveResult(project.project_id, frozenset({'reported'}))
+        cache = self.project_service._cache
+        cache.set('reported-entry', 'stale', {'reported'})
+        cache.set('untouched-entry', 'warm', {'other'})
+        
+        # Act
+        self.project_service.update_project_units(project.project_id, 20)
+        
+        # Assert
+        self.assertIsNone(cache.get('reported-entry'))
+        self.assertEqual(cache.get('untouched-entry'), 'warm')
+
+    def test_write_without_save_result_invalidates_project_tags(self):
+        """Test qu'un résultat sans étiquettes invalide prudemment les étiquettes du projet"""
+        # Arrange
+        project = Project(**self.valid_project_data)
+        project.generate_units()
+        self.mock_project_repository.get_project_by_id.return_value = project
+        self.mock_project_repository.save_project.return_value = True
+        cache = self.project_service._cache
+        cache.set('project-entry', 'stale', {project.project_id})
+        cache.set('catalog-entry', 'stale', {'all_projects'})
+        
+        # Act
+        self.project_service.update_project_units(project.project_id, 20)
+        
+        # Assert
+        self.assertIsNone(cache.get('project-entry'))
+        self.assertIsNone(cache.get('catalog-entry'))
+
+    def test_get_project_by_id_miss_does_not_reload_catalog(self):
+        """Test qu'un ID absent de la mémoire est lu seul, sans recharger tous les projets"""
+        # Arrange
+        project = Project(**self.valid_project_data)
+        self.mock_project_repository.get_all_projects.return_value = []
+        self.mock_project_repository.get_project_by_id.return_value = project
+        self.project_service.get_all_projects()
+        self.mock_project_repository.get_all_projects.reset_mock()
+        
+        # Act
+        first = self.project_service.get_project_by_id(project.project_id)
+        second = self.project_service.get_project_by_id(project.project_id)
+        
+        # Assert
+        self.assertEqual(first['project'].project_id, project.project_id)
+        self.assertEqual(second['project'].project_id, project.project_id)
+        self.mock_project_repository.get_all_projects.assert_not_called()
+        self.mock_project_repository.get_project_by_id.assert_called_once_with(project.project_id)
+
+    def test_update_unit_defers_project_reload_until_next_read(self):
+        """Test que la mise à jour d'une unité ne recharge les projets qu'au prochain accès"""
+        # Arrange
+        self.mock_project_repository.get_all_projects.return_value = []
+        self.mock_project_repository.update_unit.return_value = True
+        self.project_service.get_all_projects()
+        self.mock_project_repository.get_all_projects.reset_mock()
+        
+        # Act
+        result = self.project_service.update_unit_by_id(1, {'area': 850.0})
+        
+        # Assert
+        self.assertTrue(result['success'])
+        self.mock_project_repository.get_all_projects.assert_not_called()
+        self.project_service.get_all_projects()
+        self.mock_project_repository.get_all_projects.assert_called_once()
+
+    def test_single_project_lookups_do_not_load_catalog(self):
+        """Test qu'à froid, la lecture et la mise à jour d'un projet ne chargent que ce projet"""
+        # Arrange
+        project = Project(**self.valid_project_data)
+        self.mock_project_repository.get_project_by_id.return_value = project
+        
+        # Act
+        lookup = self.project_service.get_project_by_id(project.project_id)
+        update = self.project_service.update_project(project)
+        
+        # Assert
+        self.assertTrue(lookup['success'])
+        self.assertTrue(update['success'])
+        self.mock_project_repository.get_all_projects.assert_not_called()
+
+    def test_update_unit_invalidates_only_its_project(self):
+        """Test que la mise à jour d'une unité n'invalide que la liste et le projet de l'unité"""
+        # Arrange
+        cache = self.project_service._cache
+        cache.set('project:p1', 'p1', {'p1'})
+        cache.set('project:p2', 'p2', {'p2'})
+        self.mock_project_repository.update_unit.return_value = SaveResult.for_project('p1', 1)
+        
+        # Act
+        result = self.project_service.update_unit_by_id(1, {'area': 850.0})
+        
+        # Assert
+        self.assertTrue(result['success'])
+        self.assertIsNone(cache.get('project:p1'))
+        self.assertEqual(cache.get('project:p2'), 'p2')
+
+    def test_cached_projects_expire_after_ttl(self):
+        """Test que les projets en cache expirent : les écritures d'un autre processus deviennent visibles"""
+        # Arrange
+        self.project_service.get_all_projects()
+        self.mock_project_repository.get_all_projects.reset_mock()
+        expired = time.monotonic() + PROJECT_CACHE_TTL_SECONDS + 1
+        
+        # Act
+        with patch('src.infrastructure.cache_manager.time.monotonic', return_value=expired):
+            self.project_service.get_all_projects()
+        
+        # Assert
+        self.mock_project_repository.get_all_projects.assert_called_once()
+
+    def test_delete_project_by_id_refreshes_cached_indexes(self):
+        """Test que la suppression invalide la liste et les index en cache"""
+        # Arrange
+        kept = Project(**self.valid_project_data)
+        deleted_data = self.valid_project_data.copy()
+        deleted_data['name'] = 'Tour Horizon'
+        deleted = Project(**deleted_data)
+        self.mock_project_repository.get_all_projects.return_value = [kept, deleted]
+        self.mock_project_repository.delete_project_cascade.return_value = {
+            'deleted': True, 'project_name': 'Tour Horizon', 'total_units': 0
+        }
+        self.project_service.get_all_projects()
+        self.mock_project_repository.get_all_projects.return_value = [kept]
+        self.mock_project_repository.get_all_projects.reset_mock()
+        
+        # Act
+        result = self.project_service.delete_project_by_id(deleted.project_id)
+        
+        # Assert
+        self.assertTrue(result['success'])
+        self.assertEqual(self.project_service._projects, [kept])
+        self.assertNotIn(deleted.project_id, self.project_service._projects_by_id)
+        self.assertFalse(self.project_service._is_project_name_taken('Tour Horizon'))
+        self.assertEqual(self.project_service.get_project_by_id(kept.project_id)['project'].project_id, kept.project_id)
+        self.mock_project_repository.get_all_projects.assert_called_once()
+
+    def test_project_statistics_are_cached_until_project_write(self):
+        """Test que les statistiques sont agrégées une fois puis invalidées par une écriture du projet"""
+        # Arrange
+        project = Project(**self.valid_project_data)
+        project.generate_units()
+        self.mock_project_repository.get_project_by_id.return_value = project
+        self.mock_project_repository.get_status_counts.return_value = [
+            (UnitStatus.AVAILABLE, 'RESIDENTIAL', False, 15, 0.0)
+        ]
+        
+        # Act
+        first = self.project_service.get_project_statistics(project.project_id)
+        first['statistics']['units_by_type']['RESIDENTIAL'] = -1
+        second = self.project_service.get_project_statistics_by_id(project.project_id)
+        self.project_service.update_project_units(project.project_id, 20)
+        self.project_service.get_project_statistics_by_id(project.project_id)
+        
+        # Assert
+        self.assertEqual(second['statistics']['units_by_type'], {'RESIDENTIAL': 15})
+        self.assertEqual(self.mock_project_repository.get_status_counts.call_count, 2)
+
+    def test_delete_project_by_name_resolves_name_once(self):
+        """Test que la suppression par nom résout le nom par index puis supprime sans relecture"""
+        # Arrange
+        project = Project(**self.valid_project_data)
+        self.mock_project_repository.get_all_projects.return_value = [project]
+        self.mock_project_repository.delete_project_cascade.return_value = {
+            'deleted': True, 'project_name': project.name, 'total_units': 0
+        }
+        
+        # Act
+        result = self.project_service.delete_project(project.name)
+        
+        # Assert
+        self.assertTrue(result['success'])
+        self.mock_project_repository.get_all_projects.assert_called_once()
+        self.mock_project_repository.get_project_by_id.assert_not_called()
+        self.mock_project_repository.delete_project_cascade.assert_called_once_with(project.project_id)
+
+    def test_delete_project_by_id_unknown_project(self):
+        """Test que la suppression d'un ID inconnu est signalée sans pré-chargement des projets"""
+        # Arrange
+        self.mock_project_repository.delete_project_cascade.return_value = {
+            'deleted': False, 'project_name': None, 'total_units': 0
+        }
+        
+        # Act
+        result = self.project_service.delete_project_by_id('inconnu')
+        
+        # Assert
+        self.assertFalse(result['success'])
+        self.assertIn('non trouvé', result['error'])
+        self.mock_project_repository.get_all_projects.assert_not_called()
+        self.mock_project_repository.get_project_by_id.assert_not_called()
+
+    def test_update_project_units_fetches_only_target_project(self):
+        """Test que la mise à jour des unités charge uniquement le projet visé"""
+        # Arrange
+        project = Project(**self.valid_project_data)
+        project.generate_units()
+        self.mock_project_repository.get_project_by_id.return_value = project
+        
+        # Act
+        result = self.project_service.update_project_units(project.project_id, 20)
+        
+        # Assert
+        self.assertTrue(result['success'])
+        saved_project = self.mock_project_repository.save_project.call_args[0][0]
+        self.assertEqual(saved_project.project_id, project.project_id)
+        self.assertEqual(len(saved_project.units), 20)
+        self.mock_project_repository.get_project_by_id.assert_called_once_with(project.project_id)
+        self.mock_project_repository.get_all_projects.assert_not_called()
+        self.mock_project_repository.save_project.assert_called_once()
+
 
 if __name__ == '__main__':
     unittest.main()
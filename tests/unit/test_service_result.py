@@ -0,0 +1,60 @@
+"""
+Tests unitaires pour le décorateur service_result
+"""
+
+import unittest
+
+from src.application.services.service_result import failure_result, service_result
+
+
+class _Service:
+    """Service minimal pour exercer le décorateur."""
+
+    @service_result("la suppression du projet", "Erreur inattendue lors de la suppression")
+    def delete(self, fail: bool):
+        """Supprime quelque chose."""
+        if fail:
+            raise RuntimeError("disque plein")
+        return {'success': True}
+
+    @service_result("la lecture d'une configuration", default=None)
+    def read(self):
+        """Lit quelque chose."""
+        raise RuntimeError("base verrouillée")
+
+
+class TestServiceResult(unittest.TestCase):
+    """Tests du décorateur de résultat de service."""
+
+    def test_returns_method_result_on_success(self):
+        """Le résultat de la méthode est retourné tel quel sans erreur."""
+        self.assertEqual(_Service().delete(False), {'success': True})
+
+    def test_converts_exception_to_failure_dict(self):
+        """Une exception devient un dictionnaire d'échec préfixé par le message d'erreur."""
+        result = _Service().delete(True)
+
+        self.assertEqual(result, {
+            'success': False,
+            'error': 'Erreur inattendue lors de la suppression: disque plein'
+        })
+
+    def test_returns_default_value_when_given(self):
+        """Une valeur par défaut remplace le dictionnaire d'échec."""
+        with self.assertLogs(__name__, level='ERROR') as logs:
+            self.assertIsNone(_Service().read())
+
+        self.assertIn("Erreur lors de la lecture d'une configuration: base verrouillée", logs.output[0])
+
+    def test_failure_result_shape(self):
+        """La fabrique retourne le dictionnaire d'échec standard."""
+        self.assertEqual(failure_result('Projet introuvable'), {'success': False, 'error': 'Projet introuvable'})
+
+    def test_preserves_method_metadata(self):
+        """Le nom et la docstring de la méthode décorée sont conservés."""
+        self.assertEqual(_Service.delete.__name__, 'delete')
+        self.assertEqual(_Service.delete.__doc__, "Supprime quelque chose.")
+
+
+if __name__ == '__main__':
+    unittest.main()
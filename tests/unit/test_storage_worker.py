@@ -0,0 +1,62 @@
+"""
+Tests unitaires pour le thread d'écriture StorageWorker
+"""
+import unittest
+import threading
+from unittest.mock import Mock
+
+from src.adapters.storage_worker import StorageWorker
+
+
+class TestStorageWorker(unittest.TestCase):
+    """Tests unitaires pour StorageWorker"""
+
+    def setUp(self):
+        """Démarre un worker dédié pour chaque test"""
+        self.worker = StorageWorker()
+        self.worker.start()
+
+    def test_submit_returns_operation_result(self):
+        """Test que la future porte le résultat de l'écriture"""
+        future = self.worker.submit(lambda a, b: a + b, 2, 3)
+
+        self.assertEqual(future.result(timeout=5), 5)
+
+    def test_submit_propagates_operation_exception(self):
+        """Test que l'exception de l'écriture est relancée par future.result()"""
+        def failing_write():
+            raise ValueError("écriture impossible")
+
+        future = self.worker.submit(failing_write)
+
+        with self.assertRaises(ValueError):
+            future.result(timeout=5)
+
+    def test_consecutive_saves_of_same_project_are_coalesced(self):
+        """Test que des sauvegardes consécutives du même projet ne sont exécutées qu'une fois"""
+        # Arrange - bloquer le worker pour accumuler les sauvegardes dans la file
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocking_write():
+            started.set()
+            release.wait(timeout=5)
+
+        repository = Mock()
+        repository.save_project.return_value = 'project-id'
+        project = Mock()
+
+        self.worker.submit(blocking_write)
+        started.wait(timeout=5)
+
+        # Act
+        futures = [self.worker.submit_save(repository, project) for _ in range(3)]
+        release.set()
+
+        # Assert
+        self.assertEqual([f.result(timeout=5) for f in futures], ['project-id'] * 3)
+        repository.save_project.assert_called_once_with(project)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,10 +9,15 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 import sqlite3
 import json
+import os
+import shutil
+import tempfile
 from pathlib import Path
 
 from src.adapters.system_config_repository_sqlite import SystemConfigRepositorySQLite, SystemConfigRepositorySQLiteError
 
+SCHEMA_PATH = Path(__file__).parent.parent.parent / "data" / "migrations" / "001_recreate_schemas_condos1db.sql"
+
 class TestSystemConfigRepositorySQLite(unittest.TestCase):
     """Tests unitaires pour le repository de configuration système."""
 
@@ -195,6 +200,25 @@ class TestSystemConfigRepositorySQLite(unittest.TestCase):
             self.assertTrue(result)
             mock_set.assert_called_once_with('test_flag', 'false', 'boolean', 'Description test')
 
+    def test_set_boolean_configs_upserts_all_keys_in_one_transaction(self):
+        """Test de mise à jour groupée de configurations booléennes sur une base réelle."""
+        # ARRANGE
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        self.repository.db_path = os.path.join(temp_dir, 'test_config.db')
+        with sqlite3.connect(self.repository.db_path) as conn:
+            conn.executescript(SCHEMA_PATH.read_text(encoding='utf-8'))
+        self.repository.set_config_value('maintenance_mode', 'true', 'boolean', 'Mode maintenance')
+        
+        # ACT
+        result = self.repository.set_boolean_configs({'maintenance_mode': False, 'admin_password_changed': True})
+        
+        # ASSERT
+        self.assertTrue(result)
+        self.assertFalse(self.repository.get_boolean_config('maintenance_mode', True))
+        self.assertTrue(self.repository.get_boolean_config('admin_password_changed'))
+        self.assertEqual(self.repository.get_all_configs()[1]['description'], 'Mode maintenance')
+
     @patch('src.adapters.system_config_repository_sqlite.sqlite3.connect')
     def test_delete_config_existing_key(self, mock_connect):
         """Test de suppression d'une configuration existante."""
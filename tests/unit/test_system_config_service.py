@@ -301,6 +301,86 @@ class TestSystemConfigService(unittest.TestCase):
         }
         self.assertEqual(result, expected)
 
+    def test_is_admin_password_changed_is_memoized(self):
+        """Test que le statut admin est lu une seule fois en base pour des appels répétés."""
+        # ARRANGE
+        self.mock_repository.get_boolean_config.return_value = False
+        
+        # ACT
+        self.service.validate_system_security()
+        self.service.get_system_setup_status()
+        
+        # ASSERT
+        self.mock_repository.get_boolean_config.assert_called_once_with('admin_password_changed', False)
+
+    def test_mark_admin_password_changed_updates_memoized_status(self):
+        """Test que le statut mémorisé suit les écritures réussies."""
+        # ARRANGE
+        self.mock_repository.get_boolean_config.return_value = False
+        self.mock_repository.set_boolean_config.return_value = True
+        self.assertFalse(self.service.is_admin_password_changed())
+        
+        # ACT
+        self.service.mark_admin_password_changed()
+        
+        # ASSERT
+        self.assertTrue(self.service.is_admin_password_changed())
+        self.mock_repository.get_boolean_config.assert_called_once()
+
+    def test_repository_error_is_not_memoized(self):
+        """Test qu'une erreur de lecture n'est pas mémorisée."""
+        # ARRANGE
+        self.mock_repository.get_boolean_config.side_effect = [Exception("Database error"), True]
+        
+        # ACT & ASSERT
+        self.assertFalse(self.service.is_admin_password_changed())
+        self.assertTrue(self.service.is_admin_password_changed())
+
+    def test_delete_admin_password_config_forgets_memoized_status(self):
+        """Test que la suppression de la configuration force une relecture."""
+        # ARRANGE
+        self.mock_repository.get_boolean_config.side_effect = [True, False]
+        self.mock_repository.delete_config.return_value = True
+        self.service.is_admin_password_changed()
+        
+        # ACT
+        self.service.delete_config('admin_password_changed')
+        
+        # ASSERT
+        self.assertFalse(self.service.is_admin_password_changed())
+
+    def test_get_status_bulk_reads_all_flags_in_one_query(self):
+        """Test que les statuts booléens sont lus en une requête et amorcent le statut admin."""
+        # ARRANGE
+        self.mock_repository.get_all_configs.return_value = [
+            {'config_key': 'admin_password_changed', 'config_value': 'true'},
+            {'config_key': 'maintenance_mode', 'config_value': '0'}
+        ]
+        
+        # ACT
+        result = self.service.get_status_bulk()
+        
+        # ASSERT
+        self.assertEqual(result, {'admin_password_changed': True, 'maintenance_mode': False})
+        self.assertTrue(self.service.is_admin_password_changed())
+        self.mock_repository.get_all_configs.assert_called_once()
+        self.mock_repository.get_boolean_config.assert_not_called()
+
+    def test_set_boolean_configs_writes_once_and_updates_memoized_status(self):
+        """Test que la mise à jour groupée délègue en un appel et met à jour le statut admin."""
+        # ARRANGE
+        self.mock_repository.set_boolean_configs.return_value = True
+        configs = {'admin_password_changed': True, 'maintenance_mode': False}
+        
+        # ACT
+        result = self.service.set_boolean_configs(configs)
+        
+        # ASSERT
+        self.assertTrue(result)
+        self.mock_repository.set_boolean_configs.assert_called_once_with(configs, None)
+        self.assertTrue(self.service.is_admin_password_changed())
+        self.mock_repository.get_boolean_config.assert_not_called()
+
     def test_service_initialization_with_default_repository(self):
         """Test d'initialisation du service avec repository par défaut."""
         # ACT & ASSERT - Ne doit pas lever d'exception
@@ -222,7 +222,39 @@ class TestUnitEntity(unittest.TestCase):
         self.assertEqual(unit.area, 750.0)
         self.assertEqual(unit.unit_type, UnitType.COMMERCIAL)
         self.assertEqual(unit.status, UnitStatus.AVAILABLE)
+
+    def test_from_dict_sans_validation(self):
+        """Les données de confiance sont chargées sans revalidation, à l'identique"""
+        # Arrange
+        unit_dict = {**self.valid_unit_data, 'area': -1.0}
+
+        # Act
+        trusted = Unit.from_dict(unit_dict, validate=False)
+
+        # Assert
+        self.assertEqual(trusted.area, -1.0)
+        self.assertIsNotNone(trusted.created_at)
+        with self.assertRaises(ValueError):
+            Unit.from_dict(unit_dict)
+
+        validated = Unit(**self.valid_unit_data)
+        trusted = Unit.from_dict(validated.to_dict(), validate=False)
+        self.assertEqual(trusted, validated)
     
+    def test_transfer_ownership_horodatage_du_lot(self):
+        """Un transfert groupé réutilise l'horodatage fourni par l'appelant"""
+        # Arrange
+        unit = Unit(**self.valid_unit_data)
+        now = datetime(2024, 5, 1, 12, 0, 0)
+
+        # Act
+        unit.transfer_ownership('Marie Tremblay', now=now)
+
+        # Assert
+        self.assertEqual(unit.owner_name, 'Marie Tremblay')
+        self.assertEqual(unit.updated_at, now)
+        self.assertEqual(unit.purchase_date, now)
+
     def test_equality(self):
         """Test d'égalité entre unités"""
         # Arrange
@@ -250,6 +282,19 @@ class TestUnitEntity(unittest.TestCase):
         self.assertIn('101', str_repr)
         self.assertIn('Jean Dupont', str_repr)
 
+    def test_unit_utilise_slots(self):
+        """Les champs de l'unité sont des slots et le __dict__ n'est pas alloué d'office"""
+        # Arrange
+        unit = Unit(**self.valid_unit_data)
+        
+        # Act
+        unit.transfer_ownership('Marie Tremblay')
+        
+        # Assert
+        self.assertIn('area', Unit.__slots__)
+        self.assertIn('purchase_date', Unit.__slots__)
+        self.assertEqual(unit.__dict__, {})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -37,9 +37,9 @@ class TestUserDeletionServiceMocked:
         # Act - Méthode avec repository complètement mocké
         result = self.user_service.delete_user_by_username(username)
         
-        # Assert - Validation sans interaction avec base réelle
+        # Assert - Validation sans interaction avec base réelle, sans lecture préalable
         assert result is True
-        self.mock_repository.get_user_by_username.assert_called_once_with(username)
+        self.mock_repository.get_user_by_username.assert_not_called()
         self.mock_repository.delete_user.assert_called_once_with(username)
     
     def test_delete_user_by_username_not_found(self):
@@ -47,15 +47,16 @@ class TestUserDeletionServiceMocked:
         # Arrange
         username = "nonexistent_user"
         self.mock_repository.get_user_by_username = AsyncMock(return_value=None)
+        self.mock_repository.delete_user = AsyncMock(return_value=False)  # Aucune ligne supprimée
         
         # Act - Test isolé sans base de données
         result = self.user_service.delete_user_by_username(username)
         
         # Assert - Validation que l'utilisateur inexistant retourne False
         assert result is False
-        self.mock_repository.get_user_by_username.assert_called_once_with(username)
-        # delete_user ne doit PAS être appelé si l'utilisateur n'existe pas
-        self.mock_repository.delete_user.assert_not_called()
+        # Le DELETE seul détermine l'existence : pas de lecture préalable
+        self.mock_repository.delete_user.assert_called_once_with(username)
+        self.mock_repository.get_user_by_username.assert_not_called()
     
     def test_delete_user_handles_database_errors(self):
         """Test de gestion des erreurs de base de données - EXCEPTION MOCKÉE"""
@@ -72,6 +73,25 @@ class TestUserDeletionServiceMocked:
         assert result is False
         self.mock_repository.get_user_by_username.assert_called_once_with(username)
     
+    def test_user_reads_are_cached_until_deletion(self):
+        """Test que les lectures répétées sont servies par le cache jusqu'à la suppression - REPOSITORY MOCKÉ"""
+        # Arrange
+        username = "test_user"
+        mock_user = Mock()
+        self.mock_repository.get_user_by_username = AsyncMock(side_effect=[mock_user, None])
+        self.mock_repository.delete_user = AsyncMock(return_value=True)
+        
+        # Act - Deux lectures, une suppression, puis une lecture
+        first = self.user_service.get_user_by_username(username)
+        second = self.user_service.get_user_by_username(username)
+        self.user_service.delete_user_by_username(username)
+        after_delete = self.user_service.get_user_by_username(username)
+        
+        # Assert - Une seule lecture avant suppression, puis relecture après invalidation
+        assert first is second is mock_user
+        assert after_delete is None
+        assert self.mock_repository.get_user_by_username.await_count == 2
+    
     def test_cannot_delete_self(self):
         """Test d'empêchement de l'auto-suppression - VALIDATION MÉTIER MOCKÉE"""
         # Arrange
@@ -121,3 +121,112 @@ class TestUserDetailsConsultationServiceMocked:
         # Assert
         self.mock_repository.get_user_by_username.assert_called_once_with(username)
         logger.debug("Test réussi: repository appelé avec le bon paramètre")
+    
+    def test_get_user_details_for_api_bulk_uses_single_repository_call(self):
+        """Test que les détails API groupés proviennent d'une seule lecture, dans l'ordre demandé."""
+        # Arrange
+        resident = User(
+            username="resident1",
+            email="resident1@condos.com",
+            password_hash="hash123",
+            full_name="Jean Dupont",
+            role=UserRole.RESIDENT,
+            condo_unit="A-101"
+        )
+        self.mock_repository.get_users_by_usernames = AsyncMock(return_value=[resident])
+        
+        # Act
+        results = self.user_service.get_user_details_for_api_bulk(["inconnu", "resident1"])
+        
+        # Assert
+        self.mock_repository.get_users_by_usernames.assert_awaited_once_with(["inconnu", "resident1"])
+        self.mock_repository.get_user_by_username.assert_not_called()
+        assert [r['found'] for r in results] == [False, True]
+        assert results[0]['error'] == 'Utilisateur non trouvé'
+        assert results[1] == self.user_service._format_user_for_api(resident)
+        logger.debug("Test réussi: détails API groupés en une requête")
+
+    def test_get_users_by_usernames_indexes_found_users(self):
+        """Test que la lecture groupée retourne les utilisateurs trouvés indexés par nom."""
+        # Arrange
+        resident = User(
+            username="resident1",
+            email="resident1@condos.com",
+            password_hash="hash123",
+            full_name="Jean Dupont",
+            role=UserRole.RESIDENT
+        )
+        self.mock_repository.get_users_by_usernames = AsyncMock(return_value=[resident])
+
+        # Act
+        users = self.user_service.get_users_by_usernames(["resident1", "inconnu"])
+
+        # Assert
+        self.mock_repository.get_users_by_usernames.assert_awaited_once_with(["resident1", "inconnu"])
+        assert users == {"resident1": resident}
+        logger.debug("Test réussi: utilisateurs groupés indexés par nom")
+
+    def test_details_and_api_share_single_lookup(self):
+        """Test que la page de détails et l'API JSON d'un même utilisateur ne lisent la base qu'une fois."""
+        # Arrange
+        resident = User(
+            username="resident1",
+            email="resident1@condos.com",
+            password_hash="hash123",
+            full_name="Jean Dupont",
+            role=UserRole.RESIDENT
+        )
+        self.mock_repository.get_user_by_username.return_value = resident
+
+        # Act
+        details = self.user_service.get_user_details_by_username("resident1")
+        api_data = self.user_service.get_user_details_for_api("resident1")
+
+        # Assert
+        assert details['username'] == api_data['username'] == "resident1"
+        self.mock_repository.get_user_by_username.assert_awaited_once_with("resident1")
+        logger.debug("Test réussi: une seule lecture pour détails et API")
+
+    def test_details_after_web_list_reuse_listed_users(self):
+        """Test que les détails consultés après la liste ne relisent pas la base."""
+        # Arrange
+        resident = User(
+            username="resident1",
+            email="resident1@condos.com",
+            password_hash="hash123",
+            full_name="Jean Dupont",
+            role=UserRole.RESIDENT
+        )
+        self.mock_repository.get_all_users = AsyncMock(return_value=[resident])
+
+        # Act
+        self.user_service.get_users_for_web_display()
+        result = self.user_service.get_user_details_by_username("resident1")
+
+        # Assert
+        assert result['username'] == "resident1"
+        self.mock_repository.get_user_by_username.assert_not_called()
+        logger.debug("Test réussi: détails servis par le préchargement de la liste")
+
+    def test_prefetch_details_reads_only_uncached_users(self):
+        """Test que le préchargement ne lit que les utilisateurs absents du cache."""
+        # Arrange
+        resident = User(
+            username="resident1",
+            email="resident1@condos.com",
+            password_hash="hash123",
+            full_name="Jean Dupont",
+            role=UserRole.RESIDENT
+        )
+        self.mock_repository.get_users_by_usernames = AsyncMock(return_value=[resident])
+
+        # Act
+        self.user_service.prefetch_details(["resident1", "inconnu"])
+        self.user_service.prefetch_details(["resident1"])
+        user = self.user_service.get_user_by_username("resident1")
+
+        # Assert
+        self.mock_repository.get_users_by_usernames.assert_awaited_once_with(["resident1", "inconnu"])
+        self.mock_repository.get_user_by_username.assert_not_called()
+        assert user is resident
+        logger.debug("Test réussi: préchargement groupé des détails")
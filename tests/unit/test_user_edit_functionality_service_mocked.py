@@ -39,8 +39,7 @@ class TestUserEditFunctionalityServiceMocked(unittest.TestCase):
             'password': 'newpassword123'
         }
 
-    @patch('src.application.services.user_service.UserService._run_async_operation')
-    def test_update_user_success_all_fields(self, mock_async_op):
+    def test_update_user_success_all_fields(self):
         """Test mise à jour complète d'un utilisateur avec succès."""
         from src.application.services.user_service import UserService
         from src.domain.entities.user import User, UserRole
@@ -53,14 +52,13 @@ class TestUserEditFunctionalityServiceMocked(unittest.TestCase):
         existing_user.role = UserRole.RESIDENT
         existing_user.condo_unit = '101'
         
-        mock_async_op.side_effect = [
-            existing_user,  # get_user_by_username pour utilisateur existant
-            None,           # get_user_by_username pour nouveau nom (non existant)
-            True            # update_user_by_username
-        ]
+        self.mock_repository.get_user_by_username = AsyncMock(side_effect=[
+            existing_user,  # utilisateur existant
+            None            # nouveau nom (non existant)
+        ])
+        self.mock_repository.update_user_by_username = AsyncMock(return_value=True)
         
-        user_service = UserService()
-        user_service.user_repository = self.mock_repository
+        user_service = UserService(self.mock_repository)
         
         # Act
         result = user_service.update_user_by_username('testuser', self.update_data)
@@ -68,18 +66,19 @@ class TestUserEditFunctionalityServiceMocked(unittest.TestCase):
         # Assert
         self.assertTrue(result['success'])
         self.assertIn('mis à jour avec succès', result['message'])
-        self.assertEqual(mock_async_op.call_count, 3)
+        self.assertEqual(self.mock_repository.get_user_by_username.await_count, 2)
+        self.mock_repository.update_user_by_username.assert_awaited_once()
+        self.assertEqual(self.mock_repository.update_user_by_username.await_args[0][1]['role'], UserRole.ADMIN)
 
-    @patch('src.application.services.user_service.UserService._run_async_operation')
-    def test_update_user_not_found(self, mock_async_op):
+    def test_update_user_not_found(self):
         """Test mise à jour d'un utilisateur inexistant."""
         from src.application.services.user_service import UserService
         
         # Arrange
-        mock_async_op.return_value = None  # Utilisateur non trouvé
+        self.mock_repository.get_user_by_username = AsyncMock(return_value=None)  # Utilisateur non trouvé
+        self.mock_repository.update_user_by_username = AsyncMock()
         
-        user_service = UserService()
-        user_service.user_repository = self.mock_repository
+        user_service = UserService(self.mock_repository)
         
         # Act
         result = user_service.update_user_by_username('nonexistent', self.update_data)
@@ -87,9 +86,9 @@ class TestUserEditFunctionalityServiceMocked(unittest.TestCase):
         # Assert
         self.assertFalse(result['success'])
         self.assertEqual(result['error'], 'Utilisateur non trouvé')
+        self.mock_repository.update_user_by_username.assert_not_awaited()
 
-    @patch('src.application.services.user_service.UserService._run_async_operation')
-    def test_update_user_username_already_exists(self, mock_async_op):
+    def test_update_user_username_already_exists(self):
         """Test mise à jour avec un nouveau nom d'utilisateur déjà existant."""
         from src.application.services.user_service import UserService
         from src.domain.entities.user import User, UserRole
@@ -103,13 +102,12 @@ class TestUserEditFunctionalityServiceMocked(unittest.TestCase):
         existing_new_user = Mock()
         existing_new_user.username = 'testuser_updated'
         
-        mock_async_op.side_effect = [
-            existing_user,      # get_user_by_username pour utilisateur existant
-            existing_new_user   # get_user_by_username pour nouveau nom (existe déjà)
-        ]
+        self.mock_repository.get_user_by_username = AsyncMock(side_effect=[
+            existing_user,      # utilisateur existant
+            existing_new_user   # nouveau nom (existe déjà)
+        ])
         
-        user_service = UserService()
-        user_service.user_repository = self.mock_repository
+        user_service = UserService(self.mock_repository)
         
         # Act
         result = user_service.update_user_by_username('testuser', self.update_data)
@@ -118,8 +116,7 @@ class TestUserEditFunctionalityServiceMocked(unittest.TestCase):
         self.assertFalse(result['success'])
         self.assertIn('existe déjà', result['error'])
 
-    @patch('src.application.services.user_service.UserService._run_async_operation')
-    def test_update_user_without_password(self, mock_async_op):
+    def test_update_user_without_password(self):
         """Test mise à jour sans changer le mot de passe."""
         from src.application.services.user_service import UserService
         from src.domain.entities.user import User, UserRole
@@ -134,23 +131,20 @@ class TestUserEditFunctionalityServiceMocked(unittest.TestCase):
         update_data_no_password = self.update_data.copy()
         del update_data_no_password['password']
         
-        mock_async_op.side_effect = [
-            existing_user,  # get_user_by_username
-            None,           # get_user_by_username pour nouveau nom
-            True            # update_user_by_username
-        ]
+        self.mock_repository.get_user_by_username = AsyncMock(side_effect=[existing_user, None])
+        self.mock_repository.update_user_by_username = AsyncMock(return_value=True)
         
-        user_service = UserService()
-        user_service.user_repository = self.mock_repository
+        user_service = UserService(self.mock_repository)
         
         # Act
         result = user_service.update_user_by_username('testuser', update_data_no_password)
         
         # Assert
         self.assertTrue(result['success'])
+        updated_data = self.mock_repository.update_user_by_username.await_args[0][1]
+        self.assertNotIn('password', updated_data)
 
-    @patch('src.application.services.user_service.UserService._run_async_operation')
-    def test_update_user_validation_error(self, mock_async_op):
+    def test_update_user_validation_error(self):
         """Test mise à jour avec erreur de validation."""
         from src.application.services.user_service import UserService
         from src.domain.entities.user import User, UserRole
@@ -160,14 +154,10 @@ class TestUserEditFunctionalityServiceMocked(unittest.TestCase):
         existing_user.username = 'testuser'
         existing_user.role = UserRole.RESIDENT
         
-        mock_async_op.side_effect = [
-            existing_user,  # get_user_by_username
-            None,           # get_user_by_username pour nouveau nom
-            ValueError("Erreur de validation")  # update_user_by_username
-        ]
+        self.mock_repository.get_user_by_username = AsyncMock(side_effect=[existing_user, None])
+        self.mock_repository.update_user_by_username = AsyncMock(side_effect=ValueError("Erreur de validation"))
         
-        user_service = UserService()
-        user_service.user_repository = self.mock_repository
+        user_service = UserService(self.mock_repository)
         
         # Act
         result = user_service.update_user_by_username('testuser', self.update_data)
@@ -176,8 +166,7 @@ class TestUserEditFunctionalityServiceMocked(unittest.TestCase):
         self.assertFalse(result['success'])
         self.assertIn('Erreur de validation', result['error'])
 
-    @patch('src.application.services.user_service.UserService._run_async_operation')
-    def test_update_user_repository_failure(self, mock_async_op):
+    def test_update_user_repository_failure(self):
         """Test mise à jour avec échec du repository."""
         from src.application.services.user_service import UserService
         from src.domain.entities.user import User, UserRole
@@ -187,14 +176,10 @@ class TestUserEditFunctionalityServiceMocked(unittest.TestCase):
         existing_user.username = 'testuser'
         existing_user.role = UserRole.RESIDENT
         
-        mock_async_op.side_effect = [
-            existing_user,  # get_user_by_username
-            None,           # get_user_by_username pour nouveau nom
-            False           # update_user_by_username (échec)
-        ]
+        self.mock_repository.get_user_by_username = AsyncMock(side_effect=[existing_user, None])
+        self.mock_repository.update_user_by_username = AsyncMock(return_value=False)
         
-        user_service = UserService()
-        user_service.user_repository = self.mock_repository
+        user_service = UserService(self.mock_repository)
         
         # Act
         result = user_service.update_user_by_username('testuser', self.update_data)
@@ -203,6 +188,27 @@ class TestUserEditFunctionalityServiceMocked(unittest.TestCase):
         self.assertFalse(result['success'])
         self.assertEqual(result['error'], 'Échec de la mise à jour')
 
+    def test_update_user_same_username_reads_user_once(self):
+        """Test qu'un nom inchangé ne déclenche qu'une lecture avant la mise à jour."""
+        from src.application.services.user_service import UserService
+        from src.domain.entities.user import UserRole
+        
+        # Arrange
+        existing_user = Mock()
+        existing_user.role = UserRole.RESIDENT
+        self.mock_repository.get_user_by_username = AsyncMock(return_value=existing_user)
+        self.mock_repository.update_user_by_username = AsyncMock(return_value=True)
+        update_data = dict(self.update_data, username='testuser')
+        
+        user_service = UserService(self.mock_repository)
+        
+        # Act
+        result = user_service.update_user_by_username('testuser', update_data)
+        
+        # Assert
+        self.assertTrue(result['success'])
+        self.mock_repository.get_user_by_username.assert_awaited_once_with('testuser')
+
 
 if __name__ == '__main__':
     unittest.main()